@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the LangWatch tracing tests
+
+All tracing tests share one traced workflow per session and flush the
+tracer provider exactly once at teardown instead of once per test.
+"""
+
+import os
+
+import pytest
+
+# Let the batch span processor hold spans until the session-end flush
+# rather than exporting on its own timer while the tests are running
+os.environ.setdefault("OTEL_BSP_SCHEDULE_DELAY", "60000")
+os.environ.setdefault("OTEL_BSP_MAX_QUEUE_SIZE", "8192")
+os.environ.setdefault("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "2048")
+
+
+@pytest.fixture(autouse=True)
+def _langwatch_enabled(monkeypatch):
+    """Undo the unit-test suite's LANGWATCH_DISABLED for the tracing tests"""
+    monkeypatch.delenv("LANGWATCH_DISABLED", raising=False)
+
+
+@pytest.fixture(scope="session")
+def traced_workflow(worker_id):
+    """FinancialAssistantWorkflow with LangWatch tracing enabled, shared per session"""
+    from agno.models.anthropic import Claude
+    from config.settings import Settings
+    from opentelemetry import trace
+    from workflow.financial_assistant import FinancialAssistantWorkflow
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("LANGWATCH_DISABLED", raising=False)
+        mp.setenv(
+            "LANGWATCH_API_KEY",
+            os.getenv("LANGWATCH_API_KEY", "test-key-for-end-to-end-testing"),
+        )
+        workflow = FinancialAssistantWorkflow(
+            llm=Claude(id="claude-sonnet-4-20250514"),
+            settings=Settings(),
+            session_id=f"test-end-to-end-session-{worker_id}",
+        )
+
+        yield workflow
+
+    # Single flush for every span recorded during the session
+    provider = trace.get_tracer_provider()
+    force_flush = getattr(provider, "force_flush", None)
+    if force_flush is not None:
+        force_flush()
@@ -1,98 +1,82 @@
 #!/usr/bin/env python3
 """Test script to validate official LangWatch integration."""
 
-import os
+import logging
 import sys
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+import pytest
 
-# Set up environment
-os.environ["PYTHONPATH"] = str(project_root / "src")
+logger = logging.getLogger(__name__)
 
+
+@pytest.mark.langwatch
 def test_official_langwatch():
     """Test official LangWatch integration."""
-    print("Testing Official LangWatch Integration...")
-    print("-" * 50)
+    logger.debug("Testing Official LangWatch Integration...")
     
     # Test 1: Import check
-    try:
-        import langwatch
-        print("✅ Official LangWatch SDK imported successfully")
-        print(f"   LangWatch version: {getattr(langwatch, '__version__', 'unknown')}")
-    except ImportError as e:
-        print(f"❌ Failed to import LangWatch SDK: {e}")
-        return False
-    
+    import langwatch
+
+    logger.debug("Official LangWatch SDK imported successfully")
+    logger.debug("   LangWatch version: %s", getattr(langwatch, '__version__', 'unknown'))
+
     # Test 2: Settings configuration
-    try:
-        from config.settings import Settings
-        settings = Settings()
-        print("✅ Settings loaded successfully")
-        print(f"   LangWatch configured: {settings.has_langwatch_configured}")
-        if settings.has_langwatch_configured:
-            print(f"   LangWatch endpoint: {settings.langwatch_endpoint}")
-        else:
-            print("   To enable: Set LANGWATCH_API_KEY in env/.env")
-    except Exception as e:
-        print(f"❌ Failed to load settings: {e}")
-        return False
-    
+    from config.settings import Settings
+
+    settings = Settings()
+    logger.debug("Settings loaded successfully")
+    logger.debug("   LangWatch configured: %s", settings.has_langwatch_configured)
+    if settings.has_langwatch_configured:
+        logger.debug("   LangWatch endpoint: %s", settings.langwatch_endpoint)
+    else:
+        logger.debug("   To enable: Set LANGWATCH_API_KEY in env/.env")
+
     # Test 3: Workflow import with official decorators
-    try:
-        from workflow.financial_assistant import FinancialAssistantWorkflow
-        print("✅ FinancialAssistantWorkflow imported successfully")
-        print("   Workflow now uses official LangWatch decorators")
-    except Exception as e:
-        print(f"❌ Failed to import workflow: {e}")
-        return False
-    
+    from workflow.financial_assistant import FinancialAssistantWorkflow
+
+    logger.debug("FinancialAssistantWorkflow imported successfully")
+    logger.debug("   Workflow now uses official LangWatch decorators")
+
     # Test 4: Workflow initialization
-    try:
-        from agno.models.anthropic import Claude
-        
-        workflow = FinancialAssistantWorkflow(
-            llm=Claude(id='claude-sonnet-4-20250514'),
-            settings=settings,
-            session_id='test-session'
-        )
-        print("✅ Workflow initialized successfully")
-        print("   LangWatch decorators applied conditionally based on configuration")
-    except Exception as e:
-        print(f"❌ Failed to initialize workflow: {e}")
-        return False
-    
+    if not settings.financial_modeling_prep_api_key:
+        pytest.skip("FINANCIAL_MODELING_PREP_API_KEY not set")
+
+    from agno.models.anthropic import Claude
+
+    workflow = FinancialAssistantWorkflow(
+        llm=Claude(id='claude-sonnet-4-20250514'),
+        settings=settings,
+        session_id='test-session'
+    )
+    logger.debug("Workflow initialized successfully")
+    logger.debug("   LangWatch decorators applied conditionally based on configuration")
+
     # Test 5: Decorator application status
     original_method = FinancialAssistantWorkflow.run
     decorated_method = workflow.run
     
     if original_method != decorated_method:
-        print("✅ LangWatch decorators dynamically applied to workflow methods")
+        logger.debug("LangWatch decorators dynamically applied to workflow methods")
     else:
-        print("ℹ️  LangWatch decorators not applied (API key not configured)")
+        logger.debug("LangWatch decorators not applied (API key not configured)")
     
-    print("-" * 50)
-    print("✅ All tests passed!")
-    print("\nIntegration Summary:")
-    print("• Using official LangWatch decorators (@langwatch.trace, @langwatch.span)")
-    print("• Decorators applied conditionally when API key is configured")
-    print("• No custom decorator code - using LangWatch SDK directly")
-    print("• Graceful fallback when LangWatch is not configured")
+    logger.debug("All tests passed!")
+    logger.debug("Integration Summary:")
+    logger.debug("• Using official LangWatch decorators (@langwatch.trace, @langwatch.span)")
+    logger.debug("• Decorators applied conditionally when API key is configured")
+    logger.debug("• No custom decorator code - using LangWatch SDK directly")
+    logger.debug("• Graceful fallback when LangWatch is not configured")
     
-    print("\nNext steps:")
+    logger.debug("Next steps:")
     if not settings.has_langwatch_configured:
-        print("1. Get API key from: https://app.langwatch.ai")
-        print("2. Set LANGWATCH_API_KEY in env/.env")
-        print("3. Run application: uv run streamlit run src/main.py")
-        print("4. Monitor traces at: https://app.langwatch.ai")
+        logger.debug("1. Get API key from: https://app.langwatch.ai")
+        logger.debug("2. Set LANGWATCH_API_KEY in env/.env")
+        logger.debug("3. Run application: uv run streamlit run src/main.py")
+        logger.debug("4. Monitor traces at: https://app.langwatch.ai")
     else:
-        print("1. Run application: uv run streamlit run src/main.py")
-        print("2. Monitor traces at: https://app.langwatch.ai")
-    
-    return True
+        logger.debug("1. Run application: uv run streamlit run src/main.py")
+        logger.debug("2. Monitor traces at: https://app.langwatch.ai")
+
 
 if __name__ == "__main__":
-    success = test_official_langwatch()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "-s", "-m", "langwatch"]))
\ No newline at end of file
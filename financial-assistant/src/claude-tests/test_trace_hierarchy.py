@@ -1,113 +1,101 @@
 #!/usr/bin/env python3
 """Test script to validate LangWatch trace hierarchy."""
 
+import logging
 import os
 import sys
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+import pytest
 
-# Set up environment - use a test API key to enable tracing
-os.environ["PYTHONPATH"] = str(project_root / "src")
+logger = logging.getLogger(__name__)
+
+
+# Use a test API key to enable tracing
 os.environ["LANGWATCH_API_KEY"] = "test-key-for-hierarchy-testing"
 
+@pytest.mark.langwatch
 def test_trace_hierarchy():
     """Test if LangWatch trace hierarchy is working properly."""
-    print("Testing LangWatch Trace Hierarchy...")
-    print("-" * 60)
+    logger.debug("Testing LangWatch Trace Hierarchy...")
     
-    try:
-        # Import required modules
-        import langwatch
-        from config.settings import Settings
-        from agno.models.anthropic import Claude
-        from workflow.financial_assistant import FinancialAssistantWorkflow
-        
-        print("✅ All modules imported successfully")
-        
-        # Create a simple test to check if we can create nested spans
-        print("\nTesting manual span nesting...")
+    # Import required modules
+    import langwatch
+    from config.settings import Settings
+    from agno.models.anthropic import Claude
+    from workflow.financial_assistant import FinancialAssistantWorkflow
+    
+    logger.debug("All modules imported successfully")
+    
+    # Create a simple test to check if we can create nested spans
+    logger.debug("Testing manual span nesting...")
+    
+    with langwatch.trace(name="test_hierarchy_trace") as trace:
+        logger.debug("Created main trace")
         
-        with langwatch.trace(name="test_hierarchy_trace") as trace:
-            print("✅ Created main trace")
+        with langwatch.span(type="chain", name="test_flow") as flow_span:
+            logger.debug("Created flow span")
+            flow_span.update(inputs={"test": "data"})
             
-            with langwatch.span(type="chain", name="test_flow") as flow_span:
-                print("✅ Created flow span")
-                flow_span.update(inputs={"test": "data"})
-                
-                with langwatch.span(type="agent", name="test_agent") as agent_span:
-                    print("✅ Created agent span")  
-                    agent_span.update(inputs={"message": "test"})
-                    agent_span.update(outputs={"result": "success"})
-                
-                with langwatch.span(type="tool", name="test_tool") as tool_span:
-                    print("✅ Created tool span")
-                    tool_span.update(inputs={"symbol": "AAPL"})
-                    tool_span.update(outputs={"data": "mock_data"})
-                
-                flow_span.update(outputs={"status": "completed"})
-        
-        print("✅ Manual span hierarchy test completed successfully")
-        
-        # Test workflow initialization
-        print("\nTesting workflow with spans...")
-        settings = Settings()
-        
-        # Mock the necessary settings to avoid API calls
-        workflow = FinancialAssistantWorkflow(
-            llm=Claude(id='claude-sonnet-4-20250514'),
-            settings=settings,
-            session_id='test-hierarchy-session'
-        )
-        
-        print("✅ Workflow initialized with span decorators")
-        
-        # Test that spans are being created (we won't run the full workflow due to API requirements)
-        print("\nChecking span context availability...")
-        
-        try:
-            # This should work if LangWatch is properly configured
-            current_span = langwatch.get_current_span()
-            if current_span:
-                print("✅ Current span context is available")
-            else:
-                print("ℹ️  No active span (expected outside of execution)")
-                
-            # Try to create a test span to verify functionality
-            with langwatch.span(type="test", name="functionality_check"):
-                print("✅ Can create new spans successfully")
-                
-        except Exception as e:
-            print(f"⚠️  Span context test failed: {e}")
-        
-        print("\n" + "="*60)
-        print("TRACE HIERARCHY VALIDATION SUMMARY:")
-        print("✅ LangWatch SDK properly imported and configured")
-        print("✅ Manual span nesting works correctly")
-        print("✅ Workflow decorators applied successfully")
-        print("✅ Span context is available")
-        print("✅ Ready for full workflow tracing")
-        print("\nExpected hierarchy in actual usage:")
-        print("🔍 financial_assistant_workflow (main trace)")
-        print("├── 🎯 router_agent (agent span)")
-        print("├── 📊 report_flow_execution (manual span)")
-        print("│   ├── 🔍 symbol_extraction_agent_report (agent span)")  
-        print("│   ├── 🛠️ parallel_data_fetch (tool span)")
-        print("│   └── 🤖 report_generation_agent (agent span)")
-        print("└── ✅ workflow_complete")
-        print("\n⚠️  NOTE: Full testing requires valid API keys")
-        print("   Set ANTHROPIC_API_KEY and FINANCIAL_MODELING_PREP_API_KEY to test end-to-end")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+            with langwatch.span(type="agent", name="test_agent") as agent_span:
+                logger.debug("Created agent span")
+                agent_span.update(inputs={"message": "test"})
+                agent_span.update(outputs={"result": "success"})
+            
+            with langwatch.span(type="tool", name="test_tool") as tool_span:
+                logger.debug("Created tool span")
+                tool_span.update(inputs={"symbol": "AAPL"})
+                tool_span.update(outputs={"data": "mock_data"})
+            
+            flow_span.update(outputs={"status": "completed"})
+    
+    logger.debug("Manual span hierarchy test completed successfully")
+    
+    # Test workflow initialization
+    logger.debug("Testing workflow with spans...")
+    settings = Settings()
+    if not settings.financial_modeling_prep_api_key:
+        pytest.skip("FINANCIAL_MODELING_PREP_API_KEY not set")
+
+    # Mock the necessary settings to avoid API calls
+    workflow = FinancialAssistantWorkflow(
+        llm=Claude(id='claude-sonnet-4-20250514'),
+        settings=settings,
+        session_id='test-hierarchy-session'
+    )
+    
+    logger.debug("Workflow initialized with span decorators")
+    
+    # Test that spans are being created (we won't run the full workflow due to API requirements)
+    logger.debug("Checking span context availability...")
+    
+    # This should work if LangWatch is properly configured
+    current_span = langwatch.get_current_span()
+    if current_span:
+        logger.debug("Current span context is available")
+    else:
+        logger.debug("No active span (expected outside of execution)")
+
+    # Create a test span to verify functionality
+    with langwatch.span(type="test", name="functionality_check"):
+        logger.debug("Can create new spans successfully")
+    
+    logger.debug("TRACE HIERARCHY VALIDATION SUMMARY:")
+    logger.debug("LangWatch SDK properly imported and configured")
+    logger.debug("Manual span nesting works correctly")
+    logger.debug("Workflow decorators applied successfully")
+    logger.debug("Span context is available")
+    logger.debug("Ready for full workflow tracing")
+    logger.debug("Expected hierarchy in actual usage:")
+    logger.debug("financial_assistant_workflow (main trace)")
+    logger.debug("├── router_agent (agent span)")
+    logger.debug("├── report_flow_execution (manual span)")
+    logger.debug("│   ├── symbol_extraction_agent_report (agent span)")
+    logger.debug("│   ├── parallel_data_fetch (tool span)")
+    logger.debug("│   └── report_generation_agent (agent span)")
+    logger.debug("└── workflow_complete")
+    logger.debug("NOTE: Full testing requires valid API keys")
+    logger.debug("   Set ANTHROPIC_API_KEY and FINANCIAL_MODELING_PREP_API_KEY to test end-to-end")
+
 
 if __name__ == "__main__":
-    success = test_trace_hierarchy()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "-s", "-m", "langwatch"]))
\ No newline at end of file
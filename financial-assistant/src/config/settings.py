@@ -82,6 +82,9 @@ class Settings(BaseSettings):
     langwatch_environment: str = Field(
         "development", description="Environment name (development, staging, production)"
     )
+    langwatch_disabled: bool = Field(
+        False, description="Skip LangWatch setup even when an API key is present"
+    )
 
     # LLM Configuration
     default_llm_provider: Annotated[
@@ -112,6 +115,11 @@ class Settings(BaseSettings):
         True, description="Whether to enable data caching"
     )
     cache_ttl_minutes: int = Field(15, description="Cache time-to-live in minutes")
+    cache_db_file: Optional[str] = Field(
+        None,
+        description="SQLite file persisting API responses across restarts "
+        "(memory only when unset)",
+    )
 
     # Performance Configuration
     request_timeout_seconds: int = Field(
@@ -120,6 +128,12 @@ class Settings(BaseSettings):
     max_concurrent_requests: int = Field(
         5, description="Maximum concurrent API requests"
     )
+    fmp_rate_limit_burst: int = Field(
+        300, description="Maximum burst of Financial Modeling Prep requests"
+    )
+    fmp_rate_limit_per_second: float = Field(
+        5.0, description="Sustained Financial Modeling Prep requests per second"
+    )
 
     # UI Configuration
     app_title: str = Field("Financial Assistant", description="Application title")
@@ -127,6 +141,11 @@ class Settings(BaseSettings):
     max_chat_history: int = Field(
         50, description="Maximum number of chat messages to keep in history"
     )
+    history_archive_dir: Optional[str] = Field(
+        None,
+        description="Directory of per-session JSONL files holding messages "
+        "trimmed from history (opt-in; trimmed messages are discarded when unset)",
+    )
 
     # Session Storage Configuration
     storage_db_file: str = Field(
@@ -217,7 +236,7 @@ class Settings(BaseSettings):
     @property
     def has_langwatch_configured(self) -> bool:
         """Check if LangWatch observability is configured"""
-        return self.langwatch_api_key is not None
+        return self.langwatch_api_key is not None and not self.langwatch_disabled
 
     @property
     def is_fully_configured(self) -> bool:
@@ -300,10 +319,22 @@ def validate_configuration(settings: Settings) -> Tuple[bool, List[str]]:
     if settings.request_timeout_seconds <= 0:
         errors.append("Request timeout must be positive")
 
+    # Validate request concurrency
+    if settings.max_concurrent_requests <= 0:
+        errors.append("Maximum concurrent requests must be positive")
+
+    # Validate FMP rate limit
+    if settings.fmp_rate_limit_burst <= 0 or settings.fmp_rate_limit_per_second <= 0:
+        errors.append("FMP rate limit burst and per-second rate must be positive")
+
     # Validate cache TTL
     if settings.cache_ttl_minutes <= 0:
         errors.append("Cache TTL must be positive")
 
+    # Validate chat history bound
+    if settings.max_chat_history <= 0:
+        errors.append("Max chat history must be positive")
+
     return len(errors) == 0, errors
 
 
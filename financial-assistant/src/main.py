@@ -18,7 +18,10 @@ from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from config.settings import Settings
-from workflow.financial_assistant import FinancialAssistantWorkflow
+from workflow.financial_assistant import (
+    FinancialAssistantWorkflow,
+    create_session_storage,
+)
 
 # LangWatch setup is now handled in the workflow initialization
 # No need for global setup here
@@ -107,12 +110,8 @@ def get_fmp_api_key(settings: Settings) -> Optional[str]:
 def initialize_storage(settings: Settings) -> SqliteStorage:
     """Initialize storage for session persistence"""
     if st.session_state.storage is None:
-        # Ensure the tmp directory exists
-        import os
-
-        os.makedirs(os.path.dirname(settings.storage_db_file), exist_ok=True)
-
-        storage = SqliteStorage(
+        # Creates the database directory if needed
+        storage = create_session_storage(
             table_name=settings.storage_table_name, db_file=settings.storage_db_file
         )
         st.session_state.storage = storage
@@ -11,22 +11,38 @@ from typing import Any, Dict, List, Literal, Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 
+# Request categories the router agent chooses between
+RouterCategory = Literal[
+    "income_statement", "company_financials", "stock_price", "report", "chat"
+]
+
+
 class RouterResult(BaseModel):
     """Result from the router agent categorizing user requests"""
 
-    category: Literal[
-        "income_statement", "company_financials", "stock_price", "report", "chat"
-    ]
+    category: RouterCategory
     confidence: Optional[float] = Field(
         None, ge=0, le=1, description="Confidence score for routing decision"
     )
     reasoning: Optional[str] = Field(
         None, description="Brief explanation of routing decision"
     )
+    symbol: Optional[str] = Field(
+        default=None,
+        description="Stock symbol the request refers to (not set for chat)",
+    )
+    symbols: List[str] = Field(
+        default_factory=list,
+        description="All symbols, in order, when the request names several companies",
+    )
 
 
 class Extraction(BaseModel):
     symbol: str = Field(description="The symbol of the company")
+    symbols: List[str] = Field(
+        default_factory=list,
+        description="All symbols, in order, when the request names several companies",
+    )
 
 
 class SymbolSearchResult(BaseModel):
@@ -126,6 +142,24 @@ class StockPriceData(BaseModel):
     fifty_two_week_low: float = Field(0, description="52-week low")
     exchange: str = Field("Unknown", description="Stock exchange")
     timestamp: int = Field(0, description="Data timestamp")
+
+    # Recent-history analytics (None when no history was fetched)
+    trend_direction: Optional[Literal["bullish", "bearish", "neutral"]] = Field(
+        None, description="5-day price trend direction"
+    )
+    trend_strength: Optional[float] = Field(
+        None, description="Trend strength between 0 and 1"
+    )
+    five_day_change_percent: Optional[float] = Field(
+        None, description="Percentage change over the last 5 trading days"
+    )
+    volatility: Optional[float] = Field(
+        None, description="Standard deviation of daily returns, in percent"
+    )
+    volume_trend: Optional[Literal["increasing", "decreasing", "stable"]] = Field(
+        None, description="Recent volume versus the preceding days"
+    )
+
     success: bool = Field(True, description="Whether data fetch was successful")
     error: Optional[str] = Field(None, description="Error message if fetch failed")
 
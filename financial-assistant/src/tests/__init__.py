@@ -6,7 +6,7 @@ including workflow tests, agent tests, tool tests, and Agno framework compatibil
 
 Test Categories:
 - test_workflow.py: Core workflow execution tests
-- test_hello_query.py: End-to-end hello query test
+- test_smoke.py: End-to-end hello query smoke tests
 - test_financial_*.py: Financial data flow tests  
 - test_agno_*.py: Agno framework compatibility tests
 - test_minimal_*.py: Minimal component tests for debugging
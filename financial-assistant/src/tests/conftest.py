@@ -0,0 +1,71 @@
+"""
+Shared pytest configuration for the workflow test suite
+"""
+
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+from dotenv import load_dotenv
+
+# Parse env/.env once for the whole run instead of once per test module
+ENV_PATH = Path(__file__).parent.parent.parent / "env" / ".env"
+load_dotenv(ENV_PATH, override=False)
+
+# Give every pytest-xdist worker its own session database so test files
+# running in parallel never contend on (or leave state in) a shared SQLite file
+_WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+os.environ["STORAGE_DB_FILE"] = f"tmp/test_sessions_{_WORKER_ID}.db"
+
+# Unit tests never need the tracer, so skip LangWatch setup entirely
+os.environ["LANGWATCH_DISABLED"] = "1"
+
+
+@pytest.fixture(scope="session")
+def workflow_factory():
+    """Build FinancialAssistantWorkflow instances sharing one Settings object"""
+    from config.settings import Settings
+    from workflow.financial_assistant import FinancialAssistantWorkflow
+
+    settings = Settings()
+
+    def _factory(llm=None, **kwargs):
+        return FinancialAssistantWorkflow(llm=llm, settings=settings, **kwargs)
+
+    return _factory
+
+
+@pytest.fixture
+def workflow_stream(workflow_factory):
+    """Workflow with agent streaming enabled, for first-token latency checks"""
+    return workflow_factory(stream=True)
+
+
+# Canned Groq (OpenAI-compatible) chat completion used by mock_groq
+GROQ_MOCK_COMPLETION = {
+    "id": "chatcmpl-mock",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "llama-3.3-70b-versatile",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello! How can I help you today?"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 9, "total_tokens": 19},
+}
+
+
+@pytest.fixture
+def mock_groq(monkeypatch):
+    """Stub the Groq chat completions endpoint so no request leaves the process"""
+    monkeypatch.setenv("GROQ_API_KEY", os.getenv("GROQ_API_KEY") or "test-groq-key")
+    with respx.mock(base_url="https://api.groq.com", assert_all_called=False) as router:
+        router.post("/openai/v1/chat/completions", name="chat_completions").mock(
+            return_value=httpx.Response(200, json=GROQ_MOCK_COMPLETION)
+        )
+        yield router
@@ -0,0 +1,72 @@
+"""
+Unit tests for the vectorized price history analytics
+"""
+
+import numpy as np
+from tools.analytics import _loop_kernel, _numpy_kernel, _stack, batch_analytics
+
+
+def _history(closes, volumes=None):
+    volumes = volumes or [1000] * len(closes)
+    return [{"close": c, "volume": v} for c, v in zip(closes, volumes)]
+
+
+def test_batch_matches_per_symbol_results():
+    """Stacking symbols together gives the same answer as one at a time"""
+    histories = [
+        _history([110.0, 108.0, 106.0, 104.0, 100.0]),  # rising
+        _history([90.0, 95.0, 99.0, 102.0, 105.0]),  # falling
+        _history([100.0, 101.0]),  # too short for up-day counting
+        [],
+    ]
+    prices = [111.0, 89.0, 104.0, 50.0]
+
+    batch = batch_analytics(histories, prices)
+    single = [batch_analytics([h], [p])[0] for h, p in zip(histories, prices)]
+    assert batch == single
+
+    assert batch[0]["trend_direction"] == "bullish"
+    assert batch[1]["trend_direction"] == "bearish"
+    assert batch[2]["trend_direction"] == "bullish"  # +2.97% over two days
+    assert batch[3]["trend_direction"] == "neutral"
+    assert batch[3]["volatility"] == 0
+
+
+def test_volatility_and_volume_trend():
+    """Daily-return std is reported in percent, volume trend vs older days"""
+    (result,) = batch_analytics(
+        [_history([102.0, 100.0, 102.0, 100.0], [3000, 3000, 1000, 1000])], [102.0]
+    )
+    assert result["volatility"] == 1.87
+    assert result["volume_trend"] == "increasing"
+
+
+def test_loop_kernel_matches_numpy_kernel():
+    """The Numba-compiled loop kernel computes the same values as NumPy"""
+    histories = [
+        _history([110.0, 108.0, 106.0, 104.0, 100.0], [5000, 4000, 1000, 900, 800]),
+        _history([100.0, 101.0]),
+        _history([50.0]),
+        [],
+    ]
+    closes, n_closes = _stack(histories, "close", 5)
+    volumes, n_volumes = _stack(histories, "volume", 5)
+    current = np.array([111.0, 104.0, 49.0, 10.0])
+
+    looped = _loop_kernel(closes, n_closes, volumes, n_volumes, current)
+    vectorized = _numpy_kernel(closes, n_closes, volumes, n_volumes, current)
+    for loop_values, numpy_values in zip(looped, vectorized):
+        np.testing.assert_allclose(loop_values, numpy_values)
+
+
+def test_long_window_matches_numpy_reference():
+    """Longer windows use the same kernel and match np.std of daily returns"""
+    rng = np.random.default_rng(7)
+    closes = list(100 + rng.normal(0, 1, 90).cumsum())  # most recent first
+    (result,) = batch_analytics([_history(closes)], [closes[0]], window=90)
+
+    chronological = np.array(closes[::-1])
+    returns = np.diff(chronological) / chronological[:-1]
+    assert result["volatility"] == round(float(returns.std() * 100), 2)
+    expected_change = (closes[0] - closes[-1]) / closes[-1] * 100
+    assert result["five_day_change_percent"] == round(expected_change, 2)
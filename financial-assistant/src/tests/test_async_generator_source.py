@@ -5,55 +5,49 @@ Test script to identify which component creates async_generator during initializ
 import os
 from typing import Iterator
 
+import pytest
 from agno.run.response import RunResponse
 from agno.workflow import Workflow
 from agno.agent import Agent
 from agno.models.anthropic import Claude
 from agno.storage.sqlite import SqliteStorage
+from tools.financial_modeling_prep import FinancialModelingPrepTools
 
-# Load environment variables
-from dotenv import load_dotenv
-import os
-env_path = os.path.join(os.path.dirname(__file__), '..', '..', 'env', '.env')
-load_dotenv(env_path)
-
-print("Testing workflow components to find async_generator source...\n")
 
 # Test 1: Empty workflow
-print("Test 1: Empty workflow")
 class EmptyWorkflow(Workflow):
     def run(self, **kwargs) -> Iterator[RunResponse]:
         yield RunResponse(run_id=self.run_id, content="test")
 
-try:
-    w = EmptyWorkflow()
-    r = w.run(message="test")
-    print("✓ Empty workflow works\n")
-except Exception as e:
-    print(f"✗ Empty workflow failed: {e}\n")
+
+def test_empty_workflow():
+    """Empty workflow"""
+    r = EmptyWorkflow().run(message="test")
+    assert r is not None
+    assert list(r)[0].content == "test"
+
 
 # Test 2: Workflow with storage
-print("Test 2: Workflow with SqliteStorage")
 class WorkflowWithStorage(Workflow):
     def __init__(self):
         super().__init__()
         self.storage = SqliteStorage(
             table_name="test_table",
-            db_file="test.db"
+            db_url="sqlite://"
         )
     
     def run(self, **kwargs) -> Iterator[RunResponse]:
         yield RunResponse(run_id=self.run_id, content="test")
 
-try:
-    w = WorkflowWithStorage()
-    r = w.run(message="test")
-    print("✓ Workflow with storage works\n")
-except Exception as e:
-    print(f"✗ Workflow with storage failed: {e}\n")
+
+def test_workflow_with_storage():
+    """Workflow with SqliteStorage"""
+    r = WorkflowWithStorage().run(message="test")
+    assert r is not None
+    assert list(r)[0].content == "test"
+
 
 # Test 3: Workflow with simple agent (no response model)
-print("Test 3: Workflow with simple agent")
 class WorkflowWithSimpleAgent(Workflow):
     def __init__(self):
         super().__init__()
@@ -65,15 +59,15 @@ class WorkflowWithSimpleAgent(Workflow):
     def run(self, **kwargs) -> Iterator[RunResponse]:
         yield RunResponse(run_id=self.run_id, content="test")
 
-try:
-    w = WorkflowWithSimpleAgent()
-    r = w.run(message="test")
-    print("✓ Workflow with simple agent works\n")
-except Exception as e:
-    print(f"✗ Workflow with simple agent failed: {e}\n")
+
+def test_workflow_with_simple_agent():
+    """Workflow with simple agent (no response model)"""
+    r = WorkflowWithSimpleAgent().run(message="test")
+    assert r is not None
+    assert list(r)[0].content == "test"
+
 
 # Test 4: Workflow with agent using Claude model
-print("Test 4: Workflow with agent using Claude model")
 class WorkflowWithClaudeAgent(Workflow):
     def __init__(self):
         super().__init__()
@@ -86,15 +80,15 @@ class WorkflowWithClaudeAgent(Workflow):
     def run(self, **kwargs) -> Iterator[RunResponse]:
         yield RunResponse(run_id=self.run_id, content="test")
 
-try:
-    w = WorkflowWithClaudeAgent()
-    r = w.run(message="test")
-    print("✓ Workflow with Claude agent works\n")
-except Exception as e:
-    print(f"✗ Workflow with Claude agent failed: {e}\n")
+
+def test_workflow_with_claude_agent():
+    """Workflow with agent using Claude model"""
+    r = WorkflowWithClaudeAgent().run(message="test")
+    assert r is not None
+    assert list(r)[0].content == "test"
+
 
 # Test 5: Workflow with agent using response model
-print("Test 5: Workflow with agent using response model")
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
@@ -117,17 +111,15 @@ class WorkflowWithResponseModelAgent(Workflow):
     def run(self, **kwargs) -> Iterator[RunResponse]:
         yield RunResponse(run_id=self.run_id, content="test")
 
-try:
-    w = WorkflowWithResponseModelAgent()
-    r = w.run(message="test")
-    print("✓ Workflow with response model agent works\n")
-except Exception as e:
-    print(f"✗ Workflow with response model agent failed: {e}\n")
 
-# Test 6: Workflow with tools
-print("Test 6: Workflow with FMP tools - SKIPPING (would need path setup)")
-"""
+def test_workflow_with_response_model_agent():
+    """Workflow with agent using response model"""
+    r = WorkflowWithResponseModelAgent().run(message="test")
+    assert r is not None
+    assert list(r)[0].content == "test"
 
+
+# Test 6: Workflow with tools
 class WorkflowWithTools(Workflow):
     def __init__(self):
         super().__init__()
@@ -142,12 +134,13 @@ class WorkflowWithTools(Workflow):
     def run(self, **kwargs) -> Iterator[RunResponse]:
         yield RunResponse(run_id=self.run_id, content="test")
 
-try:
-    w = WorkflowWithTools()
-    r = w.run(message="test")
-    print("✓ Workflow with tools works\n")
-except Exception as e:
-    print(f"✗ Workflow with tools failed: {e}\n")
 
-"""
-print("Testing complete!")
\ No newline at end of file
+@pytest.mark.skipif(
+    not os.getenv("FINANCIAL_MODELING_PREP_API_KEY"),
+    reason="FINANCIAL_MODELING_PREP_API_KEY not set",
+)
+def test_workflow_with_tools():
+    """Workflow with FMP tools"""
+    r = WorkflowWithTools().run(message="test")
+    assert r is not None
+    assert list(r)[0].content == "test"
@@ -0,0 +1,77 @@
+"""
+Unit tests for the API response cache used by FinancialModelingPrepTools
+"""
+
+from tools.cache import APICache, SQLiteCache
+
+
+def test_key_ignores_param_order():
+    """Keys depend on endpoint and params, not on dict insertion order"""
+    a = APICache.make_key("search", {"query": "apple", "limit": 5})
+    b = APICache.make_key("search", {"limit": 5, "query": "apple"})
+    assert a == b
+    assert a != APICache.make_key("search", {"query": "tesla", "limit": 5})
+
+
+def test_ttl_by_endpoint_prefix():
+    """Per-endpoint TTLs apply by prefix, unknown endpoints use the default"""
+    cache = APICache(default_ttl=900)
+    assert cache.ttl_for("quote/AAPL") == 15
+    assert cache.ttl_for("income-statement/AAPL") == 86400
+    assert cache.ttl_for("historical-price-full/AAPL") == 3600
+    assert cache.ttl_for("earning_calendar") == 900
+
+
+def test_expiry_and_lru_eviction():
+    """Expired entries miss and the least recently used entry is evicted"""
+    cache = APICache(default_ttl=60, max_entries=2)
+    cache.set("expired", [1], ttl=-1)
+    assert cache.get("expired") is None
+
+    cache.set("a", [1], ttl=60)
+    cache.set("b", [2], ttl=60)
+    assert cache.get("a") == [1]  # "a" becomes most recently used
+    cache.set("c", [3], ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    """Entries written by one SQLiteCache are read back by a fresh instance"""
+    db_file = str(tmp_path / "cache" / "fmp.db")
+    key = APICache.make_key("profile/AAPL")
+    writer = SQLiteCache(db_file, default_ttl=60)
+    writer.set(key, [{"symbol": "AAPL"}], ttl=60)
+    writer.flush()
+
+    cache = SQLiteCache(db_file, default_ttl=60)
+    assert cache.get(key) == [{"symbol": "AAPL"}]
+
+    cache.set(key, [1], ttl=-1)
+    cache.flush()
+    assert SQLiteCache(db_file, default_ttl=60).get(key) is None
+
+
+def test_sqlite_cache_batches_writes_and_prunes_on_open(tmp_path):
+    """Queued rows are read back before they are written; expired rows are pruned"""
+    db_file = str(tmp_path / "fmp.db")
+    cache = SQLiteCache(db_file, default_ttl=60)
+    # Holding the database lock keeps the writer thread from flushing
+    with cache._db_lock:
+        cache.set(APICache.make_key("quote/AAPL"), [1], ttl=60)
+        cache.set(APICache.make_key("quote/OLD"), [2], ttl=-1)
+
+        # A queued row is served after the in-memory copy is gone
+        APICache.clear(cache)
+        assert cache.get(APICache.make_key("quote/AAPL")) == [1]
+        count = cache._db.execute("SELECT COUNT(*) FROM api_cache").fetchone()[0]
+        assert count == 0
+
+    cache.flush()
+    assert cache._db.execute("SELECT COUNT(*) FROM api_cache").fetchone()[0] == 2
+
+    reopened = SQLiteCache(db_file, default_ttl=60)
+    keys = [row[0] for row in reopened._db.execute("SELECT key FROM api_cache")]
+    assert keys == [SQLiteCache._db_key(APICache.make_key("quote/AAPL"))]
@@ -0,0 +1,42 @@
+"""
+Unit tests for the token bucket used to rate limit FMP requests
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from tools.rate_limit import MAX_RETRY_DELAY, TokenBucket, retry_delay
+
+
+def test_burst_then_wait_for_refill():
+    """Requests within capacity pass at once, the next waits for a refill"""
+    bucket = TokenBucket(capacity=2, refill_rate=20)
+
+    async def acquire_three():
+        await bucket.acquire()
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - start
+
+    waited = asyncio.run(acquire_three())
+    assert waited >= 0.04  # one token at 20/s takes ~50ms
+
+
+def test_rejects_non_positive_configuration():
+    """Zero capacity or refill rate would block forever"""
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, refill_rate=5)
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=5, refill_rate=0)
+
+
+def test_retry_delay_prefers_retry_after():
+    """Retry-After seconds win over backoff, which doubles per attempt"""
+    assert retry_delay("3", attempt=0) == 3.0
+    assert retry_delay(None, attempt=0) == 0.5
+    assert retry_delay(None, attempt=2) == 2.0
+    assert retry_delay("not a date", attempt=1) == 1.0
+    assert retry_delay("86400", attempt=0) == MAX_RETRY_DELAY
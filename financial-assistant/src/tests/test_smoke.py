@@ -0,0 +1,62 @@
+"""
+Smoke tests for the "hello" query
+
+Verifies that the hello query works end-to-end with the sync-only Agno
+workflow architecture, both with the default LLM and with Groq.
+"""
+
+import os
+import time
+
+import pytest
+from agno.models.groq import Groq
+
+# Upper bound for time to the first streamed response with content; generous
+# enough for CI, tight enough to catch a path that buffers the whole reply
+FIRST_TOKEN_LATENCY_SECONDS = 5.0
+
+
+@pytest.mark.live
+@pytest.mark.parametrize(
+    "llm_factory,required_env",
+    [
+        (None, ("ANTHROPIC_API_KEY", "FINANCIAL_MODELING_PREP_API_KEY")),
+        (
+            lambda: Groq(id="llama-3.3-70b-versatile"),
+            ("GROQ_API_KEY", "FINANCIAL_MODELING_PREP_API_KEY"),
+        ),
+    ],
+    ids=["default_llm", "groq"],
+)
+def test_hello_smoke(workflow_factory, llm_factory, required_env):
+    """workflow.run() returns a generator whose first response has content"""
+    missing = [key for key in required_env if not os.getenv(key)]
+    if missing:
+        pytest.skip(f"{', '.join(missing)} not set")
+
+    workflow = workflow_factory(llm=llm_factory() if llm_factory else None)
+
+    responses = workflow.run(message="hello")
+    assert responses is not None
+
+    first = next(responses)
+    assert first.content
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not (os.getenv("ANTHROPIC_API_KEY") and os.getenv("FINANCIAL_MODELING_PREP_API_KEY")),
+    reason="ANTHROPIC_API_KEY / FINANCIAL_MODELING_PREP_API_KEY not set",
+)
+def test_first_token_latency(workflow_stream):
+    """With stream=True the first chunk with content arrives before the full reply"""
+    t0 = time.perf_counter()
+    gen = workflow_stream.run(message="hello")
+    try:
+        first = next(chunk for chunk in gen if chunk.content)
+        ttft = time.perf_counter() - t0
+    finally:
+        gen.close()
+
+    assert first.content
+    assert ttft < FIRST_TOKEN_LATENCY_SECONDS, f"time to first token {ttft:.2f}s"
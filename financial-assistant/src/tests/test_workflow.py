@@ -4,17 +4,27 @@ Unit tests for the Financial Assistant Workflow
 This module contains tests for the core workflow functionality.
 """
 
-import os
-import sys
-from unittest.mock import MagicMock, patch
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import asyncio
+from types import SimpleNamespace
 
+import httpx
+import pytest
+import respx
 from tools.financial_modeling_prep import FinancialModelingPrepTools
 from workflow.financial_assistant import FinancialAssistantWorkflow
 
 
+def yield_from_result(generator, yielded=None):
+    """Drain a generator, collecting what it yields, and return its result"""
+    while True:
+        try:
+            item = next(generator)
+        except StopIteration as stop:
+            return stop.value
+        if yielded is not None:
+            yielded.append(item)
+
+
 class TestFinancialAssistantWorkflow:
     """Test class for FinancialAssistantWorkflow"""
 
@@ -40,6 +50,16 @@ class TestFinancialAssistantWorkflow:
         assert "messages" in workflow.session_state
         assert "companies_discussed" in workflow.session_state
 
+    def test_agents_built_on_first_use(self):
+        """Test that agents are only constructed when a turn needs them"""
+        workflow = FinancialAssistantWorkflow()
+        assert "chat_agent" not in vars(workflow)
+
+        agent = workflow.chat_agent
+        assert agent.name == "Chat Agent"
+        assert workflow.chat_agent is agent
+        assert "router_agent" not in vars(workflow)
+
     def test_workflow_with_custom_llm(self):
         """Test workflow creation with custom LLM"""
         from agno.models.anthropic import Claude
@@ -67,10 +87,10 @@ class TestFinancialAssistantWorkflow:
         """Test context generation when summary exists"""
         workflow = FinancialAssistantWorkflow()
 
-        # Mock summary object
-        mock_summary = MagicMock()
-        mock_summary.summary = "User asked about Apple stock performance"
-        workflow.session_state["conversation_summary"] = mock_summary
+        # Stub summary object
+        workflow.session_state["conversation_summary"] = SimpleNamespace(
+            summary="User asked about Apple stock performance"
+        )
         workflow.session_state["companies_discussed"] = ["AAPL"]
 
         context = workflow._get_conversation_context()
@@ -79,6 +99,46 @@ class TestFinancialAssistantWorkflow:
         )
         assert "AAPL" in context
 
+    def test_context_rebuilt_only_when_inputs_change(self):
+        """Test that the context string is reused until summary or companies change"""
+        workflow = FinancialAssistantWorkflow()
+        workflow.session_state["companies_discussed"] = ["AAPL"]
+        built = []
+        build = workflow._build_conversation_context
+
+        def counting_build(summary, companies):
+            built.append(tuple(companies))
+            return build(summary, companies)
+
+        workflow._build_conversation_context = counting_build
+
+        workflow._get_conversation_context()
+        workflow._get_conversation_context()
+        assert built == [("AAPL",)]
+
+        workflow.session_state["companies_discussed"].append("MSFT")
+        assert "AAPL, MSFT" in workflow._get_conversation_context()
+        assert built == [("AAPL",), ("AAPL", "MSFT")]
+
+    def test_history_trimmed_to_max_and_archived(self, tmp_path):
+        """Test that old messages move to the JSONL archive past max_chat_history"""
+        import json
+
+        from config.settings import Settings
+
+        settings = Settings(max_chat_history=3, history_archive_dir=str(tmp_path))
+        workflow = FinancialAssistantWorkflow(settings=settings, session_id="s1")
+        workflow.session_state["last_summary_message_count"] = 2
+
+        for i in range(5):
+            workflow._append_message(role="user", content=str(i))
+
+        messages = workflow.session_state["messages"]
+        assert [m["content"] for m in messages] == ["2", "3", "4"]
+        assert workflow.session_state["last_summary_message_count"] == 0
+        archived = (tmp_path / "s1.jsonl").read_text().splitlines()
+        assert [json.loads(line)["content"] for line in archived] == ["0", "1"]
+
     def test_summary_update_logic(self):
         """Test that summary update logic works correctly"""
         workflow = FinancialAssistantWorkflow()
@@ -93,17 +153,190 @@ class TestFinancialAssistantWorkflow:
             },
         ]
 
-        # Mock the summary agent
-        with patch.object(workflow.summary_agent, "run") as mock_run:
-            mock_response = MagicMock()
-            mock_response.content = MagicMock()
-            mock_response.content.summary = "User asked about Apple stock price"
-            mock_run.return_value = mock_response
+        # Stub the summary agent; the workflow is local to this test
+        stub_response = SimpleNamespace(
+            content=SimpleNamespace(summary="User asked about Apple stock price")
+        )
+        workflow.summary_agent.run = lambda *args, **kwargs: stub_response
+
+        # Test that summary updates with new messages
+        result = workflow._update_conversation_summary()
+        assert result is not None
+        assert workflow.session_state["last_summary_message_count"] == 2
+
+    def test_summary_sends_only_messages_since_last_summary(self, monkeypatch):
+        """Test that each summary update covers just the newly added messages"""
+        monkeypatch.setattr("workflow.financial_assistant._TRIVIAL_SUMMARY_CHARS", 0)
+        workflow = FinancialAssistantWorkflow()
+        contexts = []
+
+        def fake_summary(context, **kwargs):
+            contexts.append(context)
+            return SimpleNamespace(content=SimpleNamespace(summary="summary"))
+
+        workflow.summary_agent.run = fake_summary
+
+        workflow._append_message(role="user", content="first")
+        workflow._update_conversation_summary()
+        workflow._append_message(
+            role="agent", content="second", agent_name="Chat Agent"
+        )
+        workflow._update_conversation_summary()
+
+        assert "- User: first" in contexts[0]
+        assert "first" not in contexts[1]
+        assert "- Agent (Chat Agent): second" in contexts[1]
+        assert workflow.session_state["last_summary_message_count"] == 2
+
+    def test_trivial_messages_appended_without_summary_call(self):
+        """Test that short rounds extend the summary without an LLM call"""
+        from models.schemas import WorkflowSummary
+
+        workflow = FinancialAssistantWorkflow()
+        workflow.session_state["conversation_summary"] = WorkflowSummary(
+            summary="User follows Apple", companies_mentioned=["AAPL"]
+        )
 
-            # Test that summary updates with new messages
-            result = workflow._update_conversation_summary()
-            assert result is not None
-            assert workflow.session_state["last_summary_message_count"] == 2
+        def fail_summary(*args, **kwargs):
+            raise AssertionError("summary agent should not run")
+
+        workflow.summary_agent.run = fail_summary
+        workflow._append_message(role="user", content="thanks")
+
+        summary = workflow._update_conversation_summary()
+        assert summary.summary == "User follows Apple\n- User: thanks"
+        assert summary.companies_mentioned == ["AAPL"]
+        assert workflow.session_state["last_summary_message_count"] == 1
+
+    def test_report_fetch_span_records_availability(self):
+        """Test that the traced report fetch reports which sources succeeded"""
+        workflow = FinancialAssistantWorkflow()
+        results = [
+            SimpleNamespace(success=True),
+            SimpleNamespace(success=False),
+            SimpleNamespace(success=True),
+        ]
+
+        async def fake_fetch(symbol):
+            return results
+
+        updates = {}
+
+        class RecordingSpan:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def update(self, **kwargs):
+                updates.update(kwargs)
+
+        workflow._fetch_parallel_financial_data = fake_fetch
+        workflow._span = lambda **kwargs: RecordingSpan()
+
+        assert workflow._fetch_report_data("AAPL") == results
+        assert updates["outputs"] == {
+            "income_available": True,
+            "financials_available": False,
+            "price_available": True,
+        }
+
+    def test_multi_company_prices_use_one_quote_request(self):
+        """Test that a price question naming several companies is batched"""
+        from models.schemas import Extraction
+
+        workflow = FinancialAssistantWorkflow()
+        extraction = Extraction(symbol="AAPL", symbols=["AAPL", "msft"])
+        workflow.symbol_extraction_agent.run = lambda *args, **kwargs: (
+            SimpleNamespace(content=extraction)
+        )
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [
+                {"symbol": "AAPL", "price": 150.0},
+                {"symbol": "MSFT", "price": 300.0},
+            ]
+
+        workflow.fmp_tools._fetch = fake_fetch
+
+        responses = list(
+            workflow._run_alone_flow("Compare Apple and Microsoft", "stock_price")
+        )
+        assert calls == ["quote/AAPL,MSFT"]
+        assert "Stock Price - AAPL" in responses[-1].content
+        assert "Stock Price - MSFT" in responses[-1].content
+        assert workflow.session_state["workflow_path"] == "multi_symbol"
+
+    def test_router_symbol_skips_extraction_agent(self):
+        """Test that a symbol returned by the router needs no second LLM call"""
+        from models.schemas import RouterResult
+
+        workflow = FinancialAssistantWorkflow()
+        routed = RouterResult(category="stock_price", symbol="aapl")
+        workflow.router_agent.run = lambda *args, **kwargs: (
+            SimpleNamespace(content=routed)
+        )
+
+        def fail_extraction(*args, **kwargs):
+            raise AssertionError("symbol extraction agent should not run")
+
+        workflow.symbol_extraction_agent.run = fail_extraction
+        workflow.summary_agent.run = lambda *args, **kwargs: SimpleNamespace(
+            content=SimpleNamespace(summary="User asked about Apple")
+        )
+
+        async def fake_fetch(endpoint, params):
+            return [{"symbol": "AAPL", "price": 150.0}]
+
+        workflow.fmp_tools._fetch = fake_fetch
+
+        responses = list(workflow.run(message="What is Apple's stock price?"))
+        assert "Stock Price - AAPL" in responses[-1].content
+        assert workflow.session_state["symbol"] == "AAPL"
+
+    def test_explicit_ticker_request_skips_router_agent(self):
+        """Test that a request naming its data and ticker is routed without the LLM"""
+        from workflow.financial_assistant import _prefilter_route
+
+        workflow = FinancialAssistantWorkflow()
+
+        def fail_agent(*args, **kwargs):
+            raise AssertionError("router and extraction agents should not run")
+
+        workflow.router_agent.run = fail_agent
+        workflow.symbol_extraction_agent.run = fail_agent
+        workflow.summary_agent.run = lambda *args, **kwargs: SimpleNamespace(
+            content=SimpleNamespace(summary="User asked about Tesla")
+        )
+
+        async def fake_fetch(endpoint, params):
+            return [{"symbol": "TSLA", "price": 250.0}]
+
+        workflow.fmp_tools._fetch = fake_fetch
+
+        responses = list(workflow.run(message="TSLA stock price"))
+        assert "Stock Price - TSLA" in responses[-1].content
+
+        # Company names, follow-ups and mixed requests still go to the router
+        assert _prefilter_route("Tesla income statement") is None
+        assert _prefilter_route("What about MSFT?") is None
+        assert _prefilter_route("AAPL stock price and income statement") is None
+        assert _prefilter_route("Compare Apple and MSFT stock price") is None
+        assert _prefilter_route("stock price of AAPL vs Microsoft?") is None
+        both = _prefilter_route("Compare AAPL and MSFT stock price")
+        assert (both.symbol, both.symbols) == ("AAPL", ["AAPL", "MSFT"])
+        listed = _prefilter_route("Quote for GE on NYSE")
+        assert (listed.symbol, listed.symbols) == ("GE", [])
+        assert _prefilter_route("What is a P/E ratio?").category == "chat"
+        definition = _prefilter_route("Explain the meaning of a dividend yield")
+        assert definition.category == "chat"
+        # Definition phrasing about a named company is a data request
+        assert _prefilter_route("What is a fair price for Tesla stock?") is None
+        assert _prefilter_route("What is a good P/E for Apple?") is None
+        assert _prefilter_route("Explain the meaning of Apple's revenue drop") is None
 
 
 class TestFinancialModelingPrepTools:
@@ -118,6 +351,339 @@ class TestFinancialModelingPrepTools:
         assert hasattr(tools, "get_company_financials")
         assert hasattr(tools, "get_stock_price")
 
+    def test_client_pooled_per_event_loop(self):
+        """Test that one HTTP client is reused per loop and closed by aclose"""
+        tools = FinancialModelingPrepTools()
+
+        async def get_twice():
+            async with tools:
+                first = await tools._get_client()
+                second = await tools._get_client()
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+        assert first is second
+        assert first.is_closed
+        assert tools._client is None
+
+    @respx.mock(base_url="https://financialmodelingprep.com/api/v3")
+    def test_request_sends_api_key_and_decodes_json(self, respx_mock):
+        """Test that requests carry the API key, ask for compression and decode JSON"""
+        tools = FinancialModelingPrepTools(api_key="test-fmp-key")
+        route = respx_mock.get("/profile/AAPL").mock(
+            return_value=httpx.Response(200, json=[{"companyName": "Apple Inc."}])
+        )
+
+        async def fetch_profile():
+            async with tools:
+                return await tools.get_company_profile("aapl")
+
+        profile = asyncio.run(fetch_profile())
+        assert profile.success
+        assert profile.company_name == "Apple Inc."
+        request = route.calls.last.request
+        assert request.url.params["apikey"] == "test-fmp-key"
+        assert "gzip" in request.headers["accept-encoding"]
+
+    @respx.mock(base_url="https://financialmodelingprep.com/api/v3")
+    def test_stock_price_includes_trend_from_recent_history(self, respx_mock):
+        """Test that get_stock_price derives trend analytics from recent closes"""
+        tools = FinancialModelingPrepTools()
+        respx_mock.get("/quote/AAPL").mock(
+            return_value=httpx.Response(200, json=[{"symbol": "AAPL", "price": 110.0}])
+        )
+        closes = [110.0, 108.0, 106.0, 104.0, 100.0, 90.0]  # most recent first
+        respx_mock.get("/historical-price-full/AAPL").mock(
+            return_value=httpx.Response(
+                200,
+                json={"historical": [{"close": c, "volume": 1000} for c in closes]},
+            )
+        )
+
+        async def fetch_price():
+            async with tools:
+                return await tools.get_stock_price("AAPL", include_analytics=True)
+
+        price = asyncio.run(fetch_price())
+        assert price.success
+        assert price.trend_direction == "bullish"
+        assert price.five_day_change_percent == 10.0  # vs the 5th most recent close
+        assert price.volume_trend == "stable"
+
+    @respx.mock(base_url="https://financialmodelingprep.com/api/v3")
+    def test_history_error_payload_is_not_cached(self, respx_mock):
+        """Test that an FMP error payload for history is retried next time"""
+        tools = FinancialModelingPrepTools()
+        history = respx_mock.get("/historical-price-full/AAPL").mock(
+            return_value=httpx.Response(200, json={"Error Message": "Limit Reach"})
+        )
+
+        async def fetch_history():
+            async with tools:
+                return await tools._get_recent_history("AAPL", 5)
+
+        with pytest.raises(Exception, match="Limit Reach"):
+            asyncio.run(fetch_history())
+        with pytest.raises(Exception, match="Limit Reach"):
+            asyncio.run(fetch_history())
+        assert history.call_count == 2
+
+    @respx.mock(base_url="https://financialmodelingprep.com/api/v3")
+    def test_requests_capped_at_max_concurrency(self, respx_mock):
+        """Test that no more than max_concurrent_requests are on the wire"""
+        tools = FinancialModelingPrepTools()
+        tools._max_concurrency = 2
+        active, peak = 0, 0
+
+        async def slow_response(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json=[{"companyName": "Test"}])
+
+        respx_mock.get(path__startswith="/profile/").mock(side_effect=slow_response)
+
+        async def fetch_profiles():
+            async with tools:
+                return await asyncio.gather(
+                    *(tools.get_company_profile(s) for s in ["A", "B", "C", "D", "E"])
+                )
+
+        assert all(profile.success for profile in asyncio.run(fetch_profiles()))
+        assert peak == 2
+
+    @respx.mock(base_url="https://financialmodelingprep.com/api/v3")
+    def test_rate_limited_request_retried_after_delay(self, respx_mock):
+        """Test that a 429 is retried once the Retry-After delay has passed"""
+        tools = FinancialModelingPrepTools()
+        route = respx_mock.get("/profile/AAPL").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json=[{"companyName": "Apple Inc."}]),
+            ]
+        )
+
+        async def fetch_profile():
+            async with tools:
+                return await tools.get_company_profile("AAPL")
+
+        assert asyncio.run(fetch_profile()).company_name == "Apple Inc."
+        assert route.call_count == 2
+
+    @respx.mock(base_url="https://financialmodelingprep.com/api/v3")
+    def test_rate_limited_history_retried_after_delay(self, respx_mock):
+        """Test that the streamed history request also retries a 503"""
+        tools = FinancialModelingPrepTools()
+        route = respx_mock.get("/historical-price-full/AAPL").mock(
+            side_effect=[
+                httpx.Response(503, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"historical": [{"close": 1.0}]}),
+            ]
+        )
+
+        async def fetch_history():
+            async with tools:
+                return await tools._get_recent_history("AAPL", 5)
+
+        assert asyncio.run(fetch_history()) == [{"close": 1.0}]
+        assert route.call_count == 2
+
+    def test_concurrent_identical_requests_coalesce(self):
+        """Test that concurrent identical requests share one HTTP call"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            await asyncio.sleep(0)
+            return [{"symbol": "AAPL"}]
+
+        tools._fetch = fake_fetch
+
+        async def fetch_profiles():
+            return await asyncio.gather(
+                tools._make_request("profile", symbol="AAPL"),
+                tools._make_request("profile", symbol="AAPL"),
+            )
+
+        assert asyncio.run(fetch_profiles()) == [[{"symbol": "AAPL"}]] * 2
+        assert calls == ["profile/AAPL"]
+        assert tools._inflight == {}
+
+    def test_cancelled_request_releases_coalesced_callers(self):
+        """Test that callers sharing a cancelled request fail instead of hanging"""
+        tools = FinancialModelingPrepTools()
+
+        async def slow_fetch(endpoint, params):
+            await asyncio.sleep(5)
+
+        tools._fetch = slow_fetch
+
+        async def cancel_owner():
+            owner = asyncio.create_task(tools._make_request("profile", symbol="F"))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(tools._make_request("profile", symbol="F"))
+            await asyncio.sleep(0)
+            owner.cancel()
+            with pytest.raises(Exception, match="cancelled"):
+                await asyncio.wait_for(waiter, 1)
+
+        asyncio.run(cancel_owner())
+        assert tools._inflight == {}
+
+    def test_force_refresh_bypasses_response_cache(self):
+        """Test that force_refresh refetches and updates the cached response"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [{"companyName": f"Apple v{len(calls)}"}]
+
+        tools._fetch = fake_fetch
+
+        assert asyncio.run(tools.get_company_profile("AAPL")).company_name == "Apple v1"
+        assert asyncio.run(tools.get_company_profile("AAPL")).company_name == "Apple v1"
+        refreshed = asyncio.run(tools.get_company_profile("AAPL", force_refresh=True))
+        assert refreshed.company_name == "Apple v2"
+        assert asyncio.run(tools.get_company_profile("AAPL")).company_name == "Apple v2"
+        assert len(calls) == 2
+
+        # The financials batch forwards force_refresh to each symbol's requests
+        asyncio.run(tools.get_company_financials_batch(["AAPL"]))
+        fetched = len(calls)
+        asyncio.run(tools.get_company_financials_batch(["AAPL"], force_refresh=True))
+        assert len(calls) == fetched + 3
+
+    def test_resolved_symbols_are_cached(self):
+        """Test that repeated lookups of a symbol skip the API entirely"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [{"companyName": "Apple Inc.", "exchangeShortName": "NASDAQ"}]
+
+        tools._fetch = fake_fetch
+        tools._cache = None  # only the symbol cache may answer the repeat
+
+        first = asyncio.run(tools.search_symbol("aapl"))
+        second = asyncio.run(tools.search_symbol(" AAPL"))
+        assert first.found and second is first
+        assert calls == ["profile/AAPL"]
+
+    def test_name_search_also_caches_resolved_ticker(self):
+        """Test that a ticker found by name search is known without a lookup"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [{"symbol": "MSFT", "name": "Microsoft Corporation"}]
+
+        tools._fetch = fake_fetch
+
+        by_name = asyncio.run(tools.search_symbol("Microsoft"))
+        assert asyncio.run(tools.search_symbol("msft")) is by_name
+        assert calls == ["search"]
+
+    def test_only_ticker_shaped_queries_try_profile_lookup(self):
+        """Test that punctuated queries go straight to the name search"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [{"symbol": "BRK.B", "companyName": "Berkshire Hathaway"}]
+
+        tools._fetch = fake_fetch
+        tools._symbol_cache = None  # every query must reach the API
+
+        for query in ["S&P", "AAPL,", "BRK.B"]:
+            asyncio.run(tools.search_symbol(query))
+        assert calls == ["search", "search", "profile/BRK.B"]
+
+    def test_stock_prices_batched_into_one_quote_request(self):
+        """Test that multi-symbol prices use one comma-separated quote call"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [
+                {"symbol": "AAPL", "name": "Apple Inc.", "price": 150.0},
+                {"symbol": "MSFT", "name": "Microsoft", "price": 300.0},
+            ]
+
+        tools._fetch = fake_fetch
+
+        prices = asyncio.run(tools.get_stock_prices(["aapl", "MSFT", "TSLA"]))
+        assert calls == ["quote/AAPL,MSFT,TSLA"]
+        assert prices["AAPL"].price == 150.0
+        assert prices["MSFT"].success
+        assert not prices["TSLA"].success
+
+    def test_stock_price_skips_history_by_default(self):
+        """Test that a plain price lookup makes only the quote request"""
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            return [{"symbol": "AAPL", "price": 150.0}]
+
+        tools._fetch = fake_fetch
+
+        price = asyncio.run(tools.get_stock_price("AAPL"))
+        assert price.price == 150.0
+        assert price.trend_direction is None
+        assert calls == ["quote/AAPL"]
+
+        # Without analytics the formatted price has no trend section
+        text = FinancialAssistantWorkflow()._format_stock_price(price, "AAPL")
+        assert "5-Day Trend" not in text
+
+    def test_profiles_batched_in_chunks(self, monkeypatch):
+        """Test that batch profile requests are split into fixed-size chunks"""
+        monkeypatch.setattr("tools.financial_modeling_prep._BATCH_SIZE", 2)
+        tools = FinancialModelingPrepTools()
+        calls = []
+
+        async def fake_fetch(endpoint, params):
+            calls.append(endpoint)
+            symbols = endpoint.split("/", 1)[1].split(",")
+            return [{"symbol": s, "companyName": f"{s} Corp"} for s in symbols]
+
+        tools._fetch = fake_fetch
+
+        profiles = asyncio.run(tools.get_company_profiles(["a", "b", "c"]))
+        assert sorted(calls) == ["profile/A,B", "profile/C"]
+        assert profiles["C"].company_name == "C Corp"
+
+    def test_fetch_errors_returned_as_failed_results(self):
+        """Test that a failing request becomes an unsuccessful result"""
+        tools = FinancialModelingPrepTools()
+
+        async def fake_fetch(endpoint, params):
+            raise Exception("boom")
+
+        tools._fetch = fake_fetch
+
+        price = asyncio.run(tools.get_stock_price("aapl"))
+        assert not price.success
+        assert price.symbol == "AAPL"
+        assert price.error == "Failed to fetch stock price for AAPL: boom"
+
+        income = asyncio.run(tools.get_income_statement("aapl", period="quarter"))
+        assert income.period == "quarter"
+        assert income.error == "Failed to fetch income statement for AAPL: boom"
+
+        profiles = asyncio.run(tools.get_company_profiles(["aapl", "MSFT", "AAPL"]))
+        assert list(profiles) == ["AAPL", "MSFT"]
+        assert profiles["MSFT"].error == "Failed to fetch company profile for MSFT: boom"
+
 
 class TestWorkflowIntegration:
     """Test class for workflow integration"""
@@ -140,3 +706,346 @@ class TestWorkflowIntegration:
         assert hasattr(workflow.symbol_extraction_agent, "tools")
         if workflow.symbol_extraction_agent.tools:
             assert len(workflow.symbol_extraction_agent.tools) > 0
+
+    def test_session_storage_uses_wal_journal(self, tmp_path):
+        """Test that session storage connections run in WAL mode"""
+        from sqlalchemy import text
+        from workflow.financial_assistant import create_session_storage
+
+        storage = create_session_storage("sessions", str(tmp_path / "db" / "s.db"))
+        with storage.db_engine.connect() as connection:
+            mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+        assert mode == "wal"
+
+    def test_session_storage_round_trips_session_state(self, tmp_path):
+        """Test that session JSON columns encode and decode with the module codec"""
+        from agno.storage.session.workflow import WorkflowSession
+        from workflow.financial_assistant import _json_dumps, create_session_storage
+
+        storage = create_session_storage("sessions", str(tmp_path / "s.db"))
+        storage.mode = "workflow"
+        assert storage.db_engine.dialect._json_serializer is _json_dumps
+
+        state = {"messages": [{"role": "user", "content": "AAPL price"}]}
+        storage.upsert(
+            WorkflowSession(session_id="s1", session_data={"session_state": state})
+        )
+        loaded = storage.read("s1")
+        assert loaded.session_data["session_state"] == state
+
+    def test_companies_discussed_kept_unique_and_capped(self, monkeypatch):
+        """Test that companies_discussed is an MRU list of unique symbols"""
+        import workflow.financial_assistant as module
+
+        monkeypatch.setattr(module, "_MAX_COMPANIES_DISCUSSED", 3)
+        workflow = FinancialAssistantWorkflow()
+
+        workflow._add_companies("AAPL", "MSFT")
+        workflow._add_companies("TSLA", "AAPL")
+        assert workflow.session_state["companies_discussed"] == ["MSFT", "TSLA", "AAPL"]
+
+        workflow._add_companies("NVDA")
+        assert workflow.session_state["companies_discussed"] == ["TSLA", "AAPL", "NVDA"]
+
+    def test_chat_stream_relays_text_as_it_arrives(self):
+        """Test that streamed chat deltas are yielded cumulatively and persisted"""
+        from agno.run.response import RunResponseCompletedEvent, RunResponseContentEvent
+
+        workflow = FinancialAssistantWorkflow(stream=True)
+        assert workflow.chat_agent.response_model is None
+
+        def fake_chat(*args, **kwargs):
+            yield RunResponseContentEvent(content="A P/E ratio ")
+            yield RunResponseContentEvent(content="compares price to earnings.")
+            yield RunResponseCompletedEvent(content="ignored full text")
+
+        workflow.chat_agent.run = fake_chat
+
+        chunks = [r.content for r in workflow._run_chat_flow("What is a P/E ratio?")]
+        assert chunks == [
+            "A P/E ratio ",
+            "A P/E ratio compares price to earnings.",
+        ]
+        stored = workflow.session_state["messages"][-1]
+        assert stored["content"] == "A P/E ratio compares price to earnings."
+
+    def test_background_summary_keeps_messages_added_during_call(self, monkeypatch):
+        """Test that a background summary leaves later messages for the next one"""
+        import threading
+
+        monkeypatch.setattr("workflow.financial_assistant._TRIVIAL_SUMMARY_CHARS", 0)
+        workflow = FinancialAssistantWorkflow()
+        started, release = threading.Event(), threading.Event()
+
+        def slow_summary(context, **kwargs):
+            started.set()
+            release.wait(5)
+            return SimpleNamespace(content=SimpleNamespace(summary="summary"))
+
+        workflow.summary_agent.run = slow_summary
+
+        workflow._append_message(role="user", content="first")
+        workflow._schedule_summary_update()
+        assert started.wait(5)
+
+        # The turn carries on while the summary call is in flight
+        workflow._append_message(role="user", content="second")
+        release.set()
+        workflow._summary_future.result(5)
+
+        assert workflow.session_state["conversation_summary"].summary == "summary"
+        assert workflow.session_state["last_summary_message_count"] == 1
+        assert workflow._pending_summary_lines == ["- User: second"]
+
+    def test_summary_landing_after_turn_stores_session(self, monkeypatch):
+        """Test that a turn ends without waiting and its late summary is stored"""
+        import threading
+
+        monkeypatch.setattr("workflow.financial_assistant._TRIVIAL_SUMMARY_CHARS", 0)
+        workflow = FinancialAssistantWorkflow()
+        release = threading.Event()
+        stored = []
+
+        def slow_summary(context, **kwargs):
+            # Still running when the turn's response is complete
+            release.wait(5)
+            return SimpleNamespace(content=SimpleNamespace(summary="summary"))
+
+        async def fake_fetch(endpoint, params):
+            return [{"symbol": "TSLA", "price": 250.0}]
+
+        async def fake_history(symbol, days, force_refresh=False):
+            return []
+
+        workflow.summary_agent.run = slow_summary
+        workflow.fmp_tools._fetch = fake_fetch
+        workflow.fmp_tools._get_recent_history = fake_history
+        workflow.write_to_storage = lambda: stored.append(
+            workflow.session_state["conversation_summary"]
+        )
+
+        # Agno's end-of-run write goes out before the summary lands
+        list(workflow.run(message="TSLA stock price"))
+        assert stored == [None]
+
+        release.set()
+        workflow._summary_future.result(5)
+        assert [summary.summary for summary in stored[1:]] == ["summary"]
+
+        workflow.close()
+        assert workflow._summary_executor._shutdown
+
+    def test_summaries_skipped_when_disabled(self):
+        """Test that no summary update runs with session summaries turned off"""
+        from config.settings import Settings
+
+        workflow = FinancialAssistantWorkflow(
+            settings=Settings(enable_session_summaries=False)
+        )
+
+        def fail_summary(*args, **kwargs):
+            raise AssertionError("summary agent should not run")
+
+        workflow.summary_agent.run = fail_summary
+        workflow._append_message(role="user", content="first")
+        workflow._schedule_summary_update()
+
+        assert workflow._summary_future is None
+        assert workflow.session_state["conversation_summary"] is None
+
+    def test_explicit_ticker_prefetched_during_symbol_extraction(self):
+        """Test that data for a spelled-out ticker is fetched on the prefetch thread"""
+        import threading
+
+        from config.settings import Settings
+        from models.schemas import Extraction
+
+        # Without the response cache every request reaches the fake endpoint
+        settings = Settings(enable_data_caching=False)
+        workflow = FinancialAssistantWorkflow(settings=settings)
+        workflow.summary_agent.run = lambda *args, **kwargs: SimpleNamespace(
+            content=SimpleNamespace(summary="summary")
+        )
+        fetch_threads = []
+
+        async def fake_fetch(endpoint, params):
+            fetch_threads.append(threading.current_thread().name)
+            return [{"symbol": "TSLA", "price": 250.0}]
+
+        workflow.fmp_tools._fetch = fake_fetch
+
+        def extract(symbol):
+            workflow.symbol_extraction_agent.run = lambda *args, **kwargs: (
+                SimpleNamespace(content=Extraction(symbol=symbol))
+            )
+
+        # The extraction agent confirms the guess: its data is used as is
+        extract("TSLA")
+        responses = list(
+            workflow._run_alone_flow("Where does $TSLA trade?", "stock_price")
+        )
+        assert "Stock Price - TSLA" in responses[-1].content
+        assert fetch_threads
+        assert all(name.startswith("fmp-prefetch") for name in fetch_threads)
+
+        # A wrong guess is discarded and the resolved symbol fetched directly
+        fetch_threads.clear()
+        extract("TSLA")
+        responses = list(
+            workflow._run_alone_flow("Compare $F with that EV maker", "stock_price")
+        )
+        assert "Stock Price - TSLA" in responses[-1].content
+        assert threading.current_thread().name in fetch_threads
+
+        # Symbols known without the extraction agent are not prefetched
+        fetch_threads.clear()
+        message = "Where is $F listed?"
+        cache_key = (message, workflow.session_state.get("last_symbol"))
+        workflow._extracted_symbols[cache_key] = ("F", ())
+        list(workflow._run_alone_flow(message, "stock_price"))
+        assert set(fetch_threads) == {threading.current_thread().name}
+        workflow.close()
+
+    def test_report_prefetch_abandoned_without_symbol(self):
+        """Test that a report for an unknown ticker stops its prefetch"""
+        from models.schemas import Extraction
+
+        workflow = FinancialAssistantWorkflow()
+        workflow.symbol_extraction_agent.run = lambda *args, **kwargs: (
+            SimpleNamespace(content=Extraction(symbol="UNKNOWN"))
+        )
+        started = []
+        start_prefetch = workflow._start_prefetch
+
+        def recording_start(*args):
+            started.append(start_prefetch(*args))
+            return started[-1]
+
+        workflow._start_prefetch = recording_start
+
+        responses = list(workflow._run_report_flow("Full report on ZZZZ"))
+        assert "Could not extract a valid stock symbol" in responses[-1].content
+        assert started[0].guess == "ZZZZ"
+        assert started[0]._abandoned.is_set()
+
+        # Symbols known without the extraction agent are not prefetched (the
+        # remembered result names no symbol, so the flow fetches nothing)
+        started.clear()
+        message = "Full report on $F"
+        workflow._extracted_symbols[(message, None)] = ("UNKNOWN", ())
+        list(workflow._run_report_flow(message))
+        assert started == [None]
+        workflow.close()
+
+    def test_abandoned_prefetch_cancels_running_fetch(self):
+        """Test that a wrong guess stops its fetch instead of letting it finish"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from workflow.financial_assistant import _Prefetch
+
+        started, cancelled = threading.Event(), threading.Event()
+
+        async def slow_fetch():
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        prefetch = _Prefetch("F", slow_fetch, executor)
+        assert started.wait(5)
+        prefetch.abandon()
+        assert cancelled.wait(5)
+        executor.shutdown()
+
+    def test_repeated_request_reuses_extracted_symbol(self):
+        """Test that the extraction agent runs once for a repeated request"""
+        from models.schemas import Extraction
+
+        workflow = FinancialAssistantWorkflow()
+        calls = []
+
+        def extract(*args, **kwargs):
+            calls.append(args)
+            return SimpleNamespace(content=Extraction(symbol="MSFT"))
+
+        workflow.symbol_extraction_agent.run = extract
+
+        for _ in range(2):
+            symbol, symbols = yield_from_result(
+                workflow._resolve_symbols("How is Microsoft doing?", None)
+            )
+            assert (symbol, symbols) == ("MSFT", [])
+        assert len(calls) == 1
+
+        # Unresolved requests are not remembered
+        workflow.symbol_extraction_agent.run = lambda *args, **kwargs: (
+            SimpleNamespace(content=Extraction(symbol="UNKNOWN"))
+        )
+        responses = []
+        assert yield_from_result(
+            workflow._resolve_symbols("How is it doing?", None), responses
+        ) == (None, [])
+        assert "Could not extract a valid stock symbol" in responses[-1].content
+
+    def test_streamed_report_grows_section_by_section(self):
+        """Test that a streaming report run yields the report so far per section"""
+        from tools import financial_modeling_prep as fmp
+
+        workflow = FinancialAssistantWorkflow(stream=True)
+        results = [fmp._INCOME_FAILED, fmp._FINANCIALS_FAILED, fmp._STOCK_PRICE_FAILED]
+        workflow._fetch_report_data = lambda symbol: results
+
+        chunks = [r.content for r in workflow._run_report_flow("AAPL report", "AAPL")]
+
+        assert len(chunks) == 5
+        assert all(
+            later.startswith(earlier) for earlier, later in zip(chunks, chunks[1:])
+        )
+        assert workflow.session_state["messages"][-1]["content"] == chunks[-1]
+        assert "## Analysis Summary" in chunks[-1]
+
+    def test_follow_up_reuses_last_symbol_without_extraction(self):
+        """Test that a pronoun follow-up keeps the last symbol without the LLM"""
+        from models.schemas import Extraction
+        from workflow.financial_assistant import _refers_to_previous_company
+
+        workflow = FinancialAssistantWorkflow()
+        workflow.session_state["last_symbol"] = "AAPL"
+        calls = []
+
+        def extract(*args, **kwargs):
+            calls.append(args)
+            return SimpleNamespace(content=Extraction(symbol="MSFT"))
+
+        workflow.symbol_extraction_agent.run = extract
+
+        result = yield_from_result(
+            workflow._resolve_symbols("Show me its income statement", None)
+        )
+        assert result == ("AAPL", [])
+        assert calls == []
+
+        # Naming another company still goes to the extraction agent
+        result = yield_from_result(
+            workflow._resolve_symbols("Compare it to Microsoft", None)
+        )
+        assert result == ("MSFT", [])
+        assert len(calls) == 1
+
+        # Lowercase company names are not mistaken for the previous company
+        assert _refers_to_previous_company("what about its P/E?")
+        assert not _refers_to_previous_company("what about tesla, is it overvalued?")
+        assert not _refers_to_previous_company("How is it doing compared to amazon?")
+
+        # After a multi-company turn plural pronouns cover every company, and
+        # a singular one is left to the extraction agent
+        workflow._remember_symbols(["AAPL", "MSFT"])
+        assert workflow._known_symbols("What are their P/E ratios?") == (
+            "AAPL",
+            ["AAPL", "MSFT"],
+        )
+        assert workflow._known_symbols("What is its P/E ratio?") is None
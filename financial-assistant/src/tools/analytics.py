@@ -0,0 +1,235 @@
+"""
+Price History Analytics
+
+This module implements the trend and volatility analytics for recent daily
+price history as vectorized NumPy kernels. Histories for many symbols are
+stacked into one (N_symbols, T_days) matrix and processed in a single call.
+When Numba is installed the numeric kernel is JIT-compiled instead.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional, the NumPy kernel is used instead
+    numba = None
+
+# Number of most recent trading days the analytics look at
+ANALYTICS_WINDOW = 5
+
+KernelResult = Tuple[
+    np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray
+]
+
+
+def _stack(
+    histories: Sequence[List[Dict[str, Any]]], key: str, window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack one field of several histories into a NaN-padded matrix
+
+    Records with a missing or zero value are skipped, so each row holds that
+    symbol's valid values left-aligned (most recent first).
+
+    Returns:
+        Tuple of (values matrix of shape (N, window), valid counts of shape (N,))
+    """
+    values = np.full((len(histories), window), np.nan)
+    counts = np.zeros(len(histories), dtype=np.int64)
+    for row, history in enumerate(histories):
+        picked = [day[key] for day in history[:window] if day.get(key)]
+        values[row, : len(picked)] = picked
+        counts[row] = len(picked)
+    return values, counts
+
+
+def _numpy_kernel(
+    closes: np.ndarray,
+    n_closes: np.ndarray,
+    volumes: np.ndarray,
+    n_volumes: np.ndarray,
+    current: np.ndarray,
+) -> KernelResult:
+    """
+    Vectorized analytics over NaN-padded (N, window) close and volume matrices
+
+    Returns:
+        Per-row arrays of (change percent, up-day ratio, volatility percent,
+        return count, recent volume average, older volume average)
+    """
+    rows = np.arange(len(closes))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Change versus the oldest valid close in the window
+        oldest = closes[rows, np.maximum(n_closes - 1, 0)]
+        change = np.where(oldest > 0, (current - oldest) / oldest * 100, 0.0)
+
+        # Up days: a close above the previous day's (NaN padding compares False)
+        total_days = np.maximum(n_closes - 1, 1)
+        up_ratio = (closes[:, :-1] > closes[:, 1:]).sum(axis=1) / total_days
+
+        # Volatility: population std of daily returns, in percent
+        returns = (closes[:, :-1] - closes[:, 1:]) / closes[:, 1:]
+        valid_returns = ~np.isnan(returns)
+        n_returns = valid_returns.sum(axis=1)
+        mean_return = np.where(valid_returns, returns, 0.0).sum(axis=1) / np.maximum(
+            n_returns, 1
+        )
+        sq_dev = np.where(valid_returns, (returns - mean_return[:, None]) ** 2, 0.0)
+        volatility = np.sqrt(sq_dev.sum(axis=1) / np.maximum(n_returns, 1)) * 100
+
+        # Volume trend: last two days versus the rest of the window
+        recent, older = volumes[:, :2], volumes[:, 2:]
+        recent_avg = np.nansum(recent, axis=1) / np.maximum(
+            (~np.isnan(recent)).sum(axis=1), 1
+        )
+        older_avg = np.nansum(older, axis=1) / np.maximum(
+            (~np.isnan(older)).sum(axis=1), 1
+        )
+
+    return change, up_ratio, volatility, n_returns, recent_avg, older_avg
+
+
+def _loop_kernel(
+    closes: np.ndarray,
+    n_closes: np.ndarray,
+    volumes: np.ndarray,
+    n_volumes: np.ndarray,
+    current: np.ndarray,
+) -> KernelResult:
+    """
+    Same computation as _numpy_kernel written as plain loops for Numba
+
+    Rows hold their valid values left-aligned, so the counts bound each loop
+    and no NaN checks are needed.
+    """
+    n_rows = closes.shape[0]
+    change = np.zeros(n_rows)
+    up_ratio = np.zeros(n_rows)
+    volatility = np.zeros(n_rows)
+    n_returns = np.zeros(n_rows, dtype=np.int64)
+    recent_avg = np.zeros(n_rows)
+    older_avg = np.zeros(n_rows)
+
+    for i in range(n_rows):
+        n = n_closes[i]
+        if n > 0:
+            oldest = closes[i, n - 1]
+            if oldest > 0:
+                change[i] = (current[i] - oldest) / oldest * 100
+
+        up_days = 0
+        mean_return = 0.0
+        for j in range(n - 1):
+            if closes[i, j] > closes[i, j + 1]:
+                up_days += 1
+            mean_return += (closes[i, j] - closes[i, j + 1]) / closes[i, j + 1]
+        up_ratio[i] = up_days / max(n - 1, 1)
+
+        if n > 1:
+            n_returns[i] = n - 1
+            mean_return /= n - 1
+            sq_dev = 0.0
+            for j in range(n - 1):
+                r = (closes[i, j] - closes[i, j + 1]) / closes[i, j + 1]
+                sq_dev += (r - mean_return) ** 2
+            volatility[i] = np.sqrt(sq_dev / (n - 1)) * 100
+
+        m = n_volumes[i]
+        recent_sum = 0.0
+        older_sum = 0.0
+        for j in range(m):
+            if j < 2:
+                recent_sum += volumes[i, j]
+            else:
+                older_sum += volumes[i, j]
+        recent_avg[i] = recent_sum / max(min(m, 2), 1)
+        older_avg[i] = older_sum / max(m - 2, 1)
+
+    return change, up_ratio, volatility, n_returns, recent_avg, older_avg
+
+
+if numba is not None:
+    # Eager signature: compiled (or loaded from the on-disk cache) at import
+    _kernel = numba.njit(
+        "Tuple((f8[:], f8[:], f8[:], i8[:], f8[:], f8[:]))"
+        "(f8[:, :], i8[:], f8[:, :], i8[:], f8[:])",
+        cache=True,
+        fastmath=True,
+    )(_loop_kernel)
+else:
+    _kernel = _numpy_kernel
+
+
+def batch_analytics(
+    histories: Sequence[List[Dict[str, Any]]],
+    current_prices: Sequence[float],
+    window: int = ANALYTICS_WINDOW,
+) -> List[Dict[str, Any]]:
+    """
+    Compute trend and volatility analytics for several symbols at once
+
+    Args:
+        histories: Daily price records per symbol (most recent first)
+        current_prices: Current price per symbol, aligned with histories
+        window: Number of most recent trading days to analyze
+
+    Returns:
+        Per-symbol dicts with trend_direction, trend_strength,
+        five_day_change_percent, volatility and volume_trend
+    """
+    if not histories:
+        return []
+
+    closes, n_closes = _stack(histories, "close", window)
+    volumes, n_volumes = _stack(histories, "volume", window)
+    current = np.asarray(current_prices, dtype=np.float64)
+    change, up_ratio, volatility, n_returns, recent_avg, older_avg = _kernel(
+        closes, n_closes, volumes, n_volumes, current
+    )
+
+    results = []
+    for i in range(len(histories)):
+        result: Dict[str, Any] = {
+            "trend_direction": "neutral",
+            "trend_strength": 0,
+            "five_day_change_percent": 0,
+            "volatility": 0,
+            "volume_trend": "stable",
+        }
+
+        if n_closes[i] >= 2:
+            change_i = float(change[i])
+            if n_closes[i] >= 3:
+                ratio = float(up_ratio[i])
+                if ratio >= 0.6:
+                    direction, strength = "bullish", min(ratio, 1.0)
+                elif ratio <= 0.4:
+                    direction, strength = "bearish", min(1 - ratio, 1.0)
+                else:
+                    direction, strength = "neutral", 0.5
+            elif change_i > 2:
+                direction, strength = "bullish", min(abs(change_i) / 10, 1.0)
+            elif change_i < -2:
+                direction, strength = "bearish", min(abs(change_i) / 10, 1.0)
+            else:
+                direction, strength = "neutral", 0.5
+            result.update(
+                trend_direction=direction,
+                trend_strength=round(strength, 2),
+                five_day_change_percent=round(change_i, 2),
+            )
+
+        # Volatility needs at least three days of history
+        if len(histories[i]) >= 3:
+            if n_closes[i] >= 3 and n_returns[i]:
+                result["volatility"] = round(float(volatility[i]), 2)
+            if n_volumes[i] >= 3:
+                if recent_avg[i] > older_avg[i] * 1.2:
+                    result["volume_trend"] = "increasing"
+                elif recent_avg[i] < older_avg[i] * 0.8:
+                    result["volume_trend"] = "decreasing"
+
+        results.append(result)
+    return results
@@ -0,0 +1,239 @@
+"""
+API Response Cache
+
+This module implements a small in-memory LRU cache with per-endpoint TTLs
+used by FinancialModelingPrepTools to avoid repeating identical API requests,
+and a SQLite-backed variant that keeps responses across restarts.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Time-to-live in seconds by endpoint prefix (the part before the first "/")
+DEFAULT_ENDPOINT_TTLS: Dict[str, float] = {
+    "profile": 3600,
+    "quote": 15,
+    "income-statement": 86400,
+    "key-metrics": 3600,
+    "ratios": 3600,
+    "search": 600,
+    "historical-price-full": 3600,
+}
+
+
+class APICache:
+    """
+    LRU cache of API responses keyed on (endpoint, params)
+
+    Entries expire after a TTL chosen by endpoint prefix; the least recently
+    used entry is evicted once the cache grows past max_entries.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float,
+        max_entries: int = 1024,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.endpoint_ttls = (
+            DEFAULT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+        )
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Tool calls may run on different threads' event loops
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """
+        Build a stable cache key for an endpoint and its query parameters
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Optional query parameters (excluding the API key)
+
+        Returns:
+            Hashable (endpoint, sorted params) tuple identifying the request
+        """
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the time-to-live in seconds for an endpoint"""
+        prefix = endpoint.split("/", 1)[0]
+        return self.endpoint_ttls.get(prefix, self.default_ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached payload if present and not expired
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached payload, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: Hashable, payload: Any, ttl: float) -> None:
+        """
+        Store a payload, evicting the least recently used entries if full
+
+        Args:
+            key: Cache key from make_key
+            payload: Decoded API response
+            ttl: Time-to-live in seconds
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(APICache):
+    """
+    APICache backed by a SQLite file so responses survive restarts
+
+    Hits are served from the in-memory LRU. Misses fall through to the
+    database, whose rows carry wall-clock expiry times; payloads that are not
+    JSON-serializable are kept in memory only.
+
+    Writes are queued and committed in batches on a background writer thread,
+    so set() never waits on the disk; flush() writes the queue out at once.
+    Expired rows are pruned when the file is opened.
+    """
+
+    def __init__(
+        self,
+        db_file: str,
+        default_ttl: float,
+        max_entries: int = 1024,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+    ):
+        super().__init__(default_ttl, max_entries, endpoint_ttls)
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(db_file, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS api_cache ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._db.execute("DELETE FROM api_cache WHERE expires_at <= ?", (time.time(),))
+        self._db.commit()
+        self._db_lock = threading.Lock()
+
+        # (payload, expires_at) rows not yet written, by database key; a flush
+        # is queued on the writer thread whenever the first one arrives
+        self._pending: Dict[str, Tuple[str, float]] = {}
+        self._pending_lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-cache"
+        )
+
+    @staticmethod
+    def _db_key(key: Hashable) -> str:
+        """Serialize a make_key tuple into the database key"""
+        return json.dumps(key)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached payload from memory, falling back to the database
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached payload, or None on a miss
+        """
+        payload = super().get(key)
+        if payload is not None:
+            return payload
+
+        db_key = self._db_key(key)
+        with self._pending_lock:
+            row = self._pending.get(db_key)
+        if row is None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT payload, expires_at FROM api_cache WHERE key = ?",
+                    (db_key,),
+                ).fetchone()
+            if row is None:
+                return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            return None
+
+        payload = json.loads(row[0])
+        super().set(key, payload, remaining)
+        return payload
+
+    def set(self, key: Hashable, payload: Any, ttl: float) -> None:
+        """
+        Store a payload in memory and, if JSON-serializable, in the database
+
+        Args:
+            key: Cache key from make_key
+            payload: Decoded API response
+            ttl: Time-to-live in seconds
+        """
+        super().set(key, payload, ttl)
+        try:
+            data = json.dumps(payload)
+        except TypeError:
+            return
+        with self._pending_lock:
+            queue_flush = not self._pending
+            self._pending[self._db_key(key)] = (data, time.time() + ttl)
+        if queue_flush:
+            self._writer.submit(self.flush)
+
+    def flush(self) -> None:
+        """Write the queued rows to the database in a single transaction"""
+        with self._db_lock:
+            with self._pending_lock:
+                rows = [(key, *row) for key, row in self._pending.items()]
+                self._pending.clear()
+            if rows:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO api_cache (key, payload, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all cached entries from memory and the database"""
+        super().clear()
+        with self._db_lock:
+            with self._pending_lock:
+                self._pending.clear()
+            self._db.execute("DELETE FROM api_cache")
+            self._db.commit()
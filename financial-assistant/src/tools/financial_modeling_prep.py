@@ -6,13 +6,35 @@ integration with the Financial Modeling Prep API for fetching financial data.
 """
 
 import asyncio
+import contextlib
+import copy
+import functools
+import importlib.util
+import inspect
 import json
+import string
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-import aiohttp
+import httpx
 from agno.tools.toolkit import Toolkit
+from pydantic import BaseModel
 from config.settings import Settings
+from tools.analytics import ANALYTICS_WINDOW, batch_analytics
+from tools.cache import APICache, SQLiteCache
+from tools.rate_limit import RETRY_STATUSES, TokenBucket, retry_delay
 from models.schemas import (
     IncomeStatementData,
     CompanyFinancialsData,
@@ -21,6 +43,328 @@ from models.schemas import (
     SymbolSearchResult
 )
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib decoder
+    _json_loads = json.loads
+
+try:
+    import ijson
+
+    # Malformed or truncated history bodies from the incremental parser
+    _STREAM_PARSE_ERRORS: Tuple[Type[Exception], ...] = (ijson.JSONError,)
+except ImportError:  # ijson is optional, history is then decoded in one go
+    ijson = None
+    _STREAM_PARSE_ERRORS = ()
+
+# Number of trading days used for the price trend and volatility analytics
+_HISTORY_DAYS = ANALYTICS_WINDOW
+
+# API endpoints by name; {symbol} is filled in per request
+_ENDPOINTS: Dict[str, str] = {
+    "profile": "profile/{symbol}",
+    "quote": "quote/{symbol}",
+    "income_statement": "income-statement/{symbol}",
+    "key_metrics": "key-metrics/{symbol}",
+    "ratios": "ratios/{symbol}",
+    "historical_price": "historical-price-full/{symbol}",
+    "search": "search",
+}
+
+# Ticker-shaped queries (e.g. "AAPL", "BRK.B") are tried as a symbol first;
+# translate() with this table leaves only the characters a ticker can't have
+_TICKER_MAX_LENGTH = 5
+_TICKER_STRIP = str.maketrans("", "", string.ascii_letters + ".-")
+
+# Symbols per comma-separated quote/profile batch request
+_BATCH_SIZE = 100
+
+# Resolved symbols rarely change; misses are kept briefly so that a
+# company that was not found is retried soon after
+_SYMBOL_FOUND_TTL = 24 * 3600
+_SYMBOL_NOT_FOUND_TTL = 60
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); otherwise use HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection attempts retried when opening a pooled connection fails (e.g. a
+# dropped keep-alive socket or a transient DNS/TCP error); the request itself
+# is only sent once
+_CONNECT_RETRIES = 2
+
+# Extra attempts for requests answered 429 or a transient 5xx
+_STATUS_RETRIES = 2
+
+# httpx sets Accept-Encoding itself, listing br once httpx[brotli] is installed
+_REQUEST_HEADERS = {"Accept": "application/json"}
+
+# Field values for unsuccessful results (no data returned or fetch failed)
+_INCOME_DEFAULTS: Dict[str, Any] = dict(
+    date="Unknown",
+    revenue=0,
+    gross_profit=0,
+    operating_income=0,
+    net_income=0,
+    eps=0,
+    gross_profit_ratio=0,
+    operating_income_ratio=0,
+    net_income_ratio=0,
+    research_and_development=0,
+    total_operating_expenses=0,
+    success=False,
+)
+_FINANCIALS_DEFAULTS: Dict[str, Any] = dict(
+    company_name="Unknown",
+    market_cap=0,
+    beta=0,
+    pe_ratio=0,
+    price_to_book=0,
+    price_to_sales=0,
+    debt_to_equity=0,
+    current_ratio=0,
+    quick_ratio=0,
+    roe=0,
+    roa=0,
+    revenue_growth=0,
+    gross_margin=0,
+    operating_margin=0,
+    net_margin=0,
+    enterprise_value=0,
+    working_capital=0,
+    date="Unknown",
+    success=False,
+)
+_STOCK_PRICE_DEFAULTS: Dict[str, Any] = dict(
+    name="Unknown",
+    price=0,
+    change=0,
+    change_percent=0,
+    previous_close=0,
+    open=0,
+    high=0,
+    low=0,
+    volume=0,
+    avg_volume=0,
+    market_cap=0,
+    pe_ratio=0,
+    eps=0,
+    fifty_two_week_high=0,
+    fifty_two_week_low=0,
+    exchange="Unknown",
+    timestamp=0,
+    success=False,
+)
+_PROFILE_DEFAULTS: Dict[str, Any] = dict(
+    company_name="Unknown",
+    description="No description available",
+    industry="Unknown",
+    sector="Unknown",
+    website="",
+    ceo="Unknown",
+    employees=0,
+    country="Unknown",
+    exchange="Unknown",
+    currency="USD",
+    success=False,
+)
+
+# (model field, FMP response key, default) tables for successful results
+_INCOME_FIELDS = (
+    ("date", "date", "Unknown"),
+    ("revenue", "revenue", 0),
+    ("gross_profit", "grossProfit", 0),
+    ("operating_income", "operatingIncome", 0),
+    ("net_income", "netIncome", 0),
+    ("eps", "eps", 0),
+    ("gross_profit_ratio", "grossProfitRatio", 0),
+    ("operating_income_ratio", "operatingIncomeRatio", 0),
+    ("net_income_ratio", "netIncomeRatio", 0),
+    ("research_and_development", "researchAndDevelopmentExpenses", 0),
+    ("total_operating_expenses", "totalOperatingExpenses", 0),
+)
+_FINANCIALS_PROFILE_FIELDS = (
+    ("company_name", "companyName", "Unknown"),
+    ("market_cap", "mktCap", 0),
+    ("beta", "beta", 0),
+)
+_FINANCIALS_METRICS_FIELDS = (
+    ("pe_ratio", "peRatio", 0),
+    ("revenue_growth", "revenueGrowth", 0),
+    ("enterprise_value", "enterpriseValue", 0),
+    ("working_capital", "workingCapital", 0),
+    ("date", "date", "Unknown"),
+)
+_FINANCIALS_RATIOS_FIELDS = (
+    ("price_to_book", "priceToBookRatio", 0),
+    ("price_to_sales", "priceToSalesRatio", 0),
+    ("debt_to_equity", "debtEquityRatio", 0),
+    ("current_ratio", "currentRatio", 0),
+    ("quick_ratio", "quickRatio", 0),
+    ("roe", "returnOnEquity", 0),
+    ("roa", "returnOnAssets", 0),
+    ("gross_margin", "grossProfitMargin", 0),
+    ("operating_margin", "operatingProfitMargin", 0),
+    ("net_margin", "netProfitMargin", 0),
+)
+_QUOTE_FIELDS = (
+    ("name", "name", "Unknown"),
+    ("price", "price", 0),
+    ("change", "change", 0),
+    ("change_percent", "changesPercentage", 0),
+    ("previous_close", "previousClose", 0),
+    ("open", "open", 0),
+    ("high", "dayHigh", 0),
+    ("low", "dayLow", 0),
+    ("volume", "volume", 0),
+    ("avg_volume", "avgVolume", 0),
+    ("market_cap", "marketCap", 0),
+    ("pe_ratio", "pe", 0),
+    ("eps", "eps", 0),
+    ("fifty_two_week_high", "yearHigh", 0),
+    ("fifty_two_week_low", "yearLow", 0),
+    ("exchange", "exchange", "Unknown"),
+)
+_PROFILE_FIELDS = (
+    ("company_name", "companyName", "Unknown"),
+    ("description", "description", "No description available"),
+    ("industry", "industry", "Unknown"),
+    ("sector", "sector", "Unknown"),
+    ("website", "website", ""),
+    ("ceo", "ceo", "Unknown"),
+    ("employees", "fullTimeEmployees", 0),
+    ("country", "country", "Unknown"),
+    ("exchange", "exchangeShortName", "Unknown"),
+    ("currency", "currency", "USD"),
+)
+
+# Unsuccessful results are copies of these validated templates with the symbol
+# and error filled in, so building one skips field validation entirely
+_INCOME_FAILED = IncomeStatementData(symbol="", period="", **_INCOME_DEFAULTS)
+_FINANCIALS_FAILED = CompanyFinancialsData(symbol="", **_FINANCIALS_DEFAULTS)
+_STOCK_PRICE_FAILED = StockPriceData(symbol="", **_STOCK_PRICE_DEFAULTS)
+_PROFILE_FAILED = CompanyProfileData(symbol="", **_PROFILE_DEFAULTS)
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+def _failed(template: _Model, **update: Any) -> _Model:
+    """Copy an unsuccessful-result template with the given fields replaced"""
+    return template.model_copy(update=update)
+
+
+def _fetch_failed(
+    template: _Model, label: str, symbol: str, error: Exception, **update: Any
+) -> _Model:
+    """Copy a failure template with the "Failed to fetch ..." error for symbol"""
+    return _failed(
+        template,
+        symbol=symbol,
+        error=f"Failed to fetch {label} for {symbol}: {str(error)}",
+        **update,
+    )
+
+
+def _fmp_tool(
+    template: BaseModel, label: str, fixed: Tuple[str, ...] = ()
+) -> Callable:
+    """
+    Turn exceptions raised by a tool method into failure results
+
+    The decorated coroutine takes a ticker symbol, or a list of them for the
+    batch methods, as its first argument. Any exception it raises is returned
+    as a copy of `template` carrying the "Failed to fetch {label} for {SYMBOL}"
+    error instead; batch methods get one such copy per upper-cased symbol.
+
+    Args:
+        template: Unsuccessful-result template for the method's model
+        label: Data description used in the error message
+        fixed: Method arguments also copied onto the failure result
+    """
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, symbols: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await method(self, symbols, *args, **kwargs)
+            except Exception as e:
+                update = {}
+                if fixed:
+                    bound = signature.bind(self, symbols, *args, **kwargs)
+                    bound.apply_defaults()
+                    update = {name: bound.arguments[name] for name in fixed}
+                if isinstance(symbols, str):
+                    return _fetch_failed(template, label, symbols.upper(), e, **update)
+                return {
+                    symbol: _fetch_failed(template, label, symbol, e, **update)
+                    for symbol in dict.fromkeys(symbol.upper() for symbol in symbols)
+                }
+
+        return wrapper
+
+    return decorator
+
+
+# (model field, FMP key, default) rows describing how a record is mapped
+_FieldTable = Tuple[Tuple[str, str, Any], ...]
+_Mapper = Callable[..., Dict[str, Any]]
+
+# Field-table default meaning "fall back to the caller's value for this field"
+_FROM_CALLER = object()
+
+
+def _looks_like_ticker(query: str) -> bool:
+    """Check whether a query is shaped like a ticker symbol (ASCII letters, . or -)"""
+    return (
+        0 < len(query) <= _TICKER_MAX_LENGTH
+        and query[0] in string.ascii_letters
+        and not query.translate(_TICKER_STRIP)
+    )
+
+
+def _compile_mapper(fields: _FieldTable) -> _Mapper:
+    """
+    Generate a function renaming an FMP record's camelCase keys to model fields
+
+    The generated function builds one dict literal with every lookup and
+    default inlined, e.g. {'revenue': record.get('revenue', 0), ...}, so no
+    field table is walked per record.
+
+    Args:
+        fields: (model field, FMP key, default) rows; defaults must be literals
+            or _FROM_CALLER to read the default from the `fallback` argument
+
+    Returns:
+        Function of (record, fallback=None) returning the model field values
+    """
+    items = []
+    for field, key, default in fields:
+        if default is _FROM_CALLER:
+            value = f"fallback[{field!r}]"
+        elif isinstance(default, (str, int, float)):
+            value = repr(default)
+        else:
+            raise TypeError(f"Default for {field} must be a literal, got {default!r}")
+        items.append(f"{field!r}: record.get({key!r}, {value})")
+    source = (
+        "def map_record(record, fallback=None):\n"
+        f"    return {{{', '.join(items)}}}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<fmp-field-mapper>", "exec"), namespace)
+    return namespace["map_record"]
+
+
+_MAP_INCOME = _compile_mapper(_INCOME_FIELDS + (("period", "period", _FROM_CALLER),))
+_MAP_FINANCIALS_PROFILE = _compile_mapper(_FINANCIALS_PROFILE_FIELDS)
+_MAP_FINANCIALS_METRICS = _compile_mapper(_FINANCIALS_METRICS_FIELDS)
+_MAP_FINANCIALS_RATIOS = _compile_mapper(_FINANCIALS_RATIOS_FIELDS)
+_MAP_QUOTE = _compile_mapper(_QUOTE_FIELDS)
+_MAP_PROFILE = _compile_mapper(_PROFILE_FIELDS)
+
 
 class FinancialModelingPrepTools(Toolkit):
     """
@@ -52,6 +396,44 @@ class FinancialModelingPrepTools(Toolkit):
 
         self.base_url = "https://financialmodelingprep.com/api/v3"
         self.timeout = settings.request_timeout_seconds
+        self._timeout = httpx.Timeout(self.timeout)
+        self._limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+        # Response cache shared by all tool methods (None when caching is off),
+        # also persisted to disk when cache_db_file is set
+        self._cache: Optional[APICache] = None
+        if settings.enable_data_caching:
+            default_ttl = settings.cache_ttl_minutes * 60
+            self._cache = (
+                SQLiteCache(settings.cache_db_file, default_ttl=default_ttl)
+                if settings.cache_db_file
+                else APICache(default_ttl=default_ttl)
+            )
+
+        # Resolved symbol lookups by normalized query (None when caching is off)
+        self._symbol_cache: Optional[APICache] = (
+            APICache(default_ttl=_SYMBOL_FOUND_TTL, max_entries=512)
+            if settings.enable_data_caching
+            else None
+        )
+
+        # Pooled HTTP client, created lazily on first request. Its connections
+        # are bound to the event loop they were opened on, so remember it.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Cap on requests on the wire at once, created with each loop's client
+        self._max_concurrency = settings.max_concurrent_requests
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        # Client-side quota so bursts queue up instead of drawing 429s
+        self._rate = TokenBucket(
+            capacity=settings.fmp_rate_limit_burst,
+            refill_rate=settings.fmp_rate_limit_per_second,
+        )
+
+        # Requests currently on the wire, so concurrent identical calls share one
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
 
         if not self.api_key:
             raise ValueError(
@@ -60,41 +442,277 @@ class FinancialModelingPrepTools(Toolkit):
                 "or provide api_key parameter, or enter it in the UI."
             )
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client for the running event loop
+
+        Reuses one keep-alive connection pool for every request made on the
+        same loop. With HTTP/2 available, concurrent requests are multiplexed
+        over a single connection. Failed connection attempts are retried by
+        the transport. httpx asks for compressed responses, brotli
+        included when its decoder is installed.
+
+        Returns:
+            httpx.AsyncClient bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            transport = httpx.AsyncHTTPTransport(
+                limits=self._limits,
+                http2=_HTTP2_AVAILABLE,
+                retries=_CONNECT_RETRIES,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                params={"apikey": self.api_key},
+                headers=_REQUEST_HEADERS,
+                timeout=self._timeout,
+                transport=transport,
+            )
+            self._client_loop = loop
+            # asyncio primitives bind to the loop they are first used on
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its connections"""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def fork(self) -> "FinancialModelingPrepTools":
+        """
+        Create tools for use from another thread's event loop
+
+        The fork shares this instance's response caches and rate limit, which
+        are thread-safe, but pools its own HTTP client: a client and its
+        in-flight requests are bound to the loop they were created on.
+
+        Returns:
+            Shallow copy of these tools with fresh per-loop state
+        """
+        tools = copy.copy(self)
+        tools._client = None
+        tools._client_loop = None
+        tools._semaphore = asyncio.Semaphore(self._max_concurrency)
+        tools._inflight = {}
+        return tools
+
+    async def __aenter__(self) -> "FinancialModelingPrepTools":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     async def _make_request(
-        self, endpoint: str, params: Optional[Dict] = None
+        self,
+        endpoint_name: str,
+        *,
+        symbol: Optional[str] = None,
+        params: Optional[Dict] = None,
+        force_refresh: bool = False,
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Make async HTTP request to Financial Modeling Prep API
 
+        Identical requests are served from the response cache until their
+        endpoint's TTL expires, and concurrent identical requests share a
+        single HTTP call.
+
         Args:
-            endpoint: API endpoint (without base URL)
+            endpoint_name: Key of the endpoint in _ENDPOINTS (e.g. 'profile')
+            symbol: Ticker symbol(s) for endpoints that take one
             params: Optional query parameters
+            force_refresh: Skip the cached response and store the fresh one
 
         Returns:
             List or Dict containing API response data
 
         Raises:
+            KeyError: If endpoint_name is not a known endpoint
             Exception: If API request fails
         """
-        if params is None:
-            params = {}
+        endpoint = _ENDPOINTS[endpoint_name].format(symbol=symbol)
+        cache_key = APICache.make_key(endpoint, params)
+        if self._cache is not None and not force_refresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Coalesce with an identical request already in flight on this loop
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(cache_key)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._inflight[cache_key] = future
+        try:
+            data = await self._fetch(endpoint, params)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no other caller is waiting
+            raise
+        except BaseException:
+            # A cancelled caller still has to release the callers sharing its call
+            future.set_exception(Exception(f"Request for {endpoint} was cancelled"))
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+
+        # FMP reports some failures (e.g. bad API key) as a 200 error payload
+        if self._cache is not None and not (
+            isinstance(data, dict) and "Error Message" in data
+        ):
+            self._cache.set(cache_key, data, self._cache.ttl_for(endpoint))
+        return data
+
+    @contextlib.asynccontextmanager
+    async def _get(
+        self, endpoint: str, params: Optional[Dict] = None, stream: bool = False
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a GET on the pooled client, retrying rate limited responses
 
-        params["apikey"] = self.api_key
-        url = f"{self.base_url}/{endpoint}"
+        The API key is sent via the client's default query parameters. Each
+        attempt waits for a concurrency slot, then takes one token from the
+        rate limiter before going out. Responses with a retryable status (429
+        or a transient 5xx) are retried after the server's Retry-After delay,
+        or an exponential backoff when none is given. The concurrency slot is
+        held until the block exits, so a streamed body is read within it.
 
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Optional query parameters
+            stream: Leave the body unread for the block to stream
+
+        Yields:
+            The successful response, closed when the block exits
+
+        Raises:
+            httpx.HTTPStatusError: If the final response has an error status
+        """
+        client = await self._get_client()
+        for attempt in range(_STATUS_RETRIES + 1):
+            async with self._semaphore:
+                await self._rate.acquire()
+                request = client.build_request("GET", endpoint, params=params)
+                response = await client.send(request, stream=stream)
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == _STATUS_RETRIES
+                ):
+                    try:
+                        response.raise_for_status()
+                        yield response
+                    finally:
+                        await response.aclose()
+                    return
+                await response.aclose()
+            # Sleep outside the semaphore so other requests can proceed
+            await asyncio.sleep(
+                retry_delay(response.headers.get("Retry-After"), attempt)
+            )
+
+    async def _fetch(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Perform the HTTP GET for _make_request on the pooled client
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Optional query parameters
+
+        Returns:
+            List or Dict containing API response data
+
+        Raises:
+            Exception: If API request fails
+        """
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, params=params) as response:
-                    response.raise_for_status()
-                    return await response.json()
-        except aiohttp.ClientError as e:
+            async with self._get(endpoint, params) as response:
+                content = response.content
+            # Decode the raw body ourselves to use orjson when available
+            return _json_loads(content)
+        except httpx.TimeoutException as e:
+            raise Exception(f"Request timeout after {self.timeout} seconds: {str(e)}")
+        except httpx.HTTPError as e:
             raise Exception(f"Financial Modeling Prep API request failed: {str(e)}")
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse API response: {str(e)}")
-        except asyncio.TimeoutError as e:
-            raise Exception(f"Request timeout after {self.timeout} seconds: {str(e)}")
+
+    @staticmethod
+    def _first(data: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the first record of a list response
+
+        Args:
+            data: Decoded API response (or an exception from asyncio.gather)
+
+        Returns:
+            The first record, or None if the response is not a non-empty list
+        """
+        return data[0] if isinstance(data, list) and data else None
+
+    async def _fetch_mapped(
+        self,
+        endpoint_name: str,
+        model: Type[_Model],
+        mapper: _Mapper,
+        failed: _Model,
+        *,
+        symbol: str,
+        label: str,
+        params: Optional[Dict] = None,
+        force_refresh: bool = False,
+        **fixed: Any,
+    ) -> _Model:
+        """
+        Fetch one symbol's first record from an endpoint and map it onto a model
+
+        Args:
+            endpoint_name: Key of the endpoint in _ENDPOINTS
+            model: Result model to build on success
+            mapper: Compiled field mapper for the record (see _compile_mapper)
+            failed: Unsuccessful-result template for missing data or errors
+            symbol: Stock ticker symbol (upper-cased here)
+            label: Data description used in error messages
+            params: Optional query parameters
+            force_refresh: Bypass the response cache for this request
+            **fixed: Extra fields set on unsuccessful results, also passed to
+                the mapper as fallback values
+
+        Returns:
+            The mapped model, or a copy of `failed` if the endpoint has no
+            record; request and mapping errors are raised for the caller's
+            _fmp_tool wrapper
+        """
+        symbol = symbol.upper()
+        record = self._first(
+            await self._make_request(
+                endpoint_name,
+                symbol=symbol,
+                params=params,
+                force_refresh=force_refresh,
+            )
+        )
+        if record is None:
+            return _failed(
+                failed,
+                symbol=symbol,
+                error=f"No {label} data found for {symbol}",
+                **fixed,
+            )
+        return model(symbol=symbol, success=True, error=None, **mapper(record, fixed))
 
     async def search_symbol(self, query: str) -> SymbolSearchResult:
         """
@@ -106,18 +724,36 @@ class FinancialModelingPrepTools(Toolkit):
         Returns:
             Dict containing search results with symbol, name, and exchange info
         """
+        key = query.strip().upper()
+        if self._symbol_cache is not None:
+            cached = self._symbol_cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = await self._search_symbol(query)
+
+        # Failed lookups (company_name "Error") are not cached, so a transient
+        # API error is retried on the next call
+        if self._symbol_cache is not None and result.company_name != "Error":
+            ttl = _SYMBOL_FOUND_TTL if result.found else _SYMBOL_NOT_FOUND_TTL
+            self._symbol_cache.set(key, result, ttl)
+            # A name search also resolves its ticker, so "Apple" then "AAPL"
+            # costs one lookup
+            if result.found and result.symbol != key:
+                self._symbol_cache.set(result.symbol, result, _SYMBOL_FOUND_TTL)
+        return result
+
+    async def _search_symbol(self, query: str) -> SymbolSearchResult:
+        """Resolve a symbol search query against the API (uncached)"""
         try:
             # First try direct symbol lookup
-            if len(query) <= 5 and query.isalpha():
+            if _looks_like_ticker(query):
                 symbol = query.upper()
                 # Validate symbol exists by fetching basic profile
-                profile_data = await self._make_request(f"profile/{symbol}")
-                if (
-                    profile_data
-                    and isinstance(profile_data, list)
-                    and len(profile_data) > 0
-                ):
-                    company = profile_data[0]
+                company = self._first(
+                    await self._make_request("profile", symbol=symbol)
+                )
+                if company is not None:
                     return SymbolSearchResult(
                         symbol=symbol,
                         company_name=company.get("companyName", "Unknown"),
@@ -127,11 +763,12 @@ class FinancialModelingPrepTools(Toolkit):
                     )
 
             # Search by company name
-            search_data = await self._make_request("search", {"query": query, "limit": 5})
+            # The first result is the most relevant one
+            result = self._first(
+                await self._make_request("search", params={"query": query, "limit": 5})
+            )
 
-            if search_data and isinstance(search_data, list) and len(search_data) > 0:
-                # Return the first (most relevant) result
-                result = search_data[0]
+            if result is not None:
                 return SymbolSearchResult(
                     symbol=result.get("symbol", "UNKNOWN"),
                     company_name=result.get("name", "Unknown"),
@@ -156,8 +793,13 @@ class FinancialModelingPrepTools(Toolkit):
                 error=str(e)
             )
 
+    @_fmp_tool(_INCOME_FAILED, "income statement", fixed=("period",))
     async def get_income_statement(
-        self, symbol: str, period: str = "annual", limit: int = 1
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 1,
+        force_refresh: bool = False,
     ) -> IncomeStatementData:
         """
         Get income statement data for a company
@@ -166,537 +808,398 @@ class FinancialModelingPrepTools(Toolkit):
             symbol: Stock ticker symbol (e.g., 'AAPL')
             period: 'annual' or 'quarter'
             limit: Number of periods to retrieve (default: 1)
+            force_refresh: Fetch from the API even if a cached copy is fresh
 
         Returns:
             Dict containing income statement data
         """
-        try:
-            symbol = symbol.upper()
-            endpoint = f"income-statement/{symbol}"
-            params = {"period": period, "limit": limit}
-
-            data = await self._make_request(endpoint, params)
+        # The record's own period wins over the requested one
+        return await self._fetch_mapped(
+            "income_statement",
+            IncomeStatementData,
+            _MAP_INCOME,
+            _INCOME_FAILED,
+            symbol=symbol,
+            label="income statement",
+            params={"period": period, "limit": limit},
+            force_refresh=force_refresh,
+            period=period,
+        )
+
+    @_fmp_tool(_FINANCIALS_FAILED, "company financials")
+    async def get_company_financials(
+        self, symbol: str, force_refresh: bool = False
+    ) -> CompanyFinancialsData:
+        """
+        Get comprehensive company financial metrics and ratios
 
-            if not data or not isinstance(data, list) or len(data) == 0:
-                return IncomeStatementData(
-                    symbol=symbol,
-                    date="Unknown",
-                    period=period,
-                    revenue=0,
-                    gross_profit=0,
-                    operating_income=0,
-                    net_income=0,
-                    eps=0,
-                    gross_profit_ratio=0,
-                    operating_income_ratio=0,
-                    net_income_ratio=0,
-                    research_and_development=0,
-                    total_operating_expenses=0,
-                    error=f"No income statement data found for {symbol}",
-                    success=False
-                )
+        Args:
+            symbol: Stock ticker symbol (e.g., 'AAPL')
+            force_refresh: Fetch from the API even if cached copies are fresh
 
-            # Process the most recent income statement
-            income_statement = data[0]
+        Returns:
+            Dict containing company financial metrics
+        """
+        symbol = symbol.upper()
 
-            return IncomeStatementData(
+        # Get key financial metrics, ratios, and profile concurrently
+        metrics_data, ratios_data, profile_data = await asyncio.gather(
+            self._make_request(
+                "key_metrics",
                 symbol=symbol,
-                date=income_statement.get("date", "Unknown"),
-                period=income_statement.get("period", period),
-                revenue=income_statement.get("revenue", 0),
-                gross_profit=income_statement.get("grossProfit", 0),
-                operating_income=income_statement.get("operatingIncome", 0),
-                net_income=income_statement.get("netIncome", 0),
-                eps=income_statement.get("eps", 0),
-                gross_profit_ratio=income_statement.get("grossProfitRatio", 0),
-                operating_income_ratio=income_statement.get(
-                    "operatingIncomeRatio", 0
-                ),
-                net_income_ratio=income_statement.get("netIncomeRatio", 0),
-                research_and_development=income_statement.get(
-                    "researchAndDevelopmentExpenses", 0
-                ),
-                total_operating_expenses=income_statement.get(
-                    "totalOperatingExpenses", 0
-                ),
-                success=True,
-                error=None
-            )
-        except Exception as e:
-            return IncomeStatementData(
+                params={"limit": 1},
+                force_refresh=force_refresh,
+            ),
+            self._make_request(
+                "ratios",
                 symbol=symbol,
-                date="Unknown",
-                period=period,
-                revenue=0,
-                gross_profit=0,
-                operating_income=0,
-                net_income=0,
-                eps=0,
-                gross_profit_ratio=0,
-                operating_income_ratio=0,
-                net_income_ratio=0,
-                research_and_development=0,
-                total_operating_expenses=0,
-                error=f"Failed to fetch income statement for {symbol}: {str(e)}",
-                success=False
+                params={"limit": 1},
+                force_refresh=force_refresh,
+            ),
+            self._make_request(
+                "profile", symbol=symbol, force_refresh=force_refresh
+            ),
+            return_exceptions=True
+        )
+        
+        # Exceptions from gather are treated the same as empty responses
+        metrics = self._first(metrics_data)
+        if metrics is None:
+            return _failed(
+                _FINANCIALS_FAILED,
+                symbol=symbol,
+                error=f"No financial data found for {symbol}",
             )
 
-    async def get_company_financials(self, symbol: str) -> CompanyFinancialsData:
+        ratios = self._first(ratios_data) or {}
+        profile = self._first(profile_data) or {}
+
+        return CompanyFinancialsData(
+            symbol=symbol,
+            success=True,
+            error=None,
+            **_MAP_FINANCIALS_PROFILE(profile),
+            **_MAP_FINANCIALS_METRICS(metrics),
+            **_MAP_FINANCIALS_RATIOS(ratios),
+        )
+
+    async def _get_recent_history(
+        self, symbol: str, days: int, force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """
-        Get comprehensive company financial metrics and ratios
+        Fetch the most recent daily price records for a symbol
+
+        The historical-price-full body can run to megabytes, so it is streamed
+        and parsed incrementally (with ijson when installed), and the download
+        is abandoned as soon as `days` records have been read. Empty results
+        are not cached, so a transient failure is retried on the next call.
 
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
+            days: Number of most recent trading days to return
+            force_refresh: Skip the cached records and store the fresh ones
 
         Returns:
-            Dict containing company financial metrics
+            Daily records, most recent first
+
+        Raises:
+            Exception: If the request fails, the body is malformed or
+                truncated, or FMP answers with an error payload
         """
+        endpoint = _ENDPOINTS["historical_price"].format(symbol=symbol)
+        params = {"timeseries": days}
+        cache_key = APICache.make_key(endpoint, params)
+        if self._cache is not None and not force_refresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        records: List[Dict[str, Any]] = []
+        data: Any = None
         try:
-            symbol = symbol.upper()
-
-            # Get key financial metrics, ratios, and profile concurrently
-            metrics_data, ratios_data, profile_data = await asyncio.gather(
-                self._make_request(f"key-metrics/{symbol}", {"limit": 1}),
-                self._make_request(f"ratios/{symbol}", {"limit": 1}),
-                self._make_request(f"profile/{symbol}"),
-                return_exceptions=True
-            )
-            
-            # Handle exceptions from gather
-            if isinstance(metrics_data, Exception):
-                metrics_data = []
-            if isinstance(ratios_data, Exception):
-                ratios_data = []
-            if isinstance(profile_data, Exception):
-                profile_data = []
-
-            if (
-                not metrics_data
-                or not isinstance(metrics_data, list)
-                or len(metrics_data) == 0
-            ):
-                return CompanyFinancialsData(
-                    symbol=symbol,
-                    company_name="Unknown",
-                    market_cap=0,
-                    beta=0,
-                    pe_ratio=0,
-                    price_to_book=0,
-                    price_to_sales=0,
-                    debt_to_equity=0,
-                    current_ratio=0,
-                    quick_ratio=0,
-                    roe=0,
-                    roa=0,
-                    revenue_growth=0,
-                    gross_margin=0,
-                    operating_margin=0,
-                    net_margin=0,
-                    enterprise_value=0,
-                    working_capital=0,
-                    date="Unknown",
-                    error=f"No financial data found for {symbol}",
-                    success=False
-                )
+            async with self._get(endpoint, params, stream=True) as response:
+                if ijson is not None:
+                    found = ijson.sendable_list()
+                    parser = ijson.items_coro(found, "historical.item")
+                    # Body read before the first record, for error payloads
+                    head = bytearray()
+                    async for chunk in response.aiter_bytes(16384):
+                        parser.send(chunk)
+                        records.extend(found)
+                        del found[:]
+                        if len(records) >= days:
+                            break  # Leaving the block closes the response early
+                        if not records:
+                            head += chunk
+                    else:
+                        parser.close()  # Raises if the body was cut short
+                        if not records:
+                            data = _json_loads(bytes(head))
+                else:
+                    data = _json_loads(await response.aread())
+                    if isinstance(data, dict):
+                        records = data.get("historical", [])
+        except httpx.TimeoutException as e:
+            raise Exception(f"Request timeout after {self.timeout} seconds: {str(e)}")
+        except httpx.HTTPError as e:
+            raise Exception(f"Financial Modeling Prep API request failed: {str(e)}")
+        except (json.JSONDecodeError, ValueError, *_STREAM_PARSE_ERRORS) as e:
+            raise Exception(f"Failed to parse API response: {str(e)}")
 
-            metrics = (
-                metrics_data[0]
-                if isinstance(metrics_data, list) and metrics_data
-                else {}
-            )
-            ratios = (
-                ratios_data[0] if isinstance(ratios_data, list) and ratios_data else {}
-            )
-            profile = (
-                profile_data[0]
-                if isinstance(profile_data, list) and profile_data
-                else {}
+        # FMP reports some failures (e.g. bad API key) as a 200 error payload
+        if isinstance(data, dict) and "Error Message" in data:
+            raise Exception(
+                f"Financial Modeling Prep API error: {data['Error Message']}"
             )
 
-            return CompanyFinancialsData(
-                symbol=symbol,
-                company_name=profile.get("companyName", "Unknown"),
-                market_cap=profile.get("mktCap", 0),
-                beta=profile.get("beta", 0),
-                pe_ratio=metrics.get("peRatio", 0),
-                price_to_book=ratios.get("priceToBookRatio", 0),
-                price_to_sales=ratios.get("priceToSalesRatio", 0),
-                debt_to_equity=ratios.get("debtEquityRatio", 0),
-                current_ratio=ratios.get("currentRatio", 0),
-                quick_ratio=ratios.get("quickRatio", 0),
-                roe=ratios.get("returnOnEquity", 0),
-                roa=ratios.get("returnOnAssets", 0),
-                revenue_growth=metrics.get("revenueGrowth", 0),
-                gross_margin=ratios.get("grossProfitMargin", 0),
-                operating_margin=ratios.get("operatingProfitMargin", 0),
-                net_margin=ratios.get("netProfitMargin", 0),
-                enterprise_value=metrics.get("enterpriseValue", 0),
-                working_capital=metrics.get("workingCapital", 0),
-                date=metrics.get("date", "Unknown"),
-                success=True,
-                error=None
+        records = records[:days]
+        if self._cache is not None and records:
+            self._cache.set(cache_key, records, self._cache.ttl_for(endpoint))
+        return records
+
+    async def _get_records_batch(
+        self, endpoint_name: str, symbols: List[str], force_refresh: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch records for several symbols with comma-separated batch requests
+
+        FMP's quote and profile endpoints accept a comma-separated symbol
+        list. Symbols are sent in chunks of _BATCH_SIZE to keep URLs short,
+        and the chunks are requested concurrently.
+
+        Args:
+            endpoint_name: 'quote' or 'profile'
+            symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            force_refresh: Skip the cached responses
+
+        Returns:
+            Dict mapping each returned symbol to its raw record
+        """
+        unique_symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        responses = await asyncio.gather(
+            *(
+                self._make_request(
+                    endpoint_name,
+                    symbol=",".join(unique_symbols[i : i + _BATCH_SIZE]),
+                    force_refresh=force_refresh,
+                )
+                for i in range(0, len(unique_symbols), _BATCH_SIZE)
             )
-        except Exception as e:
-            return CompanyFinancialsData(
+        )
+        return {
+            record["symbol"]: record
+            for data in responses
+            if isinstance(data, list)
+            for record in data
+            if "symbol" in record
+        }
+
+    def _build_stock_price(
+        self,
+        symbol: str,
+        quote: Optional[Dict[str, Any]],
+        history: Optional[List[Dict[str, Any]]] = None,
+    ) -> StockPriceData:
+        """
+        Map a raw FMP quote onto StockPriceData
+
+        Args:
+            symbol: Stock ticker symbol the quote was requested for
+            quote: Raw quote from the API, or None if none was returned
+            history: Recent daily records (most recent first) for analytics
+
+        Returns:
+            StockPriceData for the quote, or an unsuccessful result if missing
+        """
+        if not quote:
+            return _failed(
+                _STOCK_PRICE_FAILED,
                 symbol=symbol,
-                company_name="Unknown",
-                market_cap=0,
-                beta=0,
-                pe_ratio=0,
-                price_to_book=0,
-                price_to_sales=0,
-                debt_to_equity=0,
-                current_ratio=0,
-                quick_ratio=0,
-                roe=0,
-                roa=0,
-                revenue_growth=0,
-                gross_margin=0,
-                operating_margin=0,
-                net_margin=0,
-                enterprise_value=0,
-                working_capital=0,
-                date="Unknown",
-                error=f"Failed to fetch company financials for {symbol}: {str(e)}",
-                success=False
+                error=f"No price data found for {symbol}",
             )
 
-    async def get_stock_price(self, symbol: str) -> StockPriceData:
+        fields = _MAP_QUOTE(quote)
+
+        # Enhanced analytics using historical data
+        analytics: Dict[str, Any] = {}
+        if history:
+            analytics = self._batch_analytics(
+                {symbol: history}, {symbol: fields["price"] or 0}
+            )[symbol]
+
+        return StockPriceData(
+            symbol=symbol,
+            timestamp=quote.get("timestamp", int(datetime.now().timestamp())),
+            success=True,
+            error=None,
+            **fields,
+            **analytics,
+        )
+
+    def _batch_analytics(
+        self,
+        hist_by_symbol: Dict[str, List[Dict[str, Any]]],
+        prices: Dict[str, float],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute trend and volatility analytics for several symbols in one pass
+
+        Args:
+            hist_by_symbol: Daily price records per symbol (most recent first)
+            prices: Current price per symbol
+
+        Returns:
+            Dict mapping each symbol to its StockPriceData analytics fields
+        """
+        symbols = list(hist_by_symbol)
+        results = batch_analytics(
+            [hist_by_symbol[symbol] for symbol in symbols],
+            [prices.get(symbol, 0) for symbol in symbols],
+            window=_HISTORY_DAYS,
+        )
+        return dict(zip(symbols, results))
+
+    @_fmp_tool(_STOCK_PRICE_FAILED, "stock price")
+    async def get_stock_price(
+        self, symbol: str, force_refresh: bool = False, include_analytics: bool = False
+    ) -> StockPriceData:
         """
         Get current stock price and trading information
 
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
+            force_refresh: Fetch from the API even if cached copies are fresh
+            include_analytics: Also fetch recent history for the trend and
+                volatility fields (one extra request); otherwise they keep
+                their neutral defaults
 
         Returns:
             Dict containing current stock price data
         """
-        try:
-            symbol = symbol.upper()
-
-            # Get real-time quote
-            quote_data = await self._make_request(f"quote/{symbol}")
-
-            # Get historical price for trend analysis (last 5 days)
-            # historical_data = self._make_request(
-            #     f"historical-price-full/{symbol}", {"timeseries": 5}
-            # )
-
-            if (
-                not quote_data
-                or not isinstance(quote_data, list)
-                or len(quote_data) == 0
-            ):
-                return StockPriceData(
-                    symbol=symbol,
-                    name="Unknown",
-                    price=0,
-                    change=0,
-                    change_percent=0,
-                    previous_close=0,
-                    open=0,
-                    high=0,
-                    low=0,
-                    volume=0,
-                    avg_volume=0,
-                    market_cap=0,
-                    pe_ratio=0,
-                    eps=0,
-                    fifty_two_week_high=0,
-                    fifty_two_week_low=0,
-                    exchange="Unknown",
-                    timestamp=0,
-                    error=f"No price data found for {symbol}",
-                    success=False
-                )
+        symbol = symbol.upper()
+        if not include_analytics:
+            quotes = await self._get_records_batch("quote", [symbol], force_refresh)
+            return self._build_stock_price(symbol, quotes.get(symbol))
+
+        # Get real-time quote and recent history for trend analysis together
+        quotes, history = await asyncio.gather(
+            self._get_records_batch("quote", [symbol], force_refresh),
+            self._get_recent_history(symbol, _HISTORY_DAYS, force_refresh),
+            return_exceptions=True,
+        )
+        if isinstance(quotes, BaseException):
+            raise quotes
+        # Analytics are best-effort; a failed history fetch keeps the quote
+        if isinstance(history, BaseException):
+            history = None
+
+        return self._build_stock_price(symbol, quotes.get(symbol), history)
+
+    @_fmp_tool(_STOCK_PRICE_FAILED, "stock price")
+    async def get_stock_prices(
+        self, symbols: List[str], force_refresh: bool = False
+    ) -> Dict[str, StockPriceData]:
+        """
+        Get current stock prices for several symbols with a single request
 
-            quote = quote_data[0]
+        Trend and volatility analytics are not included in the batch results.
 
-            # Calculate basic metrics
-            previous_close = quote.get("previousClose", 0)
-            current_price = quote.get("price", 0)
+        Args:
+            symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            force_refresh: Fetch from the API even if cached quotes are fresh
 
-            # Enhanced analytics using historical data
-            # trend_analysis = self._analyze_price_trend(historical_data, current_price)
-            # volatility_metrics = self._calculate_volatility(historical_data)
+        Returns:
+            Dict mapping each upper-cased symbol to its stock price data
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        quotes = await self._get_records_batch("quote", symbols, force_refresh)
+        return {
+            symbol: self._build_stock_price(symbol, quotes.get(symbol))
+            for symbol in symbols
+        }
+
+    async def get_company_financials_batch(
+        self, symbols: List[str], force_refresh: bool = False
+    ) -> Dict[str, CompanyFinancialsData]:
+        """
+        Get company financial metrics for several symbols concurrently
 
-            return StockPriceData(
-                symbol=symbol,
-                name=quote.get("name", "Unknown"),
-                price=current_price,
-                change=quote.get("change", 0),
-                change_percent=quote.get("changesPercentage", 0),
-                previous_close=previous_close,
-                open=quote.get("open", 0),
-                high=quote.get("dayHigh", 0),
-                low=quote.get("dayLow", 0),
-                volume=quote.get("volume", 0),
-                avg_volume=quote.get("avgVolume", 0),
-                market_cap=quote.get("marketCap", 0),
-                pe_ratio=quote.get("pe", 0),
-                eps=quote.get("eps", 0),
-                fifty_two_week_high=quote.get("yearHigh", 0),
-                fifty_two_week_low=quote.get("yearLow", 0),
-                exchange=quote.get("exchange", "Unknown"),
-                timestamp=quote.get("timestamp", int(datetime.now().timestamp())),
-                success=True,
-                error=None
-            )
-        except Exception as e:
-            return StockPriceData(
-                symbol=symbol,
-                name="Unknown",
-                price=0,
-                change=0,
-                change_percent=0,
-                previous_close=0,
-                open=0,
-                high=0,
-                low=0,
-                volume=0,
-                avg_volume=0,
-                market_cap=0,
-                pe_ratio=0,
-                eps=0,
-                fifty_two_week_high=0,
-                fifty_two_week_low=0,
-                exchange="Unknown",
-                timestamp=0,
-                error=f"Failed to fetch stock price for {symbol}: {str(e)}",
-                success=False
+        All requests share the pooled client, and overlapping endpoints are
+        coalesced by _make_request.
+
+        Args:
+            symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            force_refresh: Fetch from the API even if cached copies are fresh
+
+        Returns:
+            Dict mapping each upper-cased symbol to its financial data
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        results = await asyncio.gather(
+            *(
+                self.get_company_financials(symbol, force_refresh=force_refresh)
+                for symbol in symbols
             )
+        )
+        return dict(zip(symbols, results))
 
-    async def get_company_profile(self, symbol: str) -> CompanyProfileData:
+    @_fmp_tool(_PROFILE_FAILED, "company profile")
+    async def get_company_profile(
+        self, symbol: str, force_refresh: bool = False
+    ) -> CompanyProfileData:
         """
         Get basic company profile information
 
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
+            force_refresh: Fetch from the API even if a cached copy is fresh
 
         Returns:
             Dict containing company profile data
         """
-        try:
-            symbol = symbol.upper()
-            profile_data = await self._make_request(f"profile/{symbol}")
-
-            if (
-                not profile_data
-                or not isinstance(profile_data, list)
-                or len(profile_data) == 0
-            ):
-                return CompanyProfileData(
-                    symbol=symbol,
-                    company_name="Unknown",
-                    description="No description available",
-                    industry="Unknown",
-                    sector="Unknown",
-                    website="",
-                    ceo="Unknown",
-                    employees=0,
-                    country="Unknown",
-                    exchange="Unknown",
-                    currency="USD",
-                    error=f"No profile data found for {symbol}",
-                    success=False
-                )
-
-            profile = profile_data[0]
+        return await self._fetch_mapped(
+            "profile",
+            CompanyProfileData,
+            _MAP_PROFILE,
+            _PROFILE_FAILED,
+            symbol=symbol,
+            label="company profile",
+            force_refresh=force_refresh,
+        )
+
+    @_fmp_tool(_PROFILE_FAILED, "company profile")
+    async def get_company_profiles(
+        self, symbols: List[str], force_refresh: bool = False
+    ) -> Dict[str, CompanyProfileData]:
+        """
+        Get company profiles for several symbols with batched requests
 
-            return CompanyProfileData(
-                symbol=symbol,
-                company_name=profile.get("companyName", "Unknown"),
-                description=profile.get("description", "No description available"),
-                industry=profile.get("industry", "Unknown"),
-                sector=profile.get("sector", "Unknown"),
-                website=profile.get("website", ""),
-                ceo=profile.get("ceo", "Unknown"),
-                employees=profile.get("fullTimeEmployees", 0),
-                country=profile.get("country", "Unknown"),
-                exchange=profile.get("exchangeShortName", "Unknown"),
-                currency=profile.get("currency", "USD"),
-                success=True,
-                error=None
-            )
-        except Exception as e:
-            return CompanyProfileData(
-                symbol=symbol,
-                company_name="Unknown",
-                description="No description available",
-                industry="Unknown",
-                sector="Unknown",
-                website="",
-                ceo="Unknown",
-                employees=0,
-                country="Unknown",
-                exchange="Unknown",
-                currency="USD",
-                error=f"Failed to fetch company profile for {symbol}: {str(e)}",
-                success=False
-            )
+        Args:
+            symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            force_refresh: Fetch from the API even if cached profiles are fresh
 
-    # def _analyze_price_trend(
-    #     self,
-    #     historical_data: Union[List[Dict[str, Any]], Dict[str, Any]],
-    #     current_price: float,
-    # ) -> Dict[str, Any]:
-    #     """
-    #     Analyze price trend from historical data
-
-    #     Args:
-    #         historical_data: Historical price data from API
-    #         current_price: Current stock price
-
-    #     Returns:
-    #         Dict containing trend analysis
-    #     """
-    #     try:
-    #         # Handle case where historical data is not available or not in expected format
-    #         if not historical_data or not isinstance(historical_data, dict):
-    #             return {
-    #                 "direction": "neutral",
-    #                 "strength": 0,
-    #                 "five_day_change_percent": 0,
-    #             }
-
-    #         # Extract historical prices from the nested structure
-    #         historical_prices = historical_data.get("historical", [])
-    #         if not historical_prices or len(historical_prices) < 2:
-    #             return {
-    #                 "direction": "neutral",
-    #                 "strength": 0,
-    #                 "five_day_change_percent": 0,
-    #             }
-
-    #         # Get prices (most recent first in FMP API)
-    #         prices = [
-    #             float(day.get("close", 0))
-    #             for day in historical_prices[:5]
-    #             if day.get("close")
-    #         ]
-    #         if len(prices) < 2:
-    #             return {
-    #                 "direction": "neutral",
-    #                 "strength": 0,
-    #                 "five_day_change_percent": 0,
-    #             }
-
-    #         # Calculate 5-day change
-    #         oldest_price = prices[-1]  # 5 days ago
-    #         five_day_change_percent = (
-    #             ((current_price - oldest_price) / oldest_price * 100)
-    #             if oldest_price > 0
-    #             else 0
-    #         )
-
-    #         # Determine trend direction and strength
-    #         if len(prices) >= 3:
-    #             # Count upward vs downward movements
-    #             up_days = sum(
-    #                 1 for i in range(len(prices) - 1) if prices[i] > prices[i + 1]
-    #             )
-    #             total_days = len(prices) - 1
-
-    #             if up_days / total_days >= 0.6:
-    #                 direction = "bullish"
-    #                 strength = min(up_days / total_days, 1.0)
-    #             elif up_days / total_days <= 0.4:
-    #                 direction = "bearish"
-    #                 strength = min((total_days - up_days) / total_days, 1.0)
-    #             else:
-    #                 direction = "neutral"
-    #                 strength = 0.5
-    #         else:
-    #             # Simple comparison for limited data
-    #             if five_day_change_percent > 2:
-    #                 direction = "bullish"
-    #                 strength = min(abs(five_day_change_percent) / 10, 1.0)
-    #             elif five_day_change_percent < -2:
-    #                 direction = "bearish"
-    #                 strength = min(abs(five_day_change_percent) / 10, 1.0)
-    #             else:
-    #                 direction = "neutral"
-    #                 strength = 0.5
-
-    #         return {
-    #             "direction": direction,
-    #             "strength": round(strength, 2),
-    #             "five_day_change_percent": round(five_day_change_percent, 2),
-    #         }
-
-    #     except Exception:
-    #         return {"direction": "neutral", "strength": 0, "five_day_change_percent": 0}
-
-    # def _calculate_volatility(
-    #     self, historical_data: Union[List[Dict[str, Any]], Dict[str, Any]]
-    # ) -> Dict[str, Any]:
-    #     """
-    #     Calculate volatility metrics from historical data
-
-    #     Args:
-    #         historical_data: Historical price data from API
-
-    #     Returns:
-    #         Dict containing volatility metrics
-    #     """
-    #     try:
-    #         # Handle case where historical data is not available
-    #         if not historical_data or not isinstance(historical_data, dict):
-    #             return {"volatility": 0, "volume_trend": "stable"}
-    #         historical_prices = historical_data.get("historical", [])
-    #         if not historical_prices or len(historical_prices) < 3:
-    #             return {"volatility": 0, "volume_trend": "stable"}
-
-    #         # Calculate price volatility (standard deviation of daily returns)
-    #         prices = [
-    #             float(day.get("close", 0))
-    #             for day in historical_prices[:5]
-    #             if day.get("close")
-    #         ]
-    #         volumes = [
-    #             int(day.get("volume", 0))
-    #             for day in historical_prices[:5]
-    #             if day.get("volume")
-    #         ]
-
-    #         if len(prices) >= 3:
-    #             # Calculate daily returns
-    #             returns = []
-    #             for i in range(len(prices) - 1):
-    #                 if prices[i + 1] > 0:
-    #                     daily_return = (prices[i] - prices[i + 1]) / prices[i + 1]
-    #                     returns.append(daily_return)
-
-    #             # Calculate volatility (standard deviation)
-    #             if returns:
-    #                 mean_return = sum(returns) / len(returns)
-    #                 variance = sum((r - mean_return) ** 2 for r in returns) / len(
-    #                     returns
-    #                 )
-    #                 volatility = (variance**0.5) * 100  # Convert to percentage
-    #             else:
-    #                 volatility = 0
-    #         else:
-    #             volatility = 0
-
-    #         # Analyze volume trend
-    #         volume_trend = "stable"
-    #         if len(volumes) >= 3:
-    #             recent_avg = sum(volumes[:2]) / 2 if len(volumes) >= 2 else volumes[0]
-    #             older_avg = (
-    #                 sum(volumes[2:]) / len(volumes[2:])
-    #                 if len(volumes) > 2
-    #                 else recent_avg
-    #             )
-
-    #             if recent_avg > older_avg * 1.2:
-    #                 volume_trend = "increasing"
-    #             elif recent_avg < older_avg * 0.8:
-    #                 volume_trend = "decreasing"
-    #             else:
-    #                 volume_trend = "stable"
-
-    #         return {"volatility": round(volatility, 2), "volume_trend": volume_trend}
-
-    #     except Exception:
-    #         return {"volatility": 0, "volume_trend": "stable"}
+        Returns:
+            Dict mapping each upper-cased symbol to its profile data
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        profiles = await self._get_records_batch("profile", symbols, force_refresh)
+
+        results: Dict[str, CompanyProfileData] = {}
+        for symbol in symbols:
+            profile = profiles.get(symbol)
+            if profile is None:
+                results[symbol] = _failed(
+                    _PROFILE_FAILED,
+                    symbol=symbol,
+                    error=f"No company profile data found for {symbol}",
+                )
+                continue
+            try:
+                results[symbol] = CompanyProfileData(
+                    symbol=symbol, success=True, error=None, **_MAP_PROFILE(profile)
+                )
+            except Exception as e:
+                results[symbol] = _fetch_failed(
+                    _PROFILE_FAILED, "company profile", symbol, e
+                )
+        return results
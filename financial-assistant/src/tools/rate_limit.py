@@ -0,0 +1,90 @@
+"""
+Rate Limiting
+
+This module implements a token bucket used by FinancialModelingPrepTools to
+keep outbound API traffic under the provider's request quotas, and the
+backoff used when the provider still answers 429 or a transient 5xx.
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Responses worth retrying: rate limited or a temporarily unavailable upstream
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Upper bound on any single wait, so a bogus Retry-After cannot stall a turn
+MAX_RETRY_DELAY = 30.0
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter
+
+    Holds up to `capacity` tokens and refills at `refill_rate` tokens per
+    second. Bursts up to the capacity go through immediately; beyond that
+    callers wait until enough tokens have accumulated.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("Token bucket capacity and refill rate must be positive")
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        # The bucket is shared across the event loops the workflow creates
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update (lock held)"""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """
+        Wait until `tokens` tokens are available and consume them
+
+        Args:
+            tokens: Number of tokens to consume (one per request)
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.refill_rate
+            await asyncio.sleep(wait)
+
+
+def retry_delay(
+    retry_after: Optional[str], attempt: int, base_delay: float = 0.5
+) -> float:
+    """
+    Get how long to wait before retrying a failed request
+
+    Args:
+        retry_after: Retry-After header value (seconds or an HTTP date), if any
+        attempt: Zero-based number of the retry about to be made
+        base_delay: Backoff for the first retry when no Retry-After is given
+
+    Returns:
+        Delay in seconds, capped at MAX_RETRY_DELAY
+    """
+    delay = base_delay * 2**attempt
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = retry_at.timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass  # Unparseable header, keep the exponential backoff
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
@@ -6,20 +6,34 @@ the entire financial assistant application using Agno's Level 5 Agentic Workflow
 """
 
 import asyncio
+import functools
+import json
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
-from typing import Any, Iterator, Optional, cast
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Generator, Iterator, Optional, cast
 
 import langwatch
 from agno.agent import Agent
 from agno.models.anthropic import Claude
-from agno.run.response import RunResponse, RunResponseEvent
+from agno.run.response import (
+    RunResponse,
+    RunResponseContentEvent,
+    RunResponseEvent,
+)
+from agno.storage.session.workflow import WorkflowSession
 from agno.storage.sqlite import SqliteStorage
 from agno.workflow import Workflow
 from config.settings import Settings
+from sqlalchemy import event
 from models.schemas import (
     ChatResponse,
-    ConversationMessage,
     Extraction,
+    RouterCategory,
     RouterResult,
     WorkflowSummary,
 )
@@ -28,6 +42,374 @@ from models.schemas import (
 # Import tools, models, and configuration
 from tools.financial_modeling_prep import FinancialModelingPrepTools
 
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        """Serialize a session column with orjson"""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib codec
+
+    def _json_dumps(value: Any) -> str:
+        """Serialize a session column with the stdlib codec"""
+        return json.dumps(value)
+
+    _json_loads = json.loads
+
+
+class _NoopSpan:
+    """Stand-in for a LangWatch span when tracing is not configured"""
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def update(self, **kwargs) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# Fields counted by the report's data quality score, per data source
+_QUALITY_INCOME_FIELDS = ("revenue", "net_income", "eps", "net_income_ratio")
+_QUALITY_FINANCIAL_FIELDS = ("pe_ratio", "market_cap", "roe", "debt_to_equity")
+_QUALITY_PRICE_FIELDS = ("price", "change", "volume")
+_QUALITY_FIELD_COUNT = (
+    len(_QUALITY_INCOME_FIELDS)
+    + len(_QUALITY_FINANCIAL_FIELDS)
+    + len(_QUALITY_PRICE_FIELDS)
+)
+
+
+# Request phrasings that name a single kind of financial data; a request that
+# matches exactly one of these and names an explicit ticker skips the router LLM
+_ROUTER_PATTERNS: tuple[tuple[re.Pattern[str], RouterCategory], ...] = (
+    (re.compile(r"\bincome\s+statements?\b", re.I), "income_statement"),
+    (
+        re.compile(r"\b(?:stock|share)\s+prices?\b|\bprice\s+of\b|\bquote\b", re.I),
+        "stock_price",
+    ),
+    (
+        re.compile(
+            r"\b(?:financials|financial\s+ratios|key\s+metrics|valuation\s+metrics)\b",
+            re.I,
+        ),
+        "company_financials",
+    ),
+    (
+        re.compile(
+            r"\b(?:full|complete|comprehensive)\s+"
+            r"(?:financial\s+)?(?:report|analysis)\b",
+            re.I,
+        ),
+        "report",
+    ),
+)
+
+# Definition questions ("What is a P/E ratio?") that go straight to chat
+_DEFINITION_PATTERN = re.compile(
+    r"^\s*(?:what\s+(?:is|are)|what's|define|explain)\s+(?:an?|the\s+meaning\s+of)\s",
+    re.I,
+)
+
+# Explicit tickers: "$F" or two to five capitals such as "AAPL" or "BRK.B"
+_TICKER_PATTERN = re.compile(
+    r"(?<![\w$])\$([A-Z]{1,5}(?:\.[A-Z]{1,2})?)\b|\b([A-Z]{2,5}(?:\.[A-Z]{1,2})?)\b"
+)
+
+# Capitalized finance terms, exchange names and words that are not tickers
+_NON_TICKER_WORDS = frozenset(
+    {
+        "AI", "CEO", "CFO", "EBIT", "EBITDA", "EPS", "ETF", "FCF", "FY", "GAAP",
+        "IPO", "OK", "PE", "ROA", "ROE", "ROI", "SEC", "TTM", "US", "USA", "USD",
+        "YOY", "YTD",
+        # Exchanges and indexes
+        "AMEX", "ASX", "BATS", "CBOE", "DJIA", "FTSE", "HKEX", "JPX", "LSE",
+        "NASDAQ", "NYSE", "OTC", "TSX", "TSXV", "XETRA",
+    }
+)
+
+
+# Words a request may contain without naming a company: stopwords, pronouns
+# and finance terms. Any other word might be a company name ("apple"), which
+# only the router or extraction agent can resolve.
+_FILLER_WORDS = frozenset(
+    {
+        # Question and connecting words
+        "a", "about", "against", "also", "an", "and", "any", "are", "as", "at",
+        "be", "been", "between", "by", "can", "compare", "compared",
+        "comparison", "could", "define", "did", "do", "does", "doing",
+        "explain", "for", "from", "get", "give", "going", "has", "have", "how",
+        "how's", "i", "in", "is", "just", "like", "look", "looking", "looks",
+        "me", "meaning", "means", "more", "much", "my", "now", "of", "on", "or",
+        "over", "please", "right", "see", "should",
+        "show", "so", "tell", "than", "that", "that's", "the", "then", "there",
+        "these", "this", "those", "to", "up", "us", "versus", "vs", "was", "we",
+        "were", "what", "what's", "whats", "when", "where", "which", "why",
+        "will", "with", "would", "you",
+        # References to a company without naming it
+        "company", "company's", "it", "it's", "its", "share", "shares", "stock",
+        "stocks", "their", "them", "they",
+        # Time periods
+        "annual", "current", "currently", "day", "days", "last", "latest",
+        "month", "past", "quarter", "quarterly", "recent", "today", "week",
+        "year", "years",
+        # Financial data terms
+        "analysis", "assets", "balance", "cap", "cash", "change", "cheap",
+        "data", "debt", "details", "dividend", "dividends", "down", "earnings",
+        "ebitda", "eps", "equity", "expensive", "financial", "financials",
+        "flow", "gross", "growth", "high", "income", "info", "key", "low",
+        "margin", "margins", "market", "metrics", "net", "numbers",
+        "operating", "overvalued", "p/e", "pe", "performance", "performing",
+        "price", "prices", "profit", "profitability", "profitable", "profits",
+        "quote", "ratio", "ratios", "report", "return", "returns", "revenue",
+        "revenues", "roe", "sales", "sheet", "statement", "statements",
+        "summary", "trading", "trend", "trending", "undervalued", "valuation",
+        "valued", "volatility", "volume", "worth", "yield",
+    }
+)
+
+# Words of a request, including contractions and slashed terms such as "p/e"
+_WORD_PATTERN = re.compile(r"[a-z]+(?:['’/][a-z]+)*")
+
+
+def _explicit_tickers(message: str) -> list[str]:
+    """
+    Find the ticker symbols a request spells out, such as "AAPL" or "$F"
+
+    Args:
+        message: User's request message
+
+    Returns:
+        Unique tickers in order of appearance (empty for all-caps messages)
+    """
+    if message.isupper():
+        return []  # Shouted text makes every word look like a ticker
+    return list(
+        dict.fromkeys(
+            ticker
+            for match in _TICKER_PATTERN.finditer(message)
+            if (ticker := match.group(1) or match.group(2)) not in _NON_TICKER_WORDS
+        )
+    )
+
+
+def _names_no_company(message: str) -> bool:
+    """
+    Check that a request names no company beyond its explicit tickers
+
+    Data phrases from _ROUTER_PATTERNS and explicit tickers are removed; every
+    word left must be in _FILLER_WORDS.
+
+    Args:
+        message: User's request message
+
+    Returns:
+        True if no word of the request could be a company name
+    """
+    text = message
+    for pattern, _ in _ROUTER_PATTERNS:
+        text = pattern.sub(" ", text)
+    if not message.isupper():
+        text = _TICKER_PATTERN.sub(" ", text)
+    words = _WORD_PATTERN.findall(text.lower().replace("’", "'"))
+    return all(word in _FILLER_WORDS for word in words)
+
+
+# Words pointing back at the company from the previous turn
+_COREFERENCE_PATTERN = re.compile(
+    r"\b(?:it|its|it's|they|them|their|(?:the|that|this)\s+(?:company|stock))\b",
+    re.I,
+)
+
+# Pronouns that can point back at all the companies of a multi-company turn
+_PLURAL_COREFERENCE_PATTERN = re.compile(r"\b(?:they|them|their)\b", re.I)
+
+
+def _refers_to_previous_company(message: str) -> bool:
+    """
+    Check whether a follow-up request is about the company already discussed
+
+    True for requests like "what about its P/E?" that point back with a
+    pronoun and name no company of their own: no explicit ticker, and no
+    word beyond data phrases and _FILLER_WORDS (so "what about tesla?" is
+    left to the extraction agent).
+
+    Args:
+        message: User's request message
+
+    Returns:
+        True if the previous turn's symbol can be reused without the LLM
+    """
+    if not _COREFERENCE_PATTERN.search(message) or _explicit_tickers(message):
+        return False
+    return _names_no_company(message)
+
+
+def _prefilter_route(message: str) -> Optional[RouterResult]:
+    """
+    Classify a request without the router agent when its form is unambiguous
+
+    Args:
+        message: User's request message
+
+    Returns:
+        RouterResult for a definition question naming no company, or for a
+        request matching exactly one data pattern whose only companies are
+        explicit tickers; None to use the router agent
+    """
+    if message.isupper():
+        return None  # No reliable tickers or phrasing to go on
+
+    tickers = _explicit_tickers(message)
+    if not tickers:
+        # "What is a good P/E for Apple?" asks about a company, not a term
+        if _DEFINITION_PATTERN.match(message) and _names_no_company(message):
+            return RouterResult(
+                category="chat", confidence=1.0, reasoning="Definition question"
+            )
+        return None
+
+    categories: set[RouterCategory] = {
+        category for pattern, category in _ROUTER_PATTERNS if pattern.search(message)
+    }
+    if len(categories) != 1 or not _names_no_company(message):
+        return None  # Companies named in words need the router to resolve them
+    return RouterResult(
+        category=categories.pop(),
+        confidence=1.0,
+        reasoning="Matched request pattern",
+        symbol=tickers[0],
+        symbols=tickers if len(tickers) > 1 else [],
+    )
+
+
+# Response when no symbol could be found for a data request
+_SYMBOL_NOT_FOUND_MESSAGE = (
+    "Could not extract a valid stock symbol from your request. "
+    "Please specify a company name or ticker symbol."
+)
+
+# Symbol extraction results remembered for repeated requests
+_EXTRACTED_SYMBOLS_CACHE_SIZE = 128
+
+# Categories answered by the single-data (alone) flow, mapped to the FMP tool
+# method and keyword arguments that fetch them. Methods are looked up by name
+# so the same table serves self.fmp_tools and its prefetch fork.
+_DATA_CATEGORIES: dict[str, tuple[str, dict[str, Any]]] = {
+    "income_statement": ("get_income_statement", {}),
+    "company_financials": ("get_company_financials", {}),
+    # The formatted response includes the 5-day trend section
+    "stock_price": ("get_stock_price", {"include_analytics": True}),
+}
+
+# Most recently discussed companies kept in the agent context
+_MAX_COMPANIES_DISCUSSED = 20
+
+# New summary input shorter than this (about 100 tokens) skips the summary LLM
+_TRIVIAL_SUMMARY_CHARS = 400
+
+
+def _bullet_list(items: list[str]) -> str:
+    """Render items as a "• " bullet list, one per line"""
+    return "• " + "\n• ".join(items) if items else ""
+
+
+@dataclass
+class AnalysisResult:
+    """Derived findings and scores for one financial report"""
+
+    insights: list[str]
+    strengths: list[str]
+    concerns: list[str]
+    data_quality_score: float
+    completeness_score: float
+
+
+class _Prefetch:
+    """
+    Speculative fetch for a guessed symbol, run on its own event loop
+
+    Submitted to the prefetch executor. Abandoning it also cancels a fetch
+    already running, so a wrong guess stops using rate limit tokens and
+    sending requests instead of running to completion.
+    """
+
+    def __init__(
+        self,
+        guess: str,
+        fetch: Callable[[], Awaitable[Any]],
+        executor: ThreadPoolExecutor,
+    ):
+        self.guess = guess
+        self._fetch = fetch
+        self._abandoned = threading.Event()
+        # Loop and task of the fetch once it has started on the prefetch thread
+        self._running: Optional[
+            tuple[asyncio.AbstractEventLoop, asyncio.Task]
+        ] = None
+        self.future = executor.submit(lambda: asyncio.run(self._run()))
+
+    async def _run(self) -> Any:
+        """Run the fetch unless it was abandoned before the thread got to it"""
+        task = asyncio.current_task()
+        assert task is not None  # asyncio.run runs this coroutine as a task
+        self._running = (asyncio.get_running_loop(), task)
+        if self._abandoned.is_set():
+            return None
+        return await self._fetch()
+
+    def abandon(self) -> None:
+        """Cancel the fetch, whether still queued or already running"""
+        self._abandoned.set()
+        if self.future.cancel() or self._running is None:
+            return
+        loop, task = self._running
+        try:
+            loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            pass  # The fetch finished and its loop is closed
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the session database pragmas to each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    # WAL lets the UI read sessions while a turn writes, and with it NORMAL
+    # sync skips the fsync per commit without risking corruption
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def create_session_storage(table_name: str, db_file: str) -> SqliteStorage:
+    """
+    Create the SQLite session storage used by the workflow and the app
+
+    Args:
+        table_name: Table holding the workflow sessions
+        db_file: SQLite database file (its directory is created if missing)
+
+    Returns:
+        SqliteStorage whose connections use WAL journaling and whose JSON
+        columns use the module's JSON codec
+    """
+    # SqliteStorage replaces a passed-in db_engine with an in-memory one unless
+    # db_file is given too, so hook the engine it builds from db_file
+    storage = SqliteStorage(table_name=table_name, db_file=db_file)
+    event.listen(storage.db_engine, "connect", _set_sqlite_pragmas)
+    # The JSON columns (session_data, memory, ...) are encoded on every save;
+    # route them through orjson when it is installed
+    dialect = storage.db_engine.dialect
+    dialect._json_serializer = _json_dumps
+    dialect._json_deserializer = _json_loads
+    storage.db_engine.dispose()  # Reconnect pooled connections with the pragmas
+    return storage
+
 
 class FinancialAssistantWorkflow(Workflow):
     """
@@ -65,8 +447,11 @@ class FinancialAssistantWorkflow(Workflow):
         # Initialize settings
         self.settings = settings or Settings()
 
+        # Resolved once: manual spans are skipped entirely without LangWatch
+        self._tracing_enabled = self.settings.has_langwatch_configured
+
         # Configure LangWatch with automatic agent instrumentation if available
-        if self.settings.has_langwatch_configured:
+        if self._tracing_enabled:
             try:
                 from openinference.instrumentation.agno import AgnoInstrumentor
                 
@@ -85,6 +470,32 @@ class FinancialAssistantWorkflow(Workflow):
             except Exception as e:
                 print(f"⚠️  LangWatch setup failed: {e}")
 
+        # Summary input lines for the messages added since the last summary
+        self._pending_summary_lines: list[str] = []
+
+        # (summary, companies, text) of the last conversation context built
+        self._context_cache: Optional[tuple[Any, tuple[str, ...], str]] = None
+
+        # Summaries are generated off the turn's critical path, one at a time;
+        # the lock guards the history and summary state shared with that thread
+        self._summary_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="conversation-summary"
+        )
+        self._summary_future: Optional[Future] = None
+        self._summary_lock = threading.Lock()
+
+        # Set once a turn's response is complete; a summary landing after that
+        # stores the session itself
+        self._turn_finished = False
+
+        # Extraction agent results by (message, last symbol), oldest first
+        self._extracted_symbols: dict[tuple[str, Any], tuple[str, tuple]] = {}
+
+        # Speculative FMP fetches that overlap the symbol extraction LLM call
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="fmp-prefetch"
+        )
+
         # Initialize streaming parameters
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
@@ -98,7 +509,7 @@ class FinancialAssistantWorkflow(Workflow):
                 "last_summary_message_count": 0,  # int - Track when summary was generated
                 # User context
                 "user_preferences": {},  # Dict - User settings and preferences
-                "companies_discussed": [],  # List[str] - Companies mentioned in conversation
+                "companies_discussed": [],  # List[str] - Companies mentioned, most recent last
                 # Transient workflow state (not critical for persistence)
                 "current_category": None,
                 "current_symbol": None,
@@ -109,7 +520,7 @@ class FinancialAssistantWorkflow(Workflow):
         if storage:
             self.storage = storage
         else:
-            self.storage = SqliteStorage(
+            self.storage = create_session_storage(
                 table_name=self.settings.storage_table_name,
                 db_file=self.settings.storage_db_file,
             )
@@ -127,11 +538,25 @@ class FinancialAssistantWorkflow(Workflow):
             else:
                 self.llm = Claude(id="claude-sonnet-4-20250514")  # Fallback
 
-        self._initialize_agents()
+        # Get FMP API key from settings or session state
+        fmp_api_key = self.settings.financial_modeling_prep_api_key
+
+        # Initialize Financial Modeling Prep Tools with settings. Agents are
+        # built on first use, so a turn only pays for the ones it runs.
+        self.fmp_tools = FinancialModelingPrepTools(
+            api_key=fmp_api_key, settings=self.settings
+        )
+
+    def close(self) -> None:
+        """Stop the background summary and prefetch threads, dropping queued work"""
+        self._summary_executor.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
 
     def __del__(self):
         """Clean up resources when workflow is destroyed"""
         try:
+            if hasattr(self, "_summary_executor"):
+                self.close()
             if (
                 hasattr(self, "llm")
                 and hasattr(self.llm, "client")
@@ -145,21 +570,14 @@ class FinancialAssistantWorkflow(Workflow):
         except Exception:
             pass  # Ignore all destructor errors
 
-    def _initialize_agents(self):
-        """Initialize all workflow agents with the provided LLM"""
-        # Get FMP API key from settings or session state
-        fmp_api_key = self.settings.financial_modeling_prep_api_key
-
-        # Initialize Financial Modeling Prep Tools with settings
-        self.fmp_tools = FinancialModelingPrepTools(
-            api_key=fmp_api_key, settings=self.settings
-        )
-
-        # Router Agent - Categorizes user requests with conversation context
-        self.router_agent = Agent(
+    @cached_property
+    def router_agent(self) -> Agent:
+        """Router Agent - Categorizes user requests and extracts their symbols"""
+        return Agent(
             name="Router Agent",
-            role="Categorize user requests for appropriate workflow path using conversation context",
+            role="Categorize user requests and extract stock symbols using conversation context",
             model=self.llm,
+            tools=[self.fmp_tools],
             # Note: Removed storage from agents to avoid storage mode conflicts
             # The workflow itself will handle storage
             enable_session_summaries=self.settings.enable_session_summaries,
@@ -178,12 +596,18 @@ class FinancialAssistantWorkflow(Workflow):
                 "- 'Tell me about Apple' -> report",
                 "- 'What about Tesla?' (with previous financial context) -> same category as previous request",
                 "- 'What is a P/E ratio?' -> chat",
+                "For every category except chat, also set 'symbol' to the uppercase ticker the request refers to",
+                "Resolve company names and references like 'it' from conversation context, using the search_symbol tool when unsure",
+                "If the request names several companies, list every symbol in 'symbols' (with the first one in 'symbol')",
+                "Leave 'symbol' empty for chat or when no company can be identified",
             ],
             response_model=RouterResult,
         )
 
-        # Symbol Extraction Agent - Extracts stock symbols with conversation context
-        self.symbol_extraction_agent = Agent(
+    @cached_property
+    def symbol_extraction_agent(self) -> Agent:
+        """Symbol Extraction Agent - Extracts stock symbols with conversation context"""
+        return Agent(
             name="Symbol Extraction Agent",
             role="Extract stock symbols from natural language queries using conversation context",
             model=self.llm,
@@ -202,17 +626,16 @@ class FinancialAssistantWorkflow(Workflow):
                 "Context examples: 'it' after discussing Apple -> 'AAPL', 'that company' -> refer to last mentioned company",
                 "Use the search_symbol tool to validate and find correct symbols",
                 "Return 'UNKNOWN' if no valid symbol can be extracted even with context",
+                "If the request compares or names several companies, also list every symbol in 'symbols' (with the first one in 'symbol')",
                 "Always return symbols in uppercase",
             ],
             response_model=Extraction,
         )
 
-        # Note: Removed individual data retrieval agents - replaced with direct tool calls for better performance
-
-        # Note: Removed Report Generation Agent - using manual composition for better performance and reliability
-
-        # Chat Agent - Handles conversational interactions
-        self.chat_agent = Agent(
+    @cached_property
+    def chat_agent(self) -> Agent:
+        """Chat Agent - Handles conversational interactions"""
+        return Agent(
             name="Chat Agent",
             role="Handle conversational interactions and general queries",
             model=self.llm,
@@ -232,11 +655,14 @@ class FinancialAssistantWorkflow(Workflow):
                 "Reference previous topics and companies discussed in the conversation",
                 "Adapt explanations based on user's demonstrated understanding level",
             ],
-            response_model=ChatResponse,  # Structured response
+            # Agno does not stream structured output, so stream plain text
+            response_model=None if self.stream else ChatResponse,
         )
 
-        # Summary Agent - Generates and updates conversation summaries
-        self.summary_agent = Agent(
+    @cached_property
+    def summary_agent(self) -> Agent:
+        """Summary Agent - Generates and updates conversation summaries"""
+        return Agent(
             name="Summary Agent",
             role="Generate and update conversation summaries from message history",
             model=self.llm,
@@ -253,25 +679,28 @@ class FinancialAssistantWorkflow(Workflow):
             ],
         )
 
-    async def _fetch_parallel_financial_data(self, symbol: str):
+    async def _fetch_parallel_financial_data(
+        self, symbol: str, tools: Optional[FinancialModelingPrepTools] = None
+    ):
         """
         Fetch financial data in parallel using TaskGroup
 
         Args:
             symbol: Stock symbol to fetch data for
+            tools: FMP tools to use instead of self.fmp_tools (e.g. a fork)
 
         Returns:
             Tuple of (income_data, financials_data, price_data)
         """
+        tools = tools or self.fmp_tools
         try:
-            async with asyncio.TaskGroup() as tg:
-                income_task = tg.create_task(
-                    self.fmp_tools.get_income_statement(symbol)
+            # One pooled client for all three fetches, closed with the loop
+            async with tools, asyncio.TaskGroup() as tg:
+                income_task = tg.create_task(tools.get_income_statement(symbol))
+                financials_task = tg.create_task(tools.get_company_financials(symbol))
+                price_task = tg.create_task(
+                    tools.get_stock_price(symbol, include_analytics=True)
                 )
-                financials_task = tg.create_task(
-                    self.fmp_tools.get_company_financials(symbol)
-                )
-                price_task = tg.create_task(self.fmp_tools.get_stock_price(symbol))
 
             # Tasks are automatically awaited when exiting context
             return [
@@ -284,41 +713,204 @@ class FinancialAssistantWorkflow(Workflow):
             # Handle exception from failed tasks
             raise Exception(f"Error retrieving financial data: {str(e)}")
 
-    def _fetch_financial_data_sequential(self, symbol: str):
+    async def _fetch_category_data(
+        self,
+        category: str,
+        symbol: str,
+        tools: Optional[FinancialModelingPrepTools] = None,
+    ):
         """
-        Fetch financial data sequentially for sync workflow (avoids async complexity)
+        Fetch one data category for a symbol and release the pooled client
 
         Args:
+            category: One of _DATA_CATEGORIES
             symbol: Stock symbol to fetch data for
+            tools: FMP tools to use instead of self.fmp_tools (e.g. a fork)
 
         Returns:
-            Tuple of (income_data, financials_data, price_data)
+            The tool's result model
+        """
+        tools = tools or self.fmp_tools
+        method_name, kwargs = _DATA_CATEGORIES[category]
+        async with tools:
+            return await getattr(tools, method_name)(symbol, **kwargs)
+
+    @cached_property
+    def _prefetch_tools(self) -> FinancialModelingPrepTools:
+        """FMP tools for the prefetch thread, sharing the main tools' caches"""
+        return self.fmp_tools.fork()
+
+    def _start_prefetch(
+        self, message: str, fetch: Callable[..., Any]
+    ) -> Optional[_Prefetch]:
+        """
+        Speculatively fetch data for the one ticker a request spells out
+
+        Runs while the symbol extraction agent works out the symbol, so for
+        requests like "Tell me about $AAPL" the data is ready when it answers.
+
+        Args:
+            message: User's request message
+            fetch: Coroutine function called as fetch(symbol, tools=...)
+
+        Returns:
+            The started prefetch, or None without a guess or when the symbols
+            are known without the extraction agent
+        """
+        tickers = _explicit_tickers(message)
+        if len(tickers) != 1 or self._known_symbols(message) is not None:
+            return None
+        guess, tools = tickers[0], self._prefetch_tools
+        return _Prefetch(
+            guess, lambda: fetch(guess, tools=tools), self._prefetch_executor
+        )
+
+    @staticmethod
+    def _take_prefetch(prefetch: Optional[_Prefetch], symbol: str):
+        """
+        Get a speculative fetch's result if it was for the resolved symbol
+
+        Args:
+            prefetch: Result of _start_prefetch
+            symbol: Symbol the extraction agent resolved
+
+        Returns:
+            The fetch result, or None when there was no prefetch or it guessed
+            another symbol (the fetch is then abandoned)
+        """
+        if prefetch is None:
+            return None
+        if prefetch.guess != symbol.upper():
+            prefetch.abandon()
+            return None
+        return prefetch.future.result()
+
+    async def _fetch_multi_symbol_data(self, symbols: list[str], category: str):
+        """
+        Fetch one data category for several symbols on a shared client
+
+        Stock prices come from a single comma-separated quote request and
+        financials from the coalesced batch helper; income statements have
+        no batch endpoint and are fetched concurrently.
+
+        Args:
+            symbols: Upper-cased stock symbols
+            category: income_statement, company_financials, or stock_price
+
+        Returns:
+            Dict mapping each symbol to its result model
+        """
+        async with self.fmp_tools:
+            if category == "stock_price":
+                return await self.fmp_tools.get_stock_prices(symbols)
+            if category == "company_financials":
+                return await self.fmp_tools.get_company_financials_batch(symbols)
+            results = await asyncio.gather(
+                *(self.fmp_tools.get_income_statement(symbol) for symbol in symbols)
+            )
+            return dict(zip(symbols, results))
+
+    def _span(self, **kwargs):
+        """
+        Open a LangWatch span, or a no-op stand-in when tracing is disabled
+
+        Args:
+            **kwargs: Arguments for langwatch.span (type, name, ...)
+        """
+        return langwatch.span(**kwargs) if self._tracing_enabled else _NOOP_SPAN
+
+    def _append_message(
+        self,
+        role: str,
+        content: str,
+        agent_name: Optional[str] = None,
+        structured_data: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Record a message in the session history, keeping only recent messages
+
+        Messages beyond settings.max_chat_history are dropped, so the persisted
+        session state stays bounded however long the conversation runs. When
+        settings.history_archive_dir is set they are appended to the session's
+        JSONL archive instead; nothing reads the archive back.
+
+        Messages are stored as plain dicts with the ConversationMessage
+        fields, built directly rather than through the model.
+
+        Args:
+            role: "user" or "agent"
+            content: Message text
+            agent_name: Agent that produced the message, for agent messages
+            structured_data: Agent response data to keep with the message
         """
+        dumped = {
+            "role": role,
+            "content": content,
+            "agent_name": agent_name,
+            "timestamp": datetime.now().isoformat(),
+            "structured_data": structured_data,
+        }
+        line = self._format_summary_line(dumped)
+        with self._summary_lock:
+            messages = self.session_state.setdefault("messages", [])
+            messages.append(dumped)
+            self._pending_summary_lines.append(line)
+
+            overflow = len(messages) - self.settings.max_chat_history
+            if overflow <= 0:
+                return
+            evicted = messages[:overflow]
+            del messages[:overflow]
+            # The summary bookmark is an index into the trimmed list
+            last_count = self.session_state.get("last_summary_message_count", 0)
+            self.session_state["last_summary_message_count"] = max(
+                last_count - overflow, 0
+            )
+        self._archive_messages(evicted)
+
+    def _archive_messages(self, messages: list[dict]) -> None:
+        """Append messages evicted from the session history to its JSONL archive"""
+        archive_dir = self.settings.history_archive_dir
+        if not archive_dir:
+            return
+        path = Path(archive_dir) / f"{self.session_id or 'default'}.jsonl"
         try:
-            # Initialize variables to prevent unbound variable errors
-            income_data = None
-            financials_data = None
-            price_data = None
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as archive:
+                archive.writelines(
+                    json.dumps(message, default=str) + "\n" for message in messages
+                )
+        except OSError as e:
+            print(f"Warning: Could not archive conversation history: {e}")
+
+    def _fetch_report_data(self, symbol: str):
+        """
+        Fetch the report's financial data from the sync workflow
+
+        The three FMP calls run concurrently on one event loop (see
+        _fetch_parallel_financial_data), so the wait is one round trip.
 
+        Args:
+            symbol: Stock symbol to fetch data for
+
+        Returns:
+            Tuple of (income_data, financials_data, price_data)
+        """
+        try:
             # Add manual span context management around async calls
-            with langwatch.span(type="tool", name="parallel_data_fetch") as span:
+            with self._span(type="tool", name="parallel_data_fetch") as span:
                 span.update(inputs={"symbol": symbol})
                 income_data, financials_data, price_data = asyncio.run(
                     self._fetch_parallel_financial_data(symbol)
                 )
+                # Result models have no len(); report which fetches succeeded
                 span.update(
                     outputs={
-                        "income_records": len(income_data) if income_data else 0,
-                        "financial_records": len(financials_data)
-                        if financials_data
-                        else 0,
-                        "price_available": price_data is not None,
+                        "income_available": income_data.success,
+                        "financials_available": financials_data.success,
+                        "price_available": price_data.success,
                     }
                 )
-            # Fetch data sequentially to avoid any async/parallel complexity
-            # income_data = asyncio.run(self.fmp_tools.get_income_statement(symbol))
-            # financials_data = asyncio.run(self.fmp_tools.get_company_financials(symbol))
-            # price_data = asyncio.run(self.fmp_tools.get_stock_price(symbol))
 
             return [income_data, financials_data, price_data]
 
@@ -335,6 +927,36 @@ class FinancialAssistantWorkflow(Workflow):
         summary = self.session_state.get("conversation_summary")
         companies = self.session_state.get("companies_discussed", [])
 
+        # Built several times per turn; reuse it until the inputs change
+        companies_key = tuple(companies)
+        cached = self._context_cache
+        if cached is not None and cached[0] is summary and cached[1] == companies_key:
+            return cached[2]
+
+        context = self._build_conversation_context(summary, companies)
+        self._context_cache = (summary, companies_key, context)
+        return context
+
+    def _add_companies(self, *symbols: str) -> None:
+        """
+        Record symbols as the most recently discussed companies
+
+        Keeps companies_discussed free of duplicates, most recent last, and
+        capped at _MAX_COMPANIES_DISCUSSED so the agent context stays short.
+
+        Args:
+            *symbols: Uppercase ticker symbols, in the order they were mentioned
+        """
+        recent = dict.fromkeys(self.session_state.get("companies_discussed", []))
+        for symbol in symbols:
+            recent.pop(symbol, None)
+            recent[symbol] = None
+        self.session_state["companies_discussed"] = list(recent)[
+            -_MAX_COMPANIES_DISCUSSED:
+        ]
+
+    def _build_conversation_context(self, summary, companies: list[str]) -> str:
+        """Format the context string for a summary and the companies discussed"""
         if summary:
             # Use compressed summary instead of raw messages
             summary_text = (
@@ -348,91 +970,180 @@ class FinancialAssistantWorkflow(Workflow):
             # Early conversation - only company tracking needed
             return f"Companies discussed: {', '.join(companies)}" if companies else ""
 
+    @staticmethod
+    def _format_summary_line(msg: dict) -> str:
+        """Format one history message dict as a summary input line"""
+        role = msg.get("role", "unknown")
+        content = msg.get("content", "")
+        agent_name = msg.get("agent_name", "Unknown") if role == "agent" else ""
+        return f"- {role.title()}{f' ({agent_name})' if agent_name else ''}: {content}"
+
+    def _append_to_summary(
+        self, existing_summary, new_lines: list[str], message_count: int
+    ) -> WorkflowSummary:
+        """
+        Extend the summary with raw message lines, without calling the LLM
+
+        Args:
+            existing_summary: Current summary (WorkflowSummary, dict, or None)
+            new_lines: Summary input lines of the messages to add
+            message_count: Message count the updated summary covers
+
+        Returns:
+            The updated WorkflowSummary, also stored in session state
+        """
+        appendix = "\n".join(new_lines)
+        if isinstance(existing_summary, WorkflowSummary):
+            updated_summary = existing_summary.model_copy(
+                update={
+                    "summary": f"{existing_summary.summary}\n{appendix}",
+                    "last_updated": datetime.now().isoformat(),
+                    "message_count_at_generation": message_count,
+                }
+            )
+        else:
+            previous = (
+                existing_summary.get("summary", "")
+                if isinstance(existing_summary, dict)
+                else getattr(existing_summary, "summary", "")
+            )
+            updated_summary = WorkflowSummary(
+                summary=f"{previous}\n{appendix}" if previous else appendix,
+                message_count_at_generation=message_count,
+            )
+        self.session_state["conversation_summary"] = updated_summary
+        self.session_state["last_summary_message_count"] = message_count
+        self._pending_summary_lines = []
+        return updated_summary
+
+    def _schedule_summary_update(self) -> None:
+        """
+        Update the conversation summary on the background summary thread
+
+        The summary only feeds later turns' context, so the summary LLM call
+        runs alongside the rest of the turn; updates run one at a time, in
+        order. Skipped when settings.enable_session_summaries is off.
+        """
+        if not self.settings.enable_session_summaries:
+            return
+        self._summary_future = self._summary_executor.submit(
+            self._update_and_store_summary
+        )
+
+    def _update_and_store_summary(self) -> Optional[WorkflowSummary]:
+        """
+        Update the conversation summary, storing the session if the turn ended
+
+        A summary that lands while the turn is still running goes out with
+        Agno's end-of-run storage write. Nothing else would store a later one
+        until the next turn ends, so this thread writes the session itself.
+        """
+        summary = self._update_conversation_summary()
+        if self._turn_finished:
+            try:
+                self.write_to_storage()
+            except Exception as e:
+                print(f"Warning: Could not store conversation summary: {e}")
+        return summary
+
+    def write_to_storage(self) -> Optional[WorkflowSession]:
+        """Save the session to storage, never while the summary thread updates it"""
+        with self._summary_lock:
+            return super().write_to_storage()
+
     def _update_conversation_summary(self) -> Optional[WorkflowSummary]:
         """
         Generate or update conversation summary after EVERY round
 
+        Safe to run on the background summary thread: history and summary
+        state are read and written under _summary_lock, but the lock is not
+        held during the summary LLM call.
+
         Returns:
             Updated WorkflowSummary or None if no update needed
         """
-        message_count = len(self.session_state.get("messages", []))
-        last_count = self.session_state.get("last_summary_message_count", 0)
-
-        # Always update summary if there are new messages
-        if message_count > last_count and last_count > 0:
-            new_messages = self.session_state["messages"][last_count:]
+        with self._summary_lock:
+            message_count = len(self.session_state.get("messages", []))
+            last_count = self.session_state.get("last_summary_message_count", 0)
             existing_summary = self.session_state.get("conversation_summary")
 
-            # Prepare context for summary agent
-            summary_context_parts = []
+            # Nothing new since the last summary
+            if message_count <= last_count:
+                return existing_summary
+
+            # Lines are formatted as messages arrive; rebuild them only if they
+            # no longer line up with the history (e.g. restored from storage)
+            new_lines = list(self._pending_summary_lines)
+            rebuilt = len(new_lines) != message_count - last_count
+            if rebuilt:
+                new_lines = [
+                    self._format_summary_line(msg)
+                    for msg in self.session_state["messages"][last_count:]
+                ]
+
+            # Low-signal rounds (acks, tool echoes) are appended verbatim
+            # instead of costing a summary LLM call
+            if sum(map(len, new_lines)) < _TRIVIAL_SUMMARY_CHARS:
+                return self._append_to_summary(
+                    existing_summary, new_lines, message_count
+                )
 
-            if existing_summary:
-                if isinstance(existing_summary, dict):
-                    summary_context_parts.append(
-                        f"Previous summary: {existing_summary.get('summary', '')}"
-                    )
-                else:
-                    summary_context_parts.append(
-                        f"Previous summary: {existing_summary.summary}"
-                    )
-
-            summary_context_parts.append("\nNew messages to summarize:")
-            for msg in new_messages:
-                if isinstance(msg, dict):
-                    role = msg.get("role", "unknown")
-                    content = msg.get("content", "")
-                    agent_name = (
-                        msg.get("agent_name", "Unknown") if role == "agent" else ""
-                    )
-                    summary_context_parts.append(
-                        f"- {role.title()}{f' ({agent_name})' if agent_name else ''}: {content}"
-                    )
-                else:
-                    role = getattr(msg, "role", "unknown")
-                    content = getattr(msg, "content", "")
-                    agent_name = (
-                        getattr(msg, "agent_name", "Unknown") if role == "agent" else ""
-                    )
-                    summary_context_parts.append(
-                        f"- {role.title()}{f' ({agent_name})' if agent_name else ''}: {content}"
-                    )
-
-            summary_context_parts.append(
-                f"\nTotal messages in conversation: {message_count}"
-            )
+        # Prepare context for summary agent
+        summary_context_parts = []
 
-            summary_context = "\n".join(summary_context_parts)
+        if existing_summary:
+            if isinstance(existing_summary, dict):
+                summary_context_parts.append(
+                    f"Previous summary: {existing_summary.get('summary', '')}"
+                )
+            else:
+                summary_context_parts.append(
+                    f"Previous summary: {existing_summary.summary}"
+                )
 
-            try:
-                # Generate updated summary
-                summary_response = self.summary_agent.run(summary_context)
+        summary_context_parts.append("\nNew messages to summarize:")
+        summary_context_parts.extend(new_lines)
+        summary_context_parts.append(
+            f"\nTotal messages in conversation: {message_count}"
+        )
 
-                # Extract the actual WorkflowSummary from the response
-                if hasattr(summary_response, "content") and hasattr(
-                    summary_response.content, "summary"
-                ):
-                    # Response contains WorkflowSummary in content
-                    updated_summary = summary_response.content
-                    self.session_state["conversation_summary"] = updated_summary
-                    self.session_state["last_summary_message_count"] = message_count
-                    return updated_summary
-                elif hasattr(summary_response, "content"):
-                    # Simple string response, create WorkflowSummary wrapper
-                    updated_summary = WorkflowSummary(
-                        summary=str(summary_response.content),
-                        message_count_at_generation=message_count,
-                    )
-                    self.session_state["conversation_summary"] = updated_summary
-                    self.session_state["last_summary_message_count"] = message_count
-                    return updated_summary
-                else:
-                    return None
+        summary_context = "\n".join(summary_context_parts)
 
-            except Exception as e:
-                print(f"Warning: Could not generate conversation summary: {e}")
+        try:
+            # Generate updated summary
+            summary_response = self.summary_agent.run(summary_context)
+
+            # Extract the actual WorkflowSummary from the response
+            if hasattr(summary_response, "content") and hasattr(
+                summary_response.content, "summary"
+            ):
+                # Response contains WorkflowSummary in content
+                updated_summary = summary_response.content
+            elif hasattr(summary_response, "content"):
+                # Simple string response, create WorkflowSummary wrapper
+                updated_summary = WorkflowSummary(
+                    summary=str(summary_response.content),
+                    message_count_at_generation=message_count,
+                )
+            else:
                 return None
 
-        return self.session_state.get("conversation_summary")
+        except Exception as e:
+            print(f"Warning: Could not generate conversation summary: {e}")
+            return None
+
+        with self._summary_lock:
+            self.session_state["conversation_summary"] = updated_summary
+            # Messages may have been added (or the history trimmed) during the
+            # call, so advance the bookmark past just the lines summarized
+            self.session_state["last_summary_message_count"] = self.session_state.get(
+                "last_summary_message_count", 0
+            ) + len(new_lines)
+            if rebuilt:
+                self._pending_summary_lines = []
+            else:
+                del self._pending_summary_lines[: len(new_lines)]
+        return updated_summary
 
     def _compose_financial_report(
         self,
@@ -453,12 +1164,43 @@ class FinancialAssistantWorkflow(Workflow):
         Returns:
             Formatted markdown report
         """
-
-        # Auto-generate insights based on data
-        key_insights = self._generate_key_insights(
-            income_data, financials_data, price_data
+        return "".join(
+            self._iter_financial_report_sections(
+                symbol, income_data, financials_data, price_data
+            )
         )
 
+    def _iter_financial_report_sections(
+        self,
+        symbol: str,
+        income_data,  # IncomeStatementData
+        financials_data,  # CompanyFinancialsData
+        price_data,  # StockPriceData
+    ) -> Iterator[str]:
+        """
+        Compose the financial report section by section
+
+        The sections concatenate to the full report, so a streaming run can
+        show each one as soon as it is formatted.
+
+        Args:
+            symbol: Stock symbol
+            income_data: Income statement data from API
+            financials_data: Company financials data from API
+            price_data: Stock price data from API
+
+        Yields:
+            Markdown for the summary, each data section, and the analysis
+        """
+
+        # Read each model's fields once; the analysis helpers work on the dicts
+        income = income_data.model_dump() if income_data else {}
+        financials = financials_data.model_dump() if financials_data else {}
+        price = price_data.model_dump() if price_data else {}
+
+        # Insights, strengths, concerns and quality scores in one pass
+        analysis = self._analyze(income, financials, price)
+
         # Get company name from data
         company_name = (
             getattr(financials_data, "company_name", None)
@@ -466,84 +1208,81 @@ class FinancialAssistantWorkflow(Workflow):
             or symbol
         )
 
-        # Calculate quality scores
-        data_quality_score = self._calculate_data_quality(
-            income_data, financials_data, price_data
-        )
-        completeness_score = self._calculate_completeness(
-            income_data, financials_data, price_data
-        )
-
         # Compose the report
-        report = f"""# Financial Report - {symbol} ({company_name})
+        yield f"""# Financial Report - {symbol} ({company_name})
 
 ## Executive Summary
 Comprehensive financial analysis of {company_name} ({symbol}) based on latest available data including income statement, financial ratios, and current market performance.
 
-**Data Quality Score**: {data_quality_score:.1%}  
-**Data Completeness**: {completeness_score:.1%}
+**Data Quality Score**: {analysis.data_quality_score:.1%}  
+**Data Completeness**: {analysis.completeness_score:.1%}
 
 ## Key Insights
-{chr(10).join(f"• {insight}" for insight in key_insights)}
+{_bullet_list(analysis.insights)}
 
 ## Financial Data
 
-### Income Statement
+"""
+        yield f"""### Income Statement
 {self._format_income_statement(income_data, symbol)}
 
-### Company Financials & Ratios  
+"""
+        yield f"""### Company Financials & Ratios  
 {self._format_company_financials(financials_data, symbol)}
 
-### Stock Price & Market Data
+"""
+        yield f"""### Stock Price & Market Data
 {self._format_stock_price(price_data, symbol)}
 
-## Analysis Summary
+"""
+        yield f"""## Analysis Summary
 
 **Strengths:**
-{chr(10).join(f"• {strength}" for strength in self._identify_strengths(income_data, financials_data, price_data))}
+{_bullet_list(analysis.strengths)}
 
 **Areas of Attention:**
-{chr(10).join(f"• {concern}" for concern in self._identify_concerns(income_data, financials_data, price_data))}
+{_bullet_list(analysis.concerns)}
 
 ---
 *Report generated at {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} UTC*
 """
 
-        return report
+    def _analyze(self, income: dict, financials: dict, price: dict) -> AnalysisResult:
+        """
+        Derive the report's insights, strengths, concerns and scores in one pass
 
-    def _generate_key_insights(
-        self, income_data, financials_data, price_data
-    ) -> list[str]:
-        """Generate key insights from financial data"""
-        insights = []
+        Args:
+            income: Income statement fields (model_dump, or {} if missing)
+            financials: Company financials fields
+            price: Stock price fields
 
-        # Revenue analysis
-        revenue = getattr(income_data, "revenue", 0)
+        Returns:
+            AnalysisResult for the three data sources
+        """
+        insights: list[str] = []
+        strengths: list[str] = []
+        concerns: list[str] = []
+
+        revenue = income.get("revenue", 0)
+        net_income = income.get("net_income", 0)
+        net_margin = income.get("net_income_ratio", 0)
+        pe_ratio = financials.get("pe_ratio", 0) or price.get("pe_ratio", 0)
+        market_cap = financials.get("market_cap", 0) or price.get("market_cap", 0)
+        roe = financials.get("roe", 0)
+        debt_to_equity = financials.get("debt_to_equity", 0)
+        revenue_growth = financials.get("revenue_growth", 0)
+        change_percent = price.get("change_percent", 0)
+
+        # Key insights: revenue, margin, valuation, performance, size
         if revenue > 0:
             insights.append(f"Revenue: ${revenue:,.0f}")
-
-        # Profitability analysis
-        net_income_ratio = getattr(income_data, "net_income_ratio", 0)
-        if net_income_ratio > 0:
-            insights.append(f"Net margin: {net_income_ratio:.1%}")
-
-        # Valuation analysis
-        pe_ratio = getattr(financials_data, "pe_ratio", 0) or getattr(
-            price_data, "pe_ratio", 0
-        )
+        if net_margin > 0:
+            insights.append(f"Net margin: {net_margin:.1%}")
         if pe_ratio and pe_ratio > 0:
             insights.append(f"P/E ratio: {pe_ratio:.2f}")
-
-        # Performance analysis
-        change_percent = getattr(price_data, "change_percent", 0)
         if change_percent != 0:
             direction = "up" if change_percent > 0 else "down"
             insights.append(f"Stock {direction} {abs(change_percent):.2f}% today")
-
-        # Market cap
-        market_cap = getattr(financials_data, "market_cap", 0) or getattr(
-            price_data, "market_cap", 0
-        )
         if market_cap > 0:
             if market_cap > 200_000_000_000:
                 insights.append("Large-cap company (>$200B)")
@@ -552,132 +1291,56 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
             else:
                 insights.append("Small-cap company (<$10B)")
 
-        return insights if insights else ["Financial data analysis in progress"]
-
-    def _identify_strengths(
-        self, income_data, financials_data, price_data
-    ) -> list[str]:
-        """Identify company strengths from financial data"""
-        strengths = []
-
-        # High profitability
-        net_margin = getattr(income_data, "net_income_ratio", 0)
+        # Strengths: profitability, returns, leverage, growth
         if net_margin > 0.15:
             strengths.append(f"Strong profitability with {net_margin:.1%} net margin")
-
-        # Good ROE
-        roe = getattr(financials_data, "roe", 0)
         if roe > 0.15:
             strengths.append(f"Excellent return on equity at {roe:.1%}")
-
-        # Low debt
-        debt_to_equity = getattr(financials_data, "debt_to_equity", 0)
         if 0 < debt_to_equity < 0.3:
             strengths.append("Conservative debt levels")
-
-        # Strong growth (if available)
-        revenue_growth = getattr(financials_data, "revenue_growth", 0)
         if revenue_growth > 0.1:
             strengths.append(f"Strong revenue growth at {revenue_growth:.1%}")
 
-        return (
-            strengths if strengths else ["Detailed analysis requires additional data"]
-        )
-
-    def _identify_concerns(self, income_data, financials_data, price_data) -> list[str]:
-        """Identify potential areas of concern"""
-        concerns = []
-
-        # Low profitability
-        net_margin = getattr(income_data, "net_income_ratio", 0)
+        # Concerns: profitability, leverage, returns, valuation
         if net_margin < 0:
-            concerns.append("Company is currently unprofitable")
-        elif net_margin < 0.05:
-            concerns.append("Low profit margins")
-
-        # High debt
-        debt_to_equity = getattr(financials_data, "debt_to_equity", 0)
-        if debt_to_equity > 1.0:
-            concerns.append("High debt levels relative to equity")
-
-        # Poor ROE
-        roe = getattr(financials_data, "roe", 0)
-        if 0 < roe < 0.05:
-            concerns.append("Low return on equity")
-
-        # High valuation
-        pe_ratio = getattr(financials_data, "pe_ratio", 0) or getattr(
-            price_data, "pe_ratio", 0
-        )
-        if pe_ratio and pe_ratio > 30:
-            concerns.append(
-                f"High P/E ratio at {pe_ratio:.1f} may indicate overvaluation"
-            )
-
-        return concerns if concerns else ["No significant concerns identified"]
-
-    def _calculate_data_quality(
-        self, income_data, financials_data, price_data
-    ) -> float:
-        """Calculate data quality score based on available information"""
-        total_fields = 0
-        filled_fields = 0
-
-        # Check income statement data
-        income_fields = ["revenue", "net_income", "eps", "net_income_ratio"]
-        for field in income_fields:
-            total_fields += 1
-            if (
-                getattr(income_data, field, None) is not None
-                and getattr(income_data, field, 0) != 0
-            ):
-                filled_fields += 1
-
-        # Check financials data
-        financial_fields = ["pe_ratio", "market_cap", "roe", "debt_to_equity"]
-        for field in financial_fields:
-            total_fields += 1
-            if (
-                getattr(financials_data, field, None) is not None
-                and getattr(financials_data, field, 0) != 0
-            ):
-                filled_fields += 1
-
-        # Check price data
-        price_fields = ["price", "change", "volume"]
-        for field in price_fields:
-            total_fields += 1
-            if (
-                getattr(price_data, field, None) is not None
-                and getattr(price_data, field, 0) != 0
-            ):
-                filled_fields += 1
-
-        return filled_fields / total_fields if total_fields > 0 else 0.0
-
-    def _calculate_completeness(
-        self, income_data, financials_data, price_data
-    ) -> float:
-        """Calculate completeness score based on data sections available"""
-        sections_available = 0
-        total_sections = 3
-
-        if income_data and any(
-            getattr(income_data, field, 0) for field in ["revenue", "net_income"]
-        ):
-            sections_available += 1
+            concerns.append("Company is currently unprofitable")
+        elif net_margin < 0.05:
+            concerns.append("Low profit margins")
+        if debt_to_equity > 1.0:
+            concerns.append("High debt levels relative to equity")
+        if 0 < roe < 0.05:
+            concerns.append("Low return on equity")
+        if pe_ratio and pe_ratio > 30:
+            concerns.append(
+                f"High P/E ratio at {pe_ratio:.1f} may indicate overvaluation"
+            )
 
-        if financials_data and any(
-            getattr(financials_data, field, 0) for field in ["pe_ratio", "market_cap"]
-        ):
-            sections_available += 1
+        # Data quality: share of the tracked fields that are filled in
+        filled_fields = sum(
+            1
+            for data, fields in (
+                (income, _QUALITY_INCOME_FIELDS),
+                (financials, _QUALITY_FINANCIAL_FIELDS),
+                (price, _QUALITY_PRICE_FIELDS),
+            )
+            for field in fields
+            if data.get(field)
+        )
 
-        if price_data and any(
-            getattr(price_data, field, 0) for field in ["price", "change"]
-        ):
-            sections_available += 1
+        # Completeness: sections with at least one headline figure
+        sections_available = (
+            bool(revenue or net_income)
+            + bool(financials.get("pe_ratio", 0) or financials.get("market_cap", 0))
+            + bool(price.get("price", 0) or price.get("change", 0))
+        )
 
-        return sections_available / total_sections
+        return AnalysisResult(
+            insights=insights or ["Financial data analysis in progress"],
+            strengths=strengths or ["Detailed analysis requires additional data"],
+            concerns=concerns or ["No significant concerns identified"],
+            data_quality_score=filled_fields / _QUALITY_FIELD_COUNT,
+            completeness_score=sections_available / 3,
+        )
 
     def _format_financial_data(self, data, data_type: str, symbol: str) -> str:
         """Format financial data into readable markdown
@@ -742,7 +1405,15 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
 """
 
     def _format_stock_price(self, data, symbol: str) -> str:
-        """Format stock price data"""
+        """Format stock price data, with the trend section when it was computed"""
+        trend = ""
+        if getattr(data, "trend_direction", None) is not None:
+            trend = f"""## 5-Day Trend
+- Direction: {data.trend_direction} (strength {data.trend_strength})
+- 5-Day Change: {data.five_day_change_percent}%
+- Volatility: {data.volatility}% ({data.volume_trend} volume)
+
+"""
         return f"""# Stock Price - {symbol}
 
 ## Current Price
@@ -757,7 +1428,7 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
 - High: ${getattr(data, "fifty_two_week_high", "N/A")}
 - Low: ${getattr(data, "fifty_two_week_low", "N/A")}
 
-*Last updated: {getattr(data, "timestamp", "N/A")}*
+{trend}*Last updated: {getattr(data, "timestamp", "N/A")}*
 """
 
     def _extract_content_from_chunk(self, chunk) -> Optional[str]:
@@ -805,25 +1476,83 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
             return
 
         # Track user input
-        user_message = ConversationMessage(role="user", content=message)
-
-        # Ensure messages list exists
-        if "messages" not in self.session_state:
-            self.session_state["messages"] = []
+        self._turn_finished = False
+        self._append_message(role="user", content=message)
 
-        self.session_state["messages"].append(user_message.model_dump())
-
-        # Update conversation summary if needed
-        self._update_conversation_summary()
+        # Update conversation summary in the background; this turn's context
+        # uses the summary as of the previous update
+        self._schedule_summary_update()
 
         # Get conversation context for agents
         conversation_context = self._get_conversation_context()
 
+        # Step 1: Route the request, skipping the router LLM for requests that name
+        # both the data wanted and an explicit ticker
+        router_result = _prefilter_route(message)
+        if router_result is not None:
+            category = router_content = router_result.category
+        else:
+            category, router_content, router_result = self._run_router_agent(
+                message, conversation_context
+            )
+
+        # Router processing complete - automatically traced by AgnoInstrumentor
+
+        # Symbols the router extracted alongside the category, if any
+        symbol = getattr(router_result, "symbol", None)
+        symbols = getattr(router_result, "symbols", None) or []
+        if symbol:
+            symbol = symbol.strip().upper()
+        if not symbol or symbol == "UNKNOWN":
+            symbol = None
+
+        # Track router agent response
+        self._append_message(
+            role="agent",
+            content=router_content,
+            agent_name="Router Agent",
+            structured_data={"category": category, "symbol": symbol},
+        )
+
+        # Ensure category is lowercase for comparison
+        category = category.strip().lower()
+        self.session_state["category"] = category
+
+        # Step 2: Conditional flow based on category (agents automatically traced by AgnoInstrumentor)
+        if category == "report":
+            for response in self._run_report_flow(message, symbol):
+                yield response
+        elif category == "chat":
+            for response in self._run_chat_flow(message):
+                yield response
+        else:  # income_statement, company_financials, stock_price
+            for response in self._run_alone_flow(message, category, symbol, symbols):
+                yield response
+
+        # Agno writes session_state to storage as soon as this generator ends;
+        # a summary still running then stores the session again when it lands
+        self._turn_finished = True
+
+    def _run_router_agent(
+        self, message: str, conversation_context: str
+    ) -> tuple[str, str, Optional[RouterResult]]:
+        """
+        Categorize a request with the router agent
+
+        Args:
+            message: User's request message
+            conversation_context: Context block from _get_conversation_context
+
+        Returns:
+            Tuple of (category, router_content, router_result); router_result is
+            None when the agent did not return structured output
+        """
         # Initialize variables to prevent unbound variable errors
         category = "chat"
         router_content = "chat"
+        router_result = None
 
-        # Step 1: Route the request with conversation context (automatically traced by AgnoInstrumentor)
+        # Route the request with conversation context (automatically traced by AgnoInstrumentor)
         category_response = self.router_agent.run(
             f"User request: {message}\n{conversation_context}",
             stream=self.stream,
@@ -848,6 +1577,7 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 ):
                     category = category_content.category.strip().lower()
                     router_content = category
+                    router_result = category_content
                 else:
                     router_content = str(category_content)
                     category = "chat"
@@ -861,54 +1591,68 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                     # RouterResult object with category attribute
                     category = single_response.content.category.strip().lower()
                     router_content = category
+                    router_result = single_response.content
                 else:
                     # Fallback - shouldn't happen with structured output
                     router_content = str(single_response.content)
                     category = "chat"
 
-        # Router processing complete - automatically traced by AgnoInstrumentor
+        return category, router_content, router_result
 
-        # Track router agent response
-        router_message = ConversationMessage(
-            role="agent",
-            content=router_content,
-            agent_name="Router Agent",
-            structured_data={"category": category},
-        )
-        self.session_state["messages"].append(router_message.model_dump())
+    # REMOVED: async def arun() method - Agno framework conflicts with dual sync/async methods
+    # TODO: Re-implement async support using proper Agno patterns in future iteration
 
-        # Ensure category is lowercase for comparison
-        category = category.strip().lower()
-        self.session_state["category"] = category
+    def _remember_symbols(self, symbols: list[str]) -> None:
+        """Record the symbols a turn answered for, for pronoun follow-ups"""
+        self.session_state["last_symbol"] = symbols[-1]
+        self.session_state["last_symbols"] = symbols
 
-        # Step 2: Conditional flow based on category (agents automatically traced by AgnoInstrumentor)
-        if category == "report":
-            for response in self._run_report_flow(message):
-                yield response
-        elif category == "chat":
-            for response in self._run_chat_flow(message):
-                yield response
-        else:  # income_statement, company_financials, stock_price
-            for response in self._run_alone_flow(message, category):
-                yield response
+    def _known_symbols(self, message: str) -> Optional[tuple[str, list[str]]]:
+        """
+        Get the symbols of a request that needs no extraction agent call
 
-    # REMOVED: async def arun() method - Agno framework conflicts with dual sync/async methods
-    # TODO: Re-implement async support using proper Agno patterns in future iteration
+        Args:
+            message: User's original request message
 
-    def _run_report_flow(self, message: str) -> Iterator[RunResponse]:
+        Returns:
+            Tuple of (symbol, symbols), or None if the agent has to run
         """
-        Comprehensive Report Flow - Parallel data collection + aggregation
+        # Follow-ups like "show me its income statement" stay on the last symbol
+        last_symbol = self.session_state.get("last_symbol")
+        if last_symbol and _refers_to_previous_company(message):
+            last_symbols = self.session_state.get("last_symbols") or [last_symbol]
+            if len(last_symbols) == 1:
+                return last_symbol, []
+            # After several companies "their P/E ratios" means all of them,
+            # while "its P/E" is ambiguous and left to the extraction agent
+            if _PLURAL_COREFERENCE_PATTERN.search(message):
+                return last_symbols[0], list(last_symbols)
+
+        # A repeated request (retry, refresh) about the same last symbol resolves
+        # to the same symbols, so skip the agent for it
+        cached = self._extracted_symbols.get((message, last_symbol))
+        if cached is not None:
+            return cached[0], list(cached[1])
+        return None
 
-        This flow is triggered for comprehensive business analysis requests.
-        It collects income statement, company financials, and stock price data
-        in parallel, then generates a comprehensive report.
+    def _extract_symbols(
+        self, message: str
+    ) -> Generator[RunResponse, None, tuple[str, list[str]]]:
+        """
+        Run the symbol extraction agent for a request the router left unresolved
+
+        Yields intermediate RunResponses when streaming intermediate steps.
 
         Args:
             message: User's original request message
 
-        Yields:
-            RunResponse: Final comprehensive report
+        Returns:
+            Tuple of (symbol, symbols); symbol is "UNKNOWN" if none was found
         """
+        known = self._known_symbols(message)
+        if known is not None:
+            return known
+        cache_key = (message, self.session_state.get("last_symbol"))
 
         # Extract symbol with conversation context (automatically traced by AgnoInstrumentor)
         conversation_context = self._get_conversation_context()
@@ -918,6 +1662,9 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
             stream_intermediate_steps=self.stream_intermediate_steps,
         )
 
+        # Several symbols only come back from a structured (non-streaming) result
+        symbols: list[str] = []
+
         # Handle streaming vs non-streaming response for symbol extraction (type-safe)
         if self.stream:
             # Stream mode: symbol_response is Iterator[RunResponseEvent]
@@ -947,6 +1694,7 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 if hasattr(single_response.content, "symbol"):
                     # Extraction object with symbol attribute
                     symbol = single_response.content.symbol
+                    symbols = getattr(single_response.content, "symbols", None) or []
                 else:
                     # String content
                     symbol = str(single_response.content).strip()
@@ -954,8 +1702,41 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 # Fallback
                 symbol = "UNKNOWN"
 
+        if symbol != "UNKNOWN":
+            if len(self._extracted_symbols) >= _EXTRACTED_SYMBOLS_CACHE_SIZE:
+                del self._extracted_symbols[next(iter(self._extracted_symbols))]
+            self._extracted_symbols[cache_key] = (symbol, tuple(symbols))
+        return symbol, symbols
+
+    def _resolve_symbols(
+        self,
+        message: str,
+        symbol: Optional[str],
+        symbols: Optional[list[str]] = None,
+    ) -> Generator[RunResponse, None, tuple[Optional[str], list[str]]]:
+        """
+        Settle a data request's symbols and record the outcome in the history
+
+        Uses the router's symbol when it found one, otherwise runs the symbol
+        extraction agent; when no symbol can be found the error response is
+        recorded and yielded here.
+
+        Args:
+            message: User's original request message
+            symbol: Symbol already extracted by the router, if any
+            symbols: All symbols the router extracted, if any
+
+        Returns:
+            Tuple of (symbol, symbols); symbol is None if none was found
+        """
+        # The router usually resolves the symbol; otherwise ask the extraction agent
+        if symbol:
+            symbols = symbols or []
+        else:
+            symbol, symbols = yield from self._extract_symbols(message)
+
         # Track symbol extraction response
-        symbol_message = ConversationMessage(
+        self._append_message(
             role="agent",
             content=f"Extracted symbol: {symbol}",
             agent_name="Symbol Extraction Agent",
@@ -964,32 +1745,65 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 "extraction_successful": symbol != "UNKNOWN",
             },
         )
-        self.session_state["messages"].append(symbol_message.model_dump())
 
         if symbol == "UNKNOWN":
-            error_message = "Could not extract a valid stock symbol from your request. Please specify a company name or ticker symbol."
-
             # Track error response
-            error_response_message = ConversationMessage(
+            self._append_message(
                 role="agent",
-                content=error_message,
+                content=_SYMBOL_NOT_FOUND_MESSAGE,
                 agent_name="Workflow System",
                 structured_data={"error_type": "symbol_extraction_failed"},
             )
-            self.session_state["messages"].append(error_response_message.model_dump())
 
             yield RunResponse(
                 run_id=self.run_id,
-                content=error_message,
+                content=_SYMBOL_NOT_FOUND_MESSAGE,
+            )
+            return None, []
+
+        return symbol, symbols
+
+    def _run_report_flow(
+        self, message: str, symbol: Optional[str] = None
+    ) -> Iterator[RunResponse]:
+        """
+        Comprehensive Report Flow - Parallel data collection + aggregation
+
+        This flow is triggered for comprehensive business analysis requests.
+        It collects income statement, company financials, and stock price data
+        in parallel, then generates a comprehensive report.
+
+        Args:
+            message: User's original request message
+            symbol: Symbol already extracted by the router, if any
+
+        Yields:
+            RunResponse: Final comprehensive report
+        """
+
+        # Without a router symbol the extraction agent runs; meanwhile fetch for
+        # a ticker spelled out in the request
+        prefetch = None
+        if not symbol:
+            prefetch = self._start_prefetch(
+                message, self._fetch_parallel_financial_data
             )
+        symbol, _ = yield from self._resolve_symbols(message, symbol)
+        if symbol is None:
+            if prefetch is not None:
+                prefetch.abandon()
             return
 
         self.session_state["symbol"] = symbol
+        self._add_companies(symbol)
 
-        # Fetch financial data sequentially for sync workflow
+        # Fetch the three report sources concurrently unless already prefetched
         try:
+            prefetched = self._take_prefetch(prefetch, symbol)
             income_data, financials_data, price_data = (
-                self._fetch_financial_data_sequential(symbol)
+                prefetched
+                if prefetched is not None
+                else self._fetch_report_data(symbol)
             )
         except Exception as e:
             yield RunResponse(
@@ -998,16 +1812,18 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
             )
             return
 
-        # Generate comprehensive report using manual composition
-        comprehensive_report = self._compose_financial_report(
-            symbol=symbol,
-            income_data=income_data,
-            financials_data=financials_data,
-            price_data=price_data,
-        )
+        # Generate comprehensive report using manual composition; a streaming
+        # run shows it section by section (each chunk is the report so far)
+        comprehensive_report = ""
+        for section in self._iter_financial_report_sections(
+            symbol, income_data, financials_data, price_data
+        ):
+            comprehensive_report += section
+            if self.stream:
+                yield RunResponse(run_id=self.run_id, content=comprehensive_report)
 
         # Track report generation response
-        report_message = ConversationMessage(
+        self._append_message(
             role="agent",
             content=comprehensive_report,
             agent_name="Financial Report Composer",
@@ -1022,15 +1838,15 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 "composition_method": "manual",
             },
         )
-        self.session_state["messages"].append(report_message.model_dump())
 
-        # Cache and yield final result
-        self.session_state["last_symbol"] = symbol
+        # Cache and yield final result (already streamed in full when streaming)
+        self._remember_symbols([symbol])
         self.session_state["workflow_path"] = "report"
-        yield RunResponse(
-            run_id=self.run_id,
-            content=comprehensive_report,
-        )
+        if not self.stream:
+            yield RunResponse(
+                run_id=self.run_id,
+                content=comprehensive_report,
+            )
 
     # REMOVED: async def _arun_report_flow() - Agno framework conflicts with dual sync/async methods
     # REMOVED: async def _arun_alone_flow() - Agno framework conflicts with dual sync/async methods
@@ -1038,7 +1854,13 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
 
     # Removed duplicate decorator - already has langwatch_span
     # @langwatch.span(type="chain", name="alone_flow")  # Applied conditionally in __init__
-    def _run_alone_flow(self, message: str, category: str) -> Iterator[RunResponse]:
+    def _run_alone_flow(
+        self,
+        message: str,
+        category: str,
+        symbol: Optional[str] = None,
+        symbols: Optional[list[str]] = None,
+    ) -> Iterator[RunResponse]:
         """
         Single Information Flow - Direct path to specific data
 
@@ -1048,101 +1870,50 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
         Args:
             message: User's original request message
             category: The specific data category (income_statement, company_financials, stock_price)
+            symbol: Symbol already extracted by the router, if any
+            symbols: All symbols the router extracted for multi-company requests
 
         Yields:
             RunResponse: Specific financial data response
         """
 
-        # Extract symbol with conversation context (automatically traced by AgnoInstrumentor)
-        conversation_context = self._get_conversation_context()
-        symbol_response = self.symbol_extraction_agent.run(
-            f"Extract symbol from: {message}\n{conversation_context}",
-            stream=self.stream,
-            stream_intermediate_steps=self.stream_intermediate_steps,
-        )
-
-        # Handle streaming vs non-streaming response for symbol extraction (type-safe)
-        if self.stream:
-            # Stream mode: symbol_response is Iterator[RunResponseEvent]
-            stream_response = cast(Iterator[RunResponseEvent], symbol_response)
-            final_content = ""
-            for chunk in stream_response:  # chunk is RunResponseEvent
-                content = self._extract_content_from_chunk(chunk)
-                if content:
-                    final_content = content  # Keep last meaningful content
-                    # Yield intermediate steps if enabled
-                    if self.stream_intermediate_steps:
-                        yield RunResponse(run_id=self.run_id, content=content)
-
-            # Extract symbol from final content (string)
-            if final_content:
-                symbol = str(final_content).strip()
-            else:
-                symbol = "UNKNOWN"
-        else:
-            # Non-streaming response handling (existing logic)
-            single_response = cast(RunResponse, symbol_response)
-            if (
-                single_response
-                and hasattr(single_response, "content")
-                and single_response.content
-            ):
-                if hasattr(single_response.content, "symbol"):
-                    # Extraction object with symbol attribute
-                    symbol = single_response.content.symbol
-                else:
-                    # String content
-                    symbol = str(single_response.content).strip()
-            else:
-                # Fallback
-                symbol = "UNKNOWN"
-
-        # Track symbol extraction response
-        symbol_message = ConversationMessage(
-            role="agent",
-            content=f"Extracted symbol: {symbol}",
-            agent_name="Symbol Extraction Agent",
-            structured_data={
-                "symbol": symbol,
-                "extraction_successful": symbol != "UNKNOWN",
-            },
-        )
-        self.session_state["messages"].append(symbol_message.model_dump())
+        # Without a router symbol the extraction agent runs; meanwhile fetch for
+        # a ticker spelled out in the request
+        prefetch = None
+        if not symbol and category in _DATA_CATEGORIES:
+            prefetch = self._start_prefetch(
+                message, functools.partial(self._fetch_category_data, category)
+            )
+        symbol, symbols = yield from self._resolve_symbols(message, symbol, symbols)
+        if symbol is None:
+            if prefetch is not None:
+                prefetch.abandon()
+            return
 
-        if symbol == "UNKNOWN":
-            error_message = "Could not extract a valid stock symbol from your request. Please specify a company name or ticker symbol."
+        self.session_state["symbol"] = symbol
 
-            # Track error response
-            error_response_message = ConversationMessage(
-                role="agent",
-                content=error_message,
-                agent_name="Workflow System",
-                structured_data={"error_type": "symbol_extraction_failed"},
-            )
-            self.session_state["messages"].append(error_response_message.model_dump())
+        # Multi-company questions fetch every symbol in one go
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        self._add_companies(*(symbols or [symbol]))
+        if len(symbols) > 1 and category in _DATA_CATEGORIES:
+            if prefetch is not None:
+                prefetch.abandon()
+            for response in self._run_multi_symbol_flow(symbols, category):
+                yield response
+            return
 
+        if category not in _DATA_CATEGORIES:
             yield RunResponse(
                 run_id=self.run_id,
-                content=error_message,
+                content=f"Invalid category '{category}' for data request. Expected: income_statement, company_financials, or stock_price. Please try rephrasing your request.",
             )
             return
 
-        self.session_state["symbol"] = symbol
-
         # Direct sync tool call based on category using asyncio.run()
         try:
-            if category == "income_statement":
-                raw_data = asyncio.run(self.fmp_tools.get_income_statement(symbol))
-            elif category == "company_financials":
-                raw_data = asyncio.run(self.fmp_tools.get_company_financials(symbol))
-            elif category == "stock_price":
-                raw_data = asyncio.run(self.fmp_tools.get_stock_price(symbol))
-            else:
-                yield RunResponse(
-                    run_id=self.run_id,
-                    content=f"Invalid category '{category}' for data request. Expected: income_statement, company_financials, or stock_price. Please try rephrasing your request.",
-                )
-                return
+            raw_data = self._take_prefetch(prefetch, symbol)
+            if raw_data is None:
+                raw_data = asyncio.run(self._fetch_category_data(category, symbol))
         except Exception as e:
             yield RunResponse(
                 run_id=self.run_id,
@@ -1154,7 +1925,7 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
         formatted_content = self._format_financial_data(raw_data, category, symbol)
 
         # Track financial data response
-        data_message = ConversationMessage(
+        self._append_message(
             role="agent",
             content=formatted_content,
             agent_name="Financial Data Agent",
@@ -1165,10 +1936,9 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 "raw_data": raw_data if isinstance(raw_data, dict) else None,
             },
         )
-        self.session_state["messages"].append(data_message.model_dump())
 
         # Cache and yield result
-        self.session_state["last_symbol"] = symbol
+        self._remember_symbols([symbol])
         self.session_state["workflow_path"] = "alone"
         self.session_state["data_category"] = category
         yield RunResponse(
@@ -1176,6 +1946,58 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
             content=formatted_content,
         )
 
+    def _run_multi_symbol_flow(
+        self, symbols: list[str], category: str
+    ) -> Iterator[RunResponse]:
+        """
+        Multi-Symbol Flow - One data category for several companies
+
+        This flow is taken from the alone path when the request names more
+        than one company, so the data is fetched with batched requests
+        instead of one request per symbol.
+
+        Args:
+            symbols: Upper-cased stock symbols, in the order they were named
+            category: The data category (income_statement, company_financials, stock_price)
+
+        Yields:
+            RunResponse: The formatted data for every symbol
+        """
+        try:
+            results = asyncio.run(self._fetch_multi_symbol_data(symbols, category))
+        except Exception as e:
+            yield RunResponse(
+                run_id=self.run_id,
+                content=f"Error retrieving {category.replace('_', ' ')} data for {', '.join(symbols)}: {str(e)}",
+            )
+            return
+
+        formatted_content = "\n\n".join(
+            self._format_financial_data(results.get(symbol), category, symbol)
+            for symbol in symbols
+        )
+
+        # Track financial data response
+        self._append_message(
+            role="agent",
+            content=formatted_content,
+            agent_name="Financial Data Agent",
+            structured_data={
+                "symbols": symbols,
+                "data_type": category,
+                "data_source": "Financial Modeling Prep",
+            },
+        )
+
+        # Cache and yield result
+        self._remember_symbols(symbols)
+        self.session_state["workflow_path"] = "multi_symbol"
+        self.session_state["data_category"] = category
+        yield RunResponse(
+            run_id=self.run_id,
+            content=formatted_content,
+        )
+
     # Removed duplicate decorator - already has langwatch_span
     # @langwatch.span(type="chain", name="chat_flow")  # Applied conditionally in __init__
     def _run_chat_flow(self, message: str) -> Iterator[RunResponse]:
@@ -1205,60 +2027,31 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
 
         # Handle streaming vs non-streaming response for chat agent (type-safe)
         if self.stream:
-            # Stream mode: response is Iterator[RunResponseEvent]
+            # Stream mode: the agent streams plain text deltas (see chat_agent);
+            # relay the text so far as each one arrives, since the UI renders
+            # every chunk as the complete response
             stream_response = cast(Iterator[RunResponseEvent], response)
-            final_chat_result = None
-            for chunk in stream_response:  # chunk is RunResponseEvent
-                if hasattr(chunk, "content") and chunk.content:
-                    final_chat_result = chunk.content
-                    # Extract actual content from ChatResponse for streaming
-                    if hasattr(chunk.content, "content") and not isinstance(
-                        chunk.content, str
-                    ):
-                        chunk_content = chunk.content.content
-                    else:
-                        chunk_content = str(chunk.content)
-
-                    # Yield streaming content
-                    yield RunResponse(run_id=self.run_id, content=chunk_content)
-
-            # Extract final content from ChatResponse object
-            if (
-                final_chat_result
-                and hasattr(final_chat_result, "content")
-                and not isinstance(final_chat_result, str)
-            ):
-                final_content = final_chat_result.content
+            final_content = ""
+            for chunk in stream_response:
+                if isinstance(chunk, RunResponseContentEvent) and chunk.content:
+                    final_content += str(chunk.content)
+                    yield RunResponse(run_id=self.run_id, content=final_content)
+
+            if not final_content:
+                final_content = "No response generated"
+        else:
+            # Non-streaming response handling: a ChatResponse, or plain text
+            content = getattr(response, "content", None)
+            if not content:
+                final_content = "No response generated"
             else:
                 final_content = (
-                    str(final_chat_result)
-                    if final_chat_result
-                    else "No response generated"
+                    content.content if hasattr(content, "content") else str(content)
                 )
-        else:
-            # Non-streaming response handling
-            single_response = cast(RunResponse, response)
-            if (
-                single_response
-                and hasattr(single_response, "content")
-                and single_response.content
-            ):
-                if hasattr(single_response.content, "content"):
-                    # ChatResponse object with content attribute
-                    final_content = single_response.content.content
-                    # Also yield the content for non-streaming mode
-                    yield RunResponse(run_id=self.run_id, content=final_content)
-                else:
-                    # String content
-                    final_content = str(single_response.content)
-                    yield RunResponse(run_id=self.run_id, content=final_content)
-            else:
-                # Fallback
-                final_content = "No response generated"
-                yield RunResponse(run_id=self.run_id, content=final_content)
+            yield RunResponse(run_id=self.run_id, content=final_content)
 
         # Track chat agent response in conversation
-        chat_message = ConversationMessage(
+        self._append_message(
             role="agent",
             content=final_content,
             agent_name="Chat Agent",
@@ -1267,9 +2060,7 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 "context_used": True,
                 "workflow_path": "chat",
             },
-            timestamp=datetime.now().isoformat(),
         )
-        self.session_state["messages"].append(chat_message.model_dump())
 
     def _clean_session_state_for_storage(self):
         """
@@ -1300,8 +2091,6 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                     cleaned_state[key] = self._clean_dict_for_storage(value)
                 else:
                     # For other types, try to serialize to ensure it's JSON compatible
-                    import json
-
                     json.dumps(value)  # This will raise if not serializable
                     cleaned_state[key] = value
             except (TypeError, ValueError):
@@ -1325,8 +2114,6 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 elif isinstance(value, dict):
                     cleaned_dict[key] = self._clean_dict_for_storage(value)
                 else:
-                    import json
-
                     json.dumps(value)
                     cleaned_dict[key] = value
             except (TypeError, ValueError):
@@ -1347,8 +2134,6 @@ Comprehensive financial analysis of {company_name} ({symbol}) based on latest av
                 elif isinstance(item, list):
                     cleaned_list.append(self._clean_list_for_storage(item))
                 else:
-                    import json
-
                     json.dumps(item)
                     cleaned_list.append(item)
             except (TypeError, ValueError):